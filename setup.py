@@ -32,6 +32,7 @@ setup(
             "black",
             "flake8",
             "isort",
+            "numpy",
             "pre-commit",
             "pylint",
             "pytest",
@@ -29,3 +29,8 @@ from braket.device_schema.gate_model_qpu_paradigm_properties_v1 import (  # noqa
 from braket.device_schema.jaqcd_device_action_properties import (  # noqa: F401
     JaqcdDeviceActionProperties,
 )
+from braket.device_schema.jaqcd_program_validator import (  # noqa: F401
+    JaqcdProgramValidator,
+    Violation,
+    ViolationType,
+)
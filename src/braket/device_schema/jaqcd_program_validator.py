@@ -0,0 +1,258 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from enum import Enum
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel
+
+from braket.device_schema.device_action_properties import DeviceActionType
+from braket.device_schema.device_capabilities import DeviceCapabilities
+from braket.device_schema.jaqcd_device_action_properties import ResultType
+from braket.ir.jaqcd.columnar import ColumnarInstructions, instruction_qubits
+from braket.ir.jaqcd.program_v1 import Program
+
+# The code of each gate type, which is its bit in the bitset of supported operations
+_GATE_CODES = {gate_type: code for code, gate_type in enumerate(ColumnarInstructions.GATE_TYPES)}
+
+
+class ViolationType(str, Enum):
+    """
+    The kinds of incompatibility between a program and a device.
+    """
+
+    UNSUPPORTED_OPERATION = "unsupported_operation"
+    QUBIT_OUT_OF_RANGE = "qubit_out_of_range"
+    QUBITS_NOT_CONNECTED = "qubits_not_connected"
+    UNSUPPORTED_RESULT_TYPE = "unsupported_result_type"
+    UNSUPPORTED_OBSERVABLE = "unsupported_observable"
+    SHOTS_OUT_OF_RANGE = "shots_out_of_range"
+
+
+class Violation(NamedTuple):
+    """
+    An incompatibility between a program and a device.
+
+    Attributes:
+        type (ViolationType): The kind of incompatibility
+        loc (Tuple[Union[str, int], ...]): The location in the program, in the form of the
+            locations of validation errors, for example `("instructions", 3)`
+        message (str): A description of the incompatibility
+    """
+
+    type: ViolationType
+    loc: Tuple[Union[str, int], ...]
+    message: str
+
+
+class _CompiledResultType(NamedTuple):
+    observables: Optional[FrozenSet[str]]
+    min_shots: Optional[int]
+    max_shots: Optional[int]
+
+
+def _qubit_index(label: str) -> Optional[int]:
+    # The qubit of a label of the connectivity graph, or None if it is not a qubit index
+    try:
+        return int(label)
+    except ValueError:
+        return None
+
+
+class JaqcdProgramValidator:
+    """
+    Checks jaqcd programs against the capabilities of a device.
+
+    The capabilities are compiled once, when the validator is created, into lookup tables:
+    a bitset of the supported operations, indexed by gate type, the set of connected qubit
+    pairs and the supported result types by name. Each program is then checked in a single
+    pass over its instructions, results and basis rotation instructions, for:
+        - gates whose type is not in `supportedOperations`
+        - qubits at or above the `qubitCount` of the paradigm
+        - gates on exactly two qubits which are not connected in the `connectivityGraph`
+          of the paradigm, unless the device is fully connected; an edge connects its
+          qubits in both directions, and edges with labels that are not qubit indices
+          connect no qubits
+        - result types, and observables of result types, not in `supportedResultTypes`,
+          and, if the shots are given, shots outside of their range
+
+    Checks for which the device has no properties are skipped; for example simulators
+    have no connectivity, and result types are not checked if `supportedResultTypes`
+    is not set.
+
+    Examples:
+        >>> validator = JaqcdProgramValidator(RigettiDeviceCapabilities.parse_raw_schema(...))
+        >>> validator.validate(Program(instructions=[H(target=0), CNot(control=0, target=5)]))
+        [Violation(type=<ViolationType.UNSUPPORTED_OPERATION: 'unsupported_operation'>,
+            loc=('instructions', 0), message='Operation h is not supported'), ...]
+    """
+
+    def __init__(self, capabilities: DeviceCapabilities):
+        """
+        Args:
+            capabilities (DeviceCapabilities): The capabilities of the device, which must
+                support the jaqcd program action
+
+        Raises:
+            ValueError: If the device does not support jaqcd programs
+        """
+        action = capabilities.action.get(DeviceActionType.JAQCD)
+        if action is None:
+            raise ValueError(f"Device does not support action {DeviceActionType.JAQCD.value}")
+        supported = {operation.lower() for operation in action.supportedOperations}
+        self._operations = 0
+        for gate_type, code in _GATE_CODES.items():
+            if gate_type.value in supported:
+                self._operations |= 1 << code
+
+        paradigm = getattr(capabilities, "paradigm", None)
+        self._qubit_count: Optional[int] = getattr(paradigm, "qubitCount", None)
+        connectivity = getattr(paradigm, "connectivity", None)
+        self._edges: Optional[Set[Tuple[int, int]]] = None
+        if connectivity is not None and not connectivity.fullyConnected:
+            self._edges = set()
+            for qubit, neighbors in connectivity.connectivityGraph.items():
+                for neighbor in neighbors:
+                    edge = (_qubit_index(qubit), _qubit_index(neighbor))
+                    if None not in edge:
+                        self._edges.add(edge)
+                        self._edges.add(edge[::-1])
+
+        self._result_types: Optional[Dict[str, _CompiledResultType]] = None
+        if action.supportedResultTypes is not None:
+            self._result_types = {
+                result_type.name.lower(): self._compile_result_type(result_type)
+                for result_type in action.supportedResultTypes
+            }
+
+    @staticmethod
+    def _compile_result_type(result_type: ResultType) -> _CompiledResultType:
+        observables = None
+        if result_type.observables is not None:
+            observables = frozenset(observable.lower() for observable in result_type.observables)
+        return _CompiledResultType(observables, result_type.minShots, result_type.maxShots)
+
+    def validate(self, program: Program, shots: Optional[int] = None) -> List[Violation]:
+        """
+        Args:
+            program (Program): The program
+            shots (Optional[int]): The number of shots the program will be run with, to
+                check against the shot ranges of its result types. Default is None,
+                for which the shots are not checked.
+
+        Returns:
+            List[Violation]: The incompatibilities of the program with the device, in the
+            order of their location in the program; empty if the program can be run on
+            the device
+        """
+        violations: List[Violation] = []
+        self._check_instructions(program.instructions, "instructions", violations)
+        if program.results:
+            for index, result in enumerate(program.results):
+                self._check_result(result, ("results", index), shots, violations)
+        if program.basis_rotation_instructions:
+            self._check_instructions(
+                program.basis_rotation_instructions, "basis_rotation_instructions", violations
+            )
+        return violations
+
+    def _check_instructions(
+        self, instructions: List[BaseModel], field: str, violations: List[Violation]
+    ) -> None:
+        operations, edges = self._operations, self._edges
+        for index, instruction in enumerate(instructions):
+            gate_type = getattr(instruction, "type", None)
+            code = _GATE_CODES.get(gate_type)
+            if code is None or not (operations >> code) & 1:
+                name = getattr(gate_type, "value", gate_type)
+                violations.append(
+                    Violation(
+                        ViolationType.UNSUPPORTED_OPERATION,
+                        (field, index),
+                        f"Operation {name} is not supported",
+                    )
+                )
+                if code is None:
+                    continue
+            qubits = instruction_qubits(instruction)
+            self._check_qubits(qubits, (field, index), violations)
+            if edges is not None and len(qubits) == 2 and (qubits[0], qubits[1]) not in edges:
+                violations.append(
+                    Violation(
+                        ViolationType.QUBITS_NOT_CONNECTED,
+                        (field, index),
+                        f"Qubits {qubits[0]} and {qubits[1]} are not connected",
+                    )
+                )
+
+    def _check_qubits(
+        self, qubits: List[int], loc: Tuple[Union[str, int], ...], violations: List[Violation]
+    ) -> None:
+        qubit_count = self._qubit_count
+        if qubit_count is None:
+            return
+        for qubit in qubits:
+            if qubit >= qubit_count:
+                violations.append(
+                    Violation(
+                        ViolationType.QUBIT_OUT_OF_RANGE,
+                        loc,
+                        f"Qubit {qubit} is out of range for {qubit_count} qubits",
+                    )
+                )
+
+    def _check_result(
+        self,
+        result: BaseModel,
+        loc: Tuple[Union[str, int], ...],
+        shots: Optional[int],
+        violations: List[Violation],
+    ) -> None:
+        self._check_qubits(getattr(result, "targets", None) or [], loc, violations)
+        if self._result_types is None:
+            return
+        name = result.type.value
+        result_type = self._result_types.get(name)
+        if result_type is None:
+            violations.append(
+                Violation(
+                    ViolationType.UNSUPPORTED_RESULT_TYPE,
+                    loc,
+                    f"Result type {name} is not supported",
+                )
+            )
+            return
+        observable = getattr(result, "observable", None)
+        if observable is not None and result_type.observables is not None:
+            for factor in observable:
+                factor_name = factor if isinstance(factor, str) else "hermitian"
+                if factor_name not in result_type.observables:
+                    violations.append(
+                        Violation(
+                            ViolationType.UNSUPPORTED_OBSERVABLE,
+                            loc,
+                            f"Observable {factor_name} is not supported for result type {name}",
+                        )
+                    )
+        if shots is not None and not (
+            (result_type.min_shots is None or shots >= result_type.min_shots)
+            and (result_type.max_shots is None or shots <= result_type.max_shots)
+        ):
+            violations.append(
+                Violation(
+                    ViolationType.SHOTS_OUT_OF_RANGE,
+                    loc,
+                    f"Result type {name} does not support {shots} shots; the range is "
+                    f"[{result_type.min_shots}, {result_type.max_shots}]",
+                )
+            )
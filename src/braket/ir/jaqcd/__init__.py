@@ -11,6 +11,14 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+from braket.ir.jaqcd.circuit_statistics import CircuitStatistics, circuit_statistics  # noqa: F401
+from braket.ir.jaqcd.columnar import ColumnarInstructions, instruction_qubits  # noqa: F401
+from braket.ir.jaqcd.instruction_interning import (  # noqa: F401
+    InstructionTable,
+    disable_interning,
+    enable_interning,
+    get_instruction_table,
+)
 from braket.ir.jaqcd.instructions import (  # noqa: F401
     CY,
     CZ,
@@ -25,6 +33,39 @@ from braket.ir.jaqcd.instructions import (  # noqa: F401
     CPhaseShift01,
     CPhaseShift10,
     CSwap,
+    FrozenCCNot,
+    FrozenCNot,
+    FrozenCPhaseShift,
+    FrozenCPhaseShift00,
+    FrozenCPhaseShift01,
+    FrozenCPhaseShift10,
+    FrozenCSwap,
+    FrozenCY,
+    FrozenCZ,
+    FrozenH,
+    FrozenI,
+    FrozenInstruction,
+    FrozenISwap,
+    FrozenPhaseShift,
+    FrozenPSwap,
+    FrozenRx,
+    FrozenRy,
+    FrozenRz,
+    FrozenS,
+    FrozenSi,
+    FrozenSwap,
+    FrozenT,
+    FrozenTi,
+    FrozenUnitary,
+    FrozenV,
+    FrozenVi,
+    FrozenX,
+    FrozenXX,
+    FrozenXY,
+    FrozenY,
+    FrozenYY,
+    FrozenZ,
+    FrozenZZ,
     H,
     I,
     ISwap,
@@ -44,7 +85,15 @@ from braket.ir.jaqcd.instructions import (  # noqa: F401
     X,
     Y,
     Z,
+    freeze,
+)
+from braket.ir.jaqcd.matrix_arrays import (  # noqa: F401
+    disable_matrix_arrays,
+    enable_matrix_arrays,
+    matrix_arrays_enabled,
 )
+from braket.ir.jaqcd.program_reader import ProgramReader  # noqa: F401
+from braket.ir.jaqcd.program_template import ProgramTemplate  # noqa: F401
 from braket.ir.jaqcd.program_v1 import Program  # noqa: F401
 from braket.ir.jaqcd.results import (  # noqa: F401
     Amplitude,
@@ -0,0 +1,141 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Union
+
+from pydantic import BaseModel
+
+from braket.ir.jaqcd.columnar import ColumnarInstructions, instruction_qubits
+
+
+class CircuitStatistics(NamedTuple):
+    """
+    Statistics of the instructions of a circuit.
+
+    Attributes:
+        instruction_count (int): The number of instructions
+        qubit_count (int): The number of distinct qubits the instructions act on
+        depth (int): The number of layers of the circuit, where each instruction is in the
+            layer after the last layer of any of its qubits
+        gate_counts (Dict[str, int]): The number of instructions of each gate type, keyed
+            by the type, such as "h"
+        multi_qubit_gate_count (int): The number of instructions acting on more than one
+            qubit, controls included
+    """
+
+    instruction_count: int
+    qubit_count: int
+    depth: int
+    gate_counts: Dict[str, int]
+    multi_qubit_gate_count: int
+
+
+class _DepthCounter:
+    # Tracks the layer of each qubit
+    def __init__(self):
+        self.layers: Dict[int, int] = {}
+        self.depth = 0
+        self.multi_qubit_gate_count = 0
+
+    def add(self, qubits: List[int]) -> None:
+        layers = self.layers
+        if len(qubits) == 1:
+            qubit = qubits[0]
+            layer = layers.get(qubit, 0) + 1
+            layers[qubit] = layer
+        else:
+            layer = max(layers.get(qubit, 0) for qubit in qubits) + 1
+            for qubit in qubits:
+                layers[qubit] = layer
+            self.multi_qubit_gate_count += 1
+        if layer > self.depth:
+            self.depth = layer
+
+    def add_columns(self, qubits: Sequence[int], offsets: Sequence[int]) -> None:
+        # The same as `add` for each instruction of columns, without slicing the qubits of
+        # single-qubit instructions
+        layers = self.layers
+        depth = self.depth
+        multi_qubit_gate_count = 0
+        for start, stop in zip(offsets, islice(offsets, 1, None)):
+            if stop - start == 1:
+                qubit = qubits[start]
+                layer = layers.get(qubit, 0) + 1
+                layers[qubit] = layer
+            else:
+                gate_qubits = qubits[start:stop]
+                layer = max(layers.get(qubit, 0) for qubit in gate_qubits) + 1
+                for qubit in gate_qubits:
+                    layers[qubit] = layer
+                multi_qubit_gate_count += 1
+            if layer > depth:
+                depth = layer
+        self.depth = depth
+        self.multi_qubit_gate_count += multi_qubit_gate_count
+
+    def statistics(self, instruction_count: int, gate_counts: Counter) -> CircuitStatistics:
+        return CircuitStatistics(
+            instruction_count=instruction_count,
+            qubit_count=len(self.layers),
+            depth=self.depth,
+            gate_counts={gate_type.value: count for gate_type, count in gate_counts.items()},
+            multi_qubit_gate_count=self.multi_qubit_gate_count,
+        )
+
+
+def _columnar_statistics(columns: ColumnarInstructions) -> CircuitStatistics:
+    counter = _DepthCounter()
+    counter.add_columns(columns.qubits, columns.offsets)
+    gate_counts = Counter()
+    for code, count in Counter(columns.codes).items():
+        gate_counts[columns.GATE_TYPES[code]] = count
+    return counter.statistics(len(columns), gate_counts)
+
+
+def circuit_statistics(
+    instructions: Union[ColumnarInstructions, Iterable[BaseModel]],
+) -> CircuitStatistics:
+    """
+    Computes the statistics of the instructions of a circuit in a single pass.
+
+    The qubits of each instruction are those of its qubit fields, with the arity given by
+    the shared models of its class, for example one control and one target for `CNot`.
+
+    Args:
+        instructions (Union[ColumnarInstructions, Iterable[BaseModel]]): The instructions,
+            such as the `instructions` of a Program, ColumnarInstructions, whose columns are
+            read without creating instruction objects, or a ProgramReader
+
+    Returns:
+        CircuitStatistics: The statistics of the instructions
+
+    Raises:
+        ValueError: If an instruction is not a supported gate
+
+    Examples:
+        >>> circuit_statistics([H(target=0), CNot(control=0, target=1)])
+        CircuitStatistics(instruction_count=2, qubit_count=2, depth=2,
+            gate_counts={'h': 1, 'cnot': 1}, multi_qubit_gate_count=1)
+    """
+    if isinstance(instructions, ColumnarInstructions):
+        return _columnar_statistics(instructions)
+    counter = _DepthCounter()
+    gate_counts = Counter()
+    instruction_count = 0
+    for instruction in instructions:
+        counter.add(instruction_qubits(instruction))
+        gate_counts[instruction.type] += 1
+        instruction_count += 1
+    return counter.statistics(instruction_count, gate_counts)
@@ -0,0 +1,288 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from braket.ir.jaqcd.program_v1 import Program, _valid_gates
+from braket.ir.jaqcd.shared_models import DoubleTarget
+
+# The number of qubits of each qubit field, or None if it varies between instructions
+_QUBIT_FIELD_COUNTS = {"control": 1, "controls": 2, "target": 1, "targets": None}
+
+
+class _GateLayout:
+    # How the fields of a gate class map to the columns
+    def __init__(self, gate_class: Type[BaseModel]):
+        self.gate_class = gate_class
+        self.type = gate_class.__fields__["type"].default
+        self.qubit_fields = []
+        for name in gate_class.__fields__:
+            if name in _QUBIT_FIELD_COUNTS:
+                count = _QUBIT_FIELD_COUNTS[name]
+                if name == "targets" and issubclass(gate_class, DoubleTarget):
+                    count = 2
+                self.qubit_fields.append((name, count))
+        self.has_angle = "angle" in gate_class.__fields__
+        self.has_matrix = "matrix" in gate_class.__fields__
+        self.fixed_qubits = sum(count or 0 for _, count in self.qubit_fields)
+
+    def qubits(self, instruction: BaseModel) -> List[int]:
+        qubits = []
+        for name, count in self.qubit_fields:
+            value = getattr(instruction, name)
+            if count == 1:
+                qubits.append(value)
+            else:
+                qubits.extend(value)
+        return qubits
+
+
+_LAYOUTS = tuple(_GateLayout(gate_class) for gate_class in _valid_gates.values())
+_CODES = {layout.type: code for code, layout in enumerate(_LAYOUTS)}
+
+
+def instruction_qubits(instruction: BaseModel) -> List[int]:
+    """
+    Args:
+        instruction (BaseModel): The instruction, such as an item of `Program.instructions`
+
+    Returns:
+        List[int]: The qubits the instruction acts on, controls included, in the order of
+        the qubit fields of its gate class, as in the `qubits` column of
+        ColumnarInstructions; for example control then target for `CNot`
+
+    Raises:
+        ValueError: If the instruction is not a supported gate
+
+    Examples:
+        >>> instruction_qubits(CNot(control=0, target=1))
+        [0, 1]
+    """
+    code = _CODES.get(getattr(instruction, "type", None))
+    if code is None:
+        raise ValueError(f"Invalid gate specified: {instruction}")
+    return _LAYOUTS[code].qubits(instruction)
+
+
+class ColumnarInstructions(Sequence):
+    """
+    A columnar (struct of arrays) store of jaqcd instructions, which takes a small fraction
+    of the memory of a list of instruction objects. Instruction objects are only created
+    when they are accessed by index or iteration.
+
+    The instructions are stored in the following columns, which should be treated as read-only:
+
+    Attributes:
+        codes (array): The gate type of each instruction, as an index into `GATE_TYPES`
+        offsets (array): The qubits of instruction `i` are `qubits[offsets[i]:offsets[i + 1]]`
+        qubits (array): The qubits of all instructions, in the order of the qubit fields
+            of their gate class, for example control then target for `CNot`
+        angles (array): The angle of each instruction, or NaN for gates without an angle
+        matrices (Dict[int, List[List[List[float]]]]): The matrix of each `Unitary`,
+            keyed by the index of the instruction
+
+    Examples:
+        >>> columns = ColumnarInstructions.from_list(program.instructions)
+        >>> columns[0]
+        H(target=0, type=<Type.h: 'h'>)
+        >>> columns.to_list() == program.instructions
+        True
+    """
+
+    GATE_TYPES = tuple(layout.type for layout in _LAYOUTS)
+    """The gate type of each code."""
+
+    def __init__(self, instructions: Iterable[Union[BaseModel, Dict[str, Any]]] = ()):
+        """
+        Args:
+            instructions (Iterable[Union[BaseModel, Dict[str, Any]]]): The instructions,
+                as instruction objects or as decoded JSON, which is validated. Default is ().
+
+        Raises:
+            ValueError: If an instruction is not a supported gate
+            ValidationError: If a decoded instruction is invalid
+        """
+        self.codes = array("B")
+        self.offsets = array("Q", [0])
+        self.qubits = array("I")
+        self.angles = array("d")
+        self.matrices = {}
+        self.extend(instructions)
+
+    @classmethod
+    def from_list(
+        cls, instructions: Iterable[Union[BaseModel, Dict[str, Any]]]
+    ) -> "ColumnarInstructions":
+        """
+        Args:
+            instructions (Iterable[Union[BaseModel, Dict[str, Any]]]): The instructions,
+                for example the `instructions` of a Program
+
+        Returns:
+            ColumnarInstructions: The instructions in columnar form
+        """
+        return cls(instructions)
+
+    def to_list(self) -> List[BaseModel]:
+        """
+        Returns:
+            List[BaseModel]: The instruction objects, in the list form of `Program.instructions`
+        """
+        return list(self)
+
+    def append(self, instruction: Union[BaseModel, Dict[str, Any]]) -> None:
+        """
+        Appends an instruction.
+
+        Args:
+            instruction (Union[BaseModel, Dict[str, Any]]): The instruction object, or its
+                decoded JSON, which is validated with `Program.validate_instructions`
+
+        Raises:
+            ValueError: If the instruction is not a supported gate
+            ValidationError: If a decoded instruction is invalid
+        """
+        if not isinstance(instruction, BaseModel):
+            instruction = Program.validate_instructions(instruction, "instructions")
+        code = _CODES.get(getattr(instruction, "type", None))
+        if code is None:
+            raise ValueError(f"Invalid gate specified: {instruction} for field: instructions")
+        layout = _LAYOUTS[code]
+        index = len(self.codes)
+        self._append_qubits(layout.qubits(instruction))
+        self.codes.append(code)
+        self.offsets.append(len(self.qubits))
+        self.angles.append(instruction.angle if layout.has_angle else math.nan)
+        if layout.has_matrix:
+            self.matrices[index] = instruction.matrix
+
+    def extend(self, instructions: Iterable[Union[BaseModel, Dict[str, Any]]]) -> None:
+        """
+        Appends instructions.
+
+        Args:
+            instructions (Iterable[Union[BaseModel, Dict[str, Any]]]): The instructions
+        """
+        for instruction in instructions:
+            self.append(instruction)
+
+    def _append_qubits(self, qubits: List[int]) -> None:
+        try:
+            self.qubits.extend(qubits)
+        except OverflowError:
+            # Qubit indices are stored in 32 bits until one does not fit
+            self.qubits = array("Q", self.qubits)
+            self.qubits.extend(qubits)
+
+    def gate_type(self, index: int) -> Any:
+        """
+        Args:
+            index (int): The index of the instruction
+
+        Returns:
+            Any: The gate type of the instruction, such as `H.Type.h`
+        """
+        return self.GATE_TYPES[self.codes[index]]
+
+    def qubits_of(self, index: int) -> array:
+        """
+        Args:
+            index (int): The index of the instruction
+
+        Returns:
+            array: The qubits the instruction acts on, controls included
+        """
+        index = self._check_index(index)
+        return self.qubits[self.offsets[index] : self.offsets[index + 1]]
+
+    def angle(self, index: int) -> Optional[float]:
+        """
+        Args:
+            index (int): The index of the instruction
+
+        Returns:
+            Optional[float]: The angle of the instruction, or None if it has no angle
+        """
+        angle = self.angles[index]
+        return None if math.isnan(angle) else angle
+
+    @property
+    def nbytes(self) -> int:
+        """
+        int: The size in bytes of the columns, not counting the matrices
+        """
+        return sum(
+            len(column) * column.itemsize
+            for column in (self.codes, self.offsets, self.qubits, self.angles)
+        )
+
+    def _check_index(self, index: int) -> int:
+        length = len(self.codes)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("instruction index out of range")
+        return index
+
+    def _instruction(self, index: int) -> BaseModel:
+        layout = _LAYOUTS[self.codes[index]]
+        values = {}
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        # Only Unitary has a variable number of qubits, its targets
+        variable = stop - start - layout.fixed_qubits
+        for name, count in layout.qubit_fields:
+            if count == 1:
+                values[name] = self.qubits[start]
+                start += 1
+            else:
+                count = count or variable
+                values[name] = self.qubits[start : start + count].tolist()
+                start += count
+        if layout.has_angle:
+            values["angle"] = self.angles[index]
+        if layout.has_matrix:
+            values["matrix"] = self.matrices[index]
+        values["type"] = layout.type
+        return layout.gate_class.construct(**values)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BaseModel, List[BaseModel]]:
+        if isinstance(index, slice):
+            return [self._instruction(i) for i in range(*index.indices(len(self.codes)))]
+        return self._instruction(self._check_index(index))
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        for index in range(len(self.codes)):
+            yield self._instruction(index)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _columns(self) -> Tuple:
+        # The qubits are compared as lists, since their arrays may have different types
+        return self.codes, self.offsets, self.qubits.tolist(), self.angles.tobytes(), self.matrices
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ColumnarInstructions):
+            # Angles are compared by their bytes, since NaN is not equal to itself
+            return self._columns() == other._columns()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnarInstructions(<{len(self)} instructions>)"
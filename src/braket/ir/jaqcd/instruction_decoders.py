@@ -0,0 +1,222 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Decoders of jaqcd instructions which check the shape of a decoded instruction directly
+instead of running the pydantic field validators.
+
+A decoder only handles instructions that are valid as they are, such as a target that is
+a non-negative int rather than a str of one; for any other input it returns None, and the
+instruction must be validated by its class, which raises the usual validation errors.
+The validators a gate class defines itself, such as the matrix check of `Unitary`, are
+still run on the fields the decoder converts; if one fails, the decoder returns None.
+The instructions built by a decoder are equal to those built by their class, with the
+same fields set.
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.class_validators import make_generic_validator
+
+from braket.ir.jaqcd.matrix_arrays import matrix_arrays_enabled
+from braket.ir.jaqcd.shared_models import DoubleControl, DoubleTarget
+
+_INVALID = object()
+
+
+def _qubit(value: Any) -> Any:
+    return value if type(value) is int and value >= 0 else _INVALID
+
+
+def _qubit_pair(value: Any) -> Any:
+    if type(value) is list and len(value) == 2:
+        first, second = value
+        if type(first) is int and first >= 0 and type(second) is int and second >= 0:
+            return [first, second]
+    return _INVALID
+
+
+def _qubits(value: Any) -> Any:
+    if type(value) is list and value:
+        for qubit in value:
+            if type(qubit) is not int or qubit < 0:
+                return _INVALID
+        return list(value)
+    return _INVALID
+
+
+def _finite_float(value: Any) -> Any:
+    if type(value) is float:
+        return value if math.isfinite(value) else _INVALID
+    if type(value) is int:
+        try:
+            return float(value)
+        except OverflowError:
+            return _INVALID
+    return _INVALID
+
+
+def _complex_matrix(value: Any) -> Any:
+    if type(value) is not list or not value or matrix_arrays_enabled():
+        # Matrices to be kept as arrays are validated by the class
+        return _INVALID
+    matrix = []
+    for row in value:
+        if type(row) is not list or not row:
+            return _INVALID
+        converted_row = []
+        for entry in row:
+            if type(entry) is not list or len(entry) != 2:
+                return _INVALID
+            real, imaginary = _finite_float(entry[0]), _finite_float(entry[1])
+            if real is _INVALID or imaginary is _INVALID:
+                return _INVALID
+            converted_row.append([real, imaginary])
+        matrix.append(converted_row)
+    return matrix
+
+
+def _field_converter(gate_class: Type[BaseModel], name: str) -> Optional[Callable[[Any], Any]]:
+    if name in ("target", "control"):
+        return _qubit
+    if name == "targets":
+        return _qubit_pair if issubclass(gate_class, DoubleTarget) else _qubits
+    if name == "controls":
+        return _qubit_pair if issubclass(gate_class, DoubleControl) else _qubits
+    if name == "angle":
+        return _finite_float
+    if name == "matrix":
+        return _complex_matrix
+    return None
+
+
+def _field_converters(gate_class: Type[BaseModel]) -> Optional[List[Tuple[str, Any]]]:
+    # The converter of each field of the gate class, or None if a field has no converter
+    converters = []
+    for name in gate_class.__fields__:
+        if name == "type":
+            # The type is set to the enum member, in its place in the field order
+            converters.append((name, None))
+            continue
+        converter = _field_converter(gate_class, name)
+        if converter is None:
+            return None
+        converters.append((name, converter))
+    return converters
+
+
+def _class_validators(gate_class: Type[BaseModel]) -> Optional[List[Tuple[str, Any, List]]]:
+    # The fields of the gate class with the validators it defines for them, in the generic
+    # form pydantic calls them in; empty if it defines none, or None if it has validators
+    # the decoders cannot run in its place
+    if gate_class.__pre_root_validators__ or gate_class.__post_root_validators__:
+        return None
+    validators = {}
+    for name, field_validators in gate_class.__validators__.items():
+        if any(validator.pre or validator.each_item for validator in field_validators):
+            return None
+        validators[name] = [
+            make_generic_validator(validator.func) for validator in field_validators
+        ]
+    if not validators:
+        return []
+    return [
+        (name, field, validators.get(name, [])) for name, field in gate_class.__fields__.items()
+    ]
+
+
+def _run_validators(
+    gate_class: Type[BaseModel], checks: List[Tuple[str, Any, List[Callable]]], values: dict
+) -> bool:
+    # Runs the validators of the gate class on the converted values in field order, as
+    # pydantic does, with the values of the fields before each field
+    config = gate_class.__config__
+    validated = {}
+    for name, field, validators in checks:
+        value = values[name]
+        for validator in validators:
+            try:
+                value = validator(gate_class, value, validated, field, config)
+            except (ValueError, TypeError, AssertionError):
+                return False
+        values[name] = validated[name] = value
+    return True
+
+
+def instruction_decoder(
+    gate_class: Type[BaseModel],
+) -> Optional[Callable[[Dict[str, Any]], Optional[BaseModel]]]:
+    """
+    Builds the decoder of a gate class.
+
+    Args:
+        gate_class (Type[BaseModel]): The gate class, such as `H`
+
+    Returns:
+        Optional[Callable[[Dict[str, Any]], Optional[BaseModel]]]: The decoder, which returns
+        the instruction, or None if the decoded instruction must be validated by the gate
+        class instead. None if the gate class has fields the decoders do not support, or
+        validators they cannot run, such as `pre` or root validators.
+    """
+    converters = _field_converters(gate_class)
+    checks = _class_validators(gate_class)
+    if converters is None or checks is None:
+        return None
+    type_ = gate_class.__fields__["type"].default
+    field_names = frozenset(gate_class.__fields__)
+    has_private_attributes = bool(gate_class.__private_attributes__)
+    new = gate_class.__new__
+
+    def decode(value: Dict[str, Any]) -> Optional[BaseModel]:
+        if type(value) is not dict or not field_names.issuperset(value):
+            return None
+        values = {}
+        for name, converter in converters:
+            if converter is None:
+                values[name] = type_
+                continue
+            converted = converter(value.get(name))
+            if converted is _INVALID:
+                return None
+            values[name] = converted
+        if checks and not _run_validators(gate_class, checks, values):
+            return None
+        instruction = new(gate_class)
+        object.__setattr__(instruction, "__dict__", values)
+        object.__setattr__(instruction, "__fields_set__", set(value))
+        if has_private_attributes:
+            instruction._init_private_attributes()
+        return instruction
+
+    return decode
+
+
+def instruction_decoders(
+    gate_classes: Dict[Any, Type[BaseModel]],
+) -> Dict[Any, Callable[[Dict[str, Any]], Optional[BaseModel]]]:
+    """
+    Args:
+        gate_classes (Dict[Any, Type[BaseModel]]): The gate classes keyed by their type
+
+    Returns:
+        Dict[Any, Callable[[Dict[str, Any]], Optional[BaseModel]]]: The decoders of the gate
+        classes with a decoder, keyed by their type
+    """
+    decoders = {}
+    for gate_type, gate_class in gate_classes.items():
+        decoder = instruction_decoder(gate_class)
+        if decoder is not None:
+            decoders[gate_type] = decoder
+    return decoders
@@ -0,0 +1,150 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Interning of the instructions of programs. When interning is enabled, the instructions
+decoded by `Program.validate_instructions`, for example while parsing a program, are
+replaced by frozen instructions shared through an InstructionTable, so that a gate repeated
+across a circuit, such as `H(target=0)`, is held in memory once.
+"""
+
+import struct
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from braket.ir.jaqcd.instructions import FrozenInstruction, freeze
+
+DEFAULT_MAX_SIZE = 1 << 16
+"""The default maximum number of distinct instructions held by an InstructionTable."""
+
+_table: Optional["InstructionTable"] = None
+_pack_float = struct.Struct("<d").pack
+
+
+def _intern_key(value: Any) -> Any:
+    # Floats are keyed by their bits, since equal floats such as -0.0 and 0.0 are not
+    # interchangeable
+    if isinstance(value, float):
+        return _pack_float(value)
+    if isinstance(value, list):
+        return tuple(_intern_key(item) for item in value)
+    return value
+
+
+class InstructionTable:
+    """
+    A table of frozen instructions, holding one instance of each distinct instruction.
+
+    Once the table is full, instructions not already in it are frozen but not added,
+    which bounds the memory of the table for circuits with many distinct instructions,
+    such as rotations by many different angles.
+
+    Examples:
+        >>> table = InstructionTable()
+        >>> table.intern(H(target=0)) is table.intern(H(target=0))
+        True
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Args:
+            max_size (int): The maximum number of distinct instructions held.
+                Default is `DEFAULT_MAX_SIZE`.
+        """
+        self.max_size = max_size
+        self._instructions: Dict[Any, FrozenInstruction] = {}
+
+    def intern(self, instruction: BaseModel) -> FrozenInstruction:
+        """
+        Args:
+            instruction (BaseModel): The instruction, frozen or not
+
+        Returns:
+            FrozenInstruction: The frozen instruction equal to the given instruction,
+            with the same fields set, shared with all previous equal instructions
+
+        Raises:
+            ValueError: If the instruction has no frozen variant
+        """
+        key = (
+            frozenset(instruction.__fields_set__),
+            tuple(_intern_key(value) for value in instruction.__dict__.values()),
+        )
+        interned = self._instructions.get(key)
+        if interned is None:
+            interned = freeze(instruction)
+            if len(self._instructions) < self.max_size:
+                self._instructions[key] = interned
+        return interned
+
+    def clear(self) -> None:
+        """
+        Removes all instructions from the table.
+        """
+        self._instructions.clear()
+
+    def __len__(self) -> int:
+        return len(self._instructions)
+
+
+def enable_interning(table: Optional[InstructionTable] = None) -> InstructionTable:
+    """
+    Enables the interning of the instructions decoded by `Program.validate_instructions`.
+    Instruction objects given to a Program are kept as they are.
+
+    Args:
+        table (Optional[InstructionTable]): The table to intern instructions in.
+            Default is None, meaning a new table.
+
+    Returns:
+        InstructionTable: The table instructions are interned in
+
+    Examples:
+        >>> table = enable_interning()
+        >>> program = Program.parse_raw(program_json)
+        >>> len(table)
+        12
+    """
+    global _table
+    _table = table if table is not None else InstructionTable()
+    return _table
+
+
+def disable_interning() -> None:
+    """
+    Disables the interning of instructions. Instructions already interned are unaffected.
+    """
+    global _table
+    _table = None
+
+
+def get_instruction_table() -> Optional[InstructionTable]:
+    """
+    Returns:
+        Optional[InstructionTable]: The table instructions are interned in,
+        or None if interning is disabled
+    """
+    return _table
+
+
+def intern_instruction(instruction: BaseModel) -> BaseModel:
+    """
+    Args:
+        instruction (BaseModel): The instruction
+
+    Returns:
+        BaseModel: The interned instruction if interning is enabled, or the instruction
+        itself otherwise
+    """
+    return instruction if _table is None else _table.intern(instruction)
@@ -12,7 +12,11 @@
 # language governing permissions and limitations under the License.
 
 from enum import Enum
+from typing import Any, Dict, Type
 
+from pydantic import BaseModel, validator
+
+from braket.ir.jaqcd.matrix_arrays import check_unitary_matrix
 from braket.ir.jaqcd.shared_models import (
     Angle,
     DoubleControl,
@@ -22,6 +26,7 @@ from braket.ir.jaqcd.shared_models import (
     SingleTarget,
     TwoDimensionalMatrix,
 )
+from braket.schema_common.schema_arrays import SchemaArray
 
 """
 Instructions that can be supplied to the braket.ir.jaqcd.Program.
@@ -690,9 +695,202 @@ class Unitary(TwoDimensionalMatrix, MultiTarget):
 
     Examples:
         >>> Unitary(targets=[0], matrix=[[[0, 0], [1, 0]],[[1, 0], [0, 1]]])
+        >>> Unitary(targets=[0], matrix=numpy.array([[0, 1], [1, 0]], dtype=complex))
     """
 
     class Type(str, Enum):
         unitary = "unitary"
 
     type = Type.unitary
+
+    @validator("matrix")
+    def validate_matrix(cls, value, values):
+        """
+        Matrices kept as arrays must act on the targets; see `check_unitary_matrix`.
+        """
+        if isinstance(value, SchemaArray) and "targets" in values:
+            check_unitary_matrix(value, len(values["targets"]))
+        return value
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class FrozenInstruction(BaseModel):
+    """
+    Base of the frozen variants of the instructions, such as `FrozenH` for `H`.
+
+    Frozen instructions are immutable and hashable, so they can be shared between programs
+    and used as dict keys or set members. A frozen instruction is an instance of the
+    instruction class it is a variant of, and is equal to the instructions of that class
+    with the same fields. The lists of its fields, such as its targets, must not be modified.
+
+    Examples:
+        >>> FrozenH(target=0) == H(target=0)
+        True
+        >>> {FrozenCNot(control=0, target=1): "entangler"}
+    """
+
+    class Config:
+        allow_mutation = False
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(_hashable(value) for value in self.__dict__.values())))
+
+
+class FrozenH(FrozenInstruction, H):
+    """Frozen, hashable H."""
+
+
+class FrozenI(FrozenInstruction, I):
+    """Frozen, hashable I."""
+
+
+class FrozenX(FrozenInstruction, X):
+    """Frozen, hashable X."""
+
+
+class FrozenY(FrozenInstruction, Y):
+    """Frozen, hashable Y."""
+
+
+class FrozenZ(FrozenInstruction, Z):
+    """Frozen, hashable Z."""
+
+
+class FrozenRx(FrozenInstruction, Rx):
+    """Frozen, hashable Rx."""
+
+
+class FrozenRy(FrozenInstruction, Ry):
+    """Frozen, hashable Ry."""
+
+
+class FrozenRz(FrozenInstruction, Rz):
+    """Frozen, hashable Rz."""
+
+
+class FrozenS(FrozenInstruction, S):
+    """Frozen, hashable S."""
+
+
+class FrozenT(FrozenInstruction, T):
+    """Frozen, hashable T."""
+
+
+class FrozenSi(FrozenInstruction, Si):
+    """Frozen, hashable Si."""
+
+
+class FrozenTi(FrozenInstruction, Ti):
+    """Frozen, hashable Ti."""
+
+
+class FrozenSwap(FrozenInstruction, Swap):
+    """Frozen, hashable Swap."""
+
+
+class FrozenCSwap(FrozenInstruction, CSwap):
+    """Frozen, hashable CSwap."""
+
+
+class FrozenISwap(FrozenInstruction, ISwap):
+    """Frozen, hashable ISwap."""
+
+
+class FrozenPSwap(FrozenInstruction, PSwap):
+    """Frozen, hashable PSwap."""
+
+
+class FrozenXY(FrozenInstruction, XY):
+    """Frozen, hashable XY."""
+
+
+class FrozenPhaseShift(FrozenInstruction, PhaseShift):
+    """Frozen, hashable PhaseShift."""
+
+
+class FrozenCPhaseShift(FrozenInstruction, CPhaseShift):
+    """Frozen, hashable CPhaseShift."""
+
+
+class FrozenCPhaseShift00(FrozenInstruction, CPhaseShift00):
+    """Frozen, hashable CPhaseShift00."""
+
+
+class FrozenCPhaseShift01(FrozenInstruction, CPhaseShift01):
+    """Frozen, hashable CPhaseShift01."""
+
+
+class FrozenCPhaseShift10(FrozenInstruction, CPhaseShift10):
+    """Frozen, hashable CPhaseShift10."""
+
+
+class FrozenCNot(FrozenInstruction, CNot):
+    """Frozen, hashable CNot."""
+
+
+class FrozenCCNot(FrozenInstruction, CCNot):
+    """Frozen, hashable CCNot."""
+
+
+class FrozenCY(FrozenInstruction, CY):
+    """Frozen, hashable CY."""
+
+
+class FrozenCZ(FrozenInstruction, CZ):
+    """Frozen, hashable CZ."""
+
+
+class FrozenXX(FrozenInstruction, XX):
+    """Frozen, hashable XX."""
+
+
+class FrozenYY(FrozenInstruction, YY):
+    """Frozen, hashable YY."""
+
+
+class FrozenZZ(FrozenInstruction, ZZ):
+    """Frozen, hashable ZZ."""
+
+
+class FrozenV(FrozenInstruction, V):
+    """Frozen, hashable V."""
+
+
+class FrozenVi(FrozenInstruction, Vi):
+    """Frozen, hashable Vi."""
+
+
+class FrozenUnitary(FrozenInstruction, Unitary):
+    """Frozen, hashable Unitary."""
+
+
+_FROZEN_VARIANTS: Dict[Type[BaseModel], Type[FrozenInstruction]] = {
+    frozen_class.__bases__[1]: frozen_class for frozen_class in FrozenInstruction.__subclasses__()
+}
+
+
+def freeze(instruction: BaseModel) -> FrozenInstruction:
+    """
+    Returns the frozen variant of an instruction.
+
+    Args:
+        instruction (BaseModel): The instruction, such as `H(target=0)`
+
+    Returns:
+        FrozenInstruction: The frozen instruction with the same fields, such as
+        `FrozenH(target=0)`, or the instruction itself if it is already frozen
+
+    Raises:
+        ValueError: If the instruction has no frozen variant
+    """
+    if isinstance(instruction, FrozenInstruction):
+        return instruction
+    frozen_class = _FROZEN_VARIANTS.get(type(instruction))
+    if frozen_class is None:
+        raise ValueError(f"No frozen variant of instruction {instruction}")
+    return frozen_class.construct(_fields_set=instruction.__fields_set__, **instruction.__dict__)
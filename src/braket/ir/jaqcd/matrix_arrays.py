@@ -0,0 +1,230 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+NumPy-backed complex matrices of jaqcd instructions and results, such as the matrix of
+`Unitary` and the Hermitian matrices of observables.
+
+A matrix given as a NumPy array, either complex or with a last axis of `[real, imaginary]`
+pairs, is validated with vectorized checks and kept as a read-only complex128 array in a
+SchemaArray, which is serialized back to the `[real, imaginary]` pairs of the JSON form.
+Such matrices must be square, with a power of two number of rows, and have finite entries.
+Matrices given as nested lists are validated one entry at a time and kept as lists,
+unless matrix arrays are enabled with `enable_matrix_arrays`, in which case they are
+validated and kept as arrays as well.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Type
+
+from pydantic import BaseConfig, ValidationError
+from pydantic.fields import ModelField
+from pydantic.schema import field_schema
+
+from braket.schema_common.schema_arrays import SchemaArray, is_ndarray, numpy_module
+
+_arrays_enabled = False
+_unitary_tolerance: Optional[float] = None
+_hermitian_tolerance: Optional[float] = None
+
+
+def enable_matrix_arrays(
+    unitary_tolerance: Optional[float] = None, hermitian_tolerance: Optional[float] = None
+) -> None:
+    """
+    Enables matrix arrays: matrices given as nested lists, for example while parsing a
+    program, are validated and kept as arrays, like matrices given as NumPy arrays.
+
+    Args:
+        unitary_tolerance (Optional[float]): The absolute tolerance of the check that the
+            matrices of `Unitary` instructions are unitary. Default is None, meaning that
+            matrices are not checked to be unitary.
+        hermitian_tolerance (Optional[float]): The absolute tolerance of the check that the
+            matrices of observables are Hermitian. Default is None, meaning that matrices
+            are not checked to be Hermitian.
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Examples:
+        >>> enable_matrix_arrays(unitary_tolerance=1e-8, hermitian_tolerance=1e-8)
+        >>> program = Program.parse_raw(program_json)
+        >>> numpy.asarray(program.instructions[0].matrix)
+    """
+    global _arrays_enabled, _unitary_tolerance, _hermitian_tolerance
+    numpy_module()
+    _arrays_enabled = True
+    _unitary_tolerance = unitary_tolerance
+    _hermitian_tolerance = hermitian_tolerance
+
+
+def disable_matrix_arrays() -> None:
+    """
+    Disables matrix arrays. Matrices given as NumPy arrays are still kept as arrays.
+    """
+    global _arrays_enabled, _unitary_tolerance, _hermitian_tolerance
+    _arrays_enabled = False
+    _unitary_tolerance = None
+    _hermitian_tolerance = None
+
+
+def matrix_arrays_enabled() -> bool:
+    """
+    Returns:
+        bool: Whether matrices given as nested lists are kept as arrays
+    """
+    return _arrays_enabled
+
+
+def complex_matrix_array(value: Any, min_size: int = 1) -> SchemaArray:
+    """
+    Validates a complex matrix with vectorized checks.
+
+    Args:
+        value (Any): The matrix, as a NumPy array, either complex or with a last axis of
+            `[real, imaginary]` pairs, or as nested lists of `[real, imaginary]` pairs
+        min_size (int): The minimum number of rows. Default is 1.
+
+    Returns:
+        SchemaArray: The matrix, as a complex128 array
+
+    Raises:
+        ValueError: If the matrix is not square with a power of two number of rows,
+            at least `min_size`, or has entries that are not finite
+    """
+    numpy = numpy_module()
+    try:
+        array = numpy.array(value)
+        if array.ndim == 3 and array.shape[-1] == 2 and array.dtype.kind != "c":
+            pairs = array.astype(numpy.float64)
+            array = numpy.empty(array.shape[:2], dtype=numpy.complex128)
+            array.real = pairs[..., 0]
+            array.imag = pairs[..., 1]
+        elif array.ndim == 2 and array.dtype.kind in "biufc":
+            array = array.astype(numpy.complex128)
+        else:
+            raise ValueError
+    except (ValueError, TypeError, OverflowError):
+        raise ValueError("matrix must be a two dimensional matrix of complex numbers")
+    rows, columns = array.shape
+    if rows != columns or rows < min_size or rows & (rows - 1):
+        raise ValueError(
+            "matrix must be square with a power of two number of rows, "
+            f"but has shape {rows}x{columns}"
+        )
+    if not numpy.isfinite(array).all():
+        raise ValueError("matrix entries must be finite")
+    return SchemaArray(array)
+
+
+def check_unitary_matrix(matrix: SchemaArray, qubit_count: int) -> None:
+    """
+    Checks that the matrix of a `Unitary` acts on its targets, and, if enabled with
+    `enable_matrix_arrays`, that it is unitary.
+
+    Args:
+        matrix (SchemaArray): The matrix
+        qubit_count (int): The number of targets
+
+    Raises:
+        ValueError: If the matrix does not have `2 ** qubit_count` rows, or is not unitary
+            within the tolerance
+    """
+    array = matrix.array
+    if len(array) != 1 << qubit_count:
+        raise ValueError(
+            f"matrix must have {1 << qubit_count} rows for {qubit_count} targets, "
+            f"but has {len(array)}"
+        )
+    if _unitary_tolerance is not None:
+        numpy = numpy_module()
+        product = array @ array.conj().T
+        if not numpy.allclose(product, numpy.eye(len(array)), rtol=0, atol=_unitary_tolerance):
+            raise ValueError(f"matrix is not unitary within tolerance {_unitary_tolerance}")
+
+
+def check_hermitian_matrix(matrix: SchemaArray) -> None:
+    """
+    Checks, if enabled with `enable_matrix_arrays`, that the matrix of an observable is
+    Hermitian.
+
+    Args:
+        matrix (SchemaArray): The matrix
+
+    Raises:
+        ValueError: If the matrix is not Hermitian within the tolerance
+    """
+    if _hermitian_tolerance is not None:
+        numpy = numpy_module()
+        array = matrix.array
+        if not numpy.allclose(array, array.conj().T, rtol=0, atol=_hermitian_tolerance):
+            raise ValueError(f"matrix is not Hermitian within tolerance {_hermitian_tolerance}")
+
+
+class ComplexMatrix:
+    """
+    The type of a complex matrix field, which accepts the nested lists of the JSON form of
+    the matrix, validated as `list_type`, or a NumPy array; see the module documentation.
+    Use `complex_matrix` to create the type of a field.
+    """
+
+    list_field: ModelField
+    min_size: int = 1
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[..., Any]]:
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, schema: Dict[str, Any]) -> None:
+        # The schema is that of the JSON form
+        list_schema = field_schema(cls.list_field, model_name_map={})[0]
+        list_schema.pop("title", None)
+        schema.update(list_schema)
+
+    @classmethod
+    def validate(cls, value: Any) -> Any:
+        if is_ndarray(value):
+            return complex_matrix_array(value, cls.min_size)
+        if _arrays_enabled and type(value) is list:
+            try:
+                return complex_matrix_array(value, cls.min_size)
+            except ValueError:
+                # Invalid lists raise their usual validation errors
+                cls._validate_list(value)
+                raise
+        return cls._validate_list(value)
+
+    @classmethod
+    def _validate_list(cls, value: Any) -> Any:
+        validated, errors = cls.list_field.validate(value, {}, loc=())
+        if errors:
+            raise ValidationError(errors if isinstance(errors, list) else [errors], cls)
+        return validated
+
+
+def complex_matrix(list_type: Any, min_size: int = 1) -> Type[ComplexMatrix]:
+    """
+    Args:
+        list_type (Any): The type of the nested lists of the JSON form of the matrix,
+            such as a `conlist` of `conlist` of pairs of floats
+        min_size (int): The minimum number of rows of matrices given as arrays. Default is 1.
+
+    Returns:
+        Type[ComplexMatrix]: The type of the field
+    """
+    list_field = ModelField.infer(
+        name="matrix", value=..., annotation=list_type, class_validators=None, config=BaseConfig
+    )
+    return type(
+        "ComplexMatrixValue", (ComplexMatrix,), {"list_field": list_field, "min_size": min_size}
+    )
@@ -0,0 +1,244 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import codecs
+import io
+import json
+import os
+import re
+from typing import IO, Any, Iterator, List, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.utils import ROOT_KEY
+
+from braket.ir.jaqcd.program_v1 import Program, Results
+
+ProgramSource = Union[str, bytes, bytearray, memoryview, os.PathLike, IO]
+"""
+The inputs accepted by ProgramReader: a JSON string, a bytes-like object holding the
+encoded JSON document, the path to a JSON file or a file object opened for reading.
+"""
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_FIELDS = {field.alias: field for field in Program.__fields__.values()}
+
+
+class ProgramReader:
+    """
+    Reads the instructions of a jaqcd Program one at a time from its JSON document, so that
+    a circuit can be walked without holding all of its instructions in memory. Only the
+    instruction being read is kept, along with the other, typically small, fields of the
+    program.
+
+    Each instruction is validated as by `Program.validate_instructions` when it is read,
+    and the other fields are validated when they are reached. Validation errors are raised
+    with the same locations and messages as when parsing the whole program.
+
+    The `results` and `basis_rotation_instructions` of the program are available once
+    they have been read; fields that follow the instructions in the document are only
+    read after the last instruction, and `complete` tells whether the whole document has
+    been read.
+
+    Examples:
+        >>> with ProgramReader(Path("program.json")) as reader:
+        ...     counts = Counter(instruction.type for instruction in reader)
+        ...     results = reader.results
+    """
+
+    def __init__(self, source: ProgramSource, chunk_size: int = 1 << 16):
+        """
+        Args:
+            source (ProgramSource): The JSON document of the program. A `str` is always
+                treated as JSON, never as a path.
+            chunk_size (int): The number of bytes or characters read from the source at a
+                time. Default is 65536.
+        """
+        self._owns_file = isinstance(source, os.PathLike)
+        if self._owns_file:
+            source = open(source, "rb")
+        elif isinstance(source, str):
+            source = io.StringIO(source)
+        elif not hasattr(source, "read"):
+            source = io.BytesIO(source)
+        self._file = source
+        self._chunk_size = chunk_size
+        # Binary sources are decoded incrementally, so that characters split between
+        # chunks are decoded whole
+        self._text_decoder = (
+            None if isinstance(source, io.TextIOBase) else codecs.getincrementaldecoder("utf-8")()
+        )
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._offset = 0
+        self._eof = False
+        self._values = {}
+        self._complete = False
+        self._instructions = self._read_program()
+
+    @property
+    def results(self) -> Optional[List[Results]]:
+        """
+        Optional[List[Results]]: The requested results, or None if the program has none
+        or they have not been read yet
+        """
+        return self._values.get("results")
+
+    @property
+    def basis_rotation_instructions(self) -> Optional[List[Any]]:
+        """
+        Optional[List[Any]]: The basis rotation instructions, or None if the program has
+        none or they have not been read yet
+        """
+        return self._values.get("basis_rotation_instructions")
+
+    @property
+    def complete(self) -> bool:
+        """
+        bool: Whether the whole document has been read and validated
+        """
+        return self._complete
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        """
+        The instructions of the program, which can only be iterated once.
+
+        Raises:
+            ValidationError: If the document is not valid JSON or is not a valid program
+        """
+        return self._instructions
+
+    def close(self) -> None:
+        """
+        Closes the file of the program if it was opened from a path.
+        """
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "ProgramReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read_program(self) -> Iterator[BaseModel]:
+        instructions_read = False
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+        else:
+            while True:
+                key = self._decode_value()
+                if type(key) is not str:
+                    self._raise_syntax_error("Expecting property name enclosed in double quotes")
+                self._expect(":")
+                if key == "instructions":
+                    instructions_read = True
+                    yield from self._read_instructions()
+                else:
+                    self._set_value(key, self._decode_value())
+                if self._expect(",}") == "}":
+                    break
+        if self._peek():
+            self._raise_syntax_error("Extra data")
+        self.close()
+        if not instructions_read:
+            raise ValidationError([ErrorWrapper(MissingError(), loc="instructions")], Program)
+        self._values.setdefault("braketSchemaHeader", _FIELDS["braketSchemaHeader"].default)
+        self._complete = True
+
+    def _read_instructions(self) -> Iterator[BaseModel]:
+        if self._peek() != "[":
+            # Not a list, which the instructions field rejects
+            self._set_value("instructions", self._decode_value())
+            return
+        self._position += 1
+        if self._peek() == "]":
+            self._position += 1
+            return
+        field = _FIELDS["instructions"]
+        # The validator is called with the field of the items, as when validating a program
+        item_field = field.sub_fields[0]
+        index = 0
+        while True:
+            value = self._decode_value()
+            try:
+                yield Program.validate_instructions(value, item_field)
+            except (ValueError, TypeError, AssertionError) as e:
+                raise ValidationError([ErrorWrapper(e, loc=(field.alias, index))], Program)
+            index += 1
+            if self._expect(",]") == "]":
+                return
+
+    def _set_value(self, key: str, value: Any) -> None:
+        field = _FIELDS.get(key)
+        if field is None:
+            # Extra fields are ignored, as by Program
+            return
+        validated, error = field.validate(value, self._values, loc=field.alias, cls=Program)
+        if error:
+            raise ValidationError([error], Program)
+        self._values[field.name] = validated
+
+    def _read(self, size: int) -> None:
+        if self._position:
+            self._offset += self._position
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+        chunk = self._file.read(max(size, self._chunk_size))
+        self._eof = not chunk
+        if self._text_decoder:
+            chunk = self._text_decoder.decode(chunk, final=self._eof)
+        self._buffer += chunk
+
+    def _peek(self) -> str:
+        # Skips whitespace and returns the next character, or "" at the end of the document
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or self._eof:
+                return self._buffer[self._position : self._position + 1]
+            self._read(0)
+
+    def _expect(self, characters: str) -> str:
+        character = self._peek()
+        if not character or character not in characters:
+            expected = " or ".join(f"'{c}'" for c in characters)
+            self._raise_syntax_error(f"Expecting {expected}")
+        self._position += 1
+        return character
+
+    def _decode_value(self) -> Any:
+        while True:
+            self._peek()
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    self._raise_syntax_error(e.msg, e.pos)
+                # The value continues in the next chunks; reading at least as much as is
+                # buffered keeps the cost of decoding a large value linear in its size
+                self._read(len(self._buffer) - self._position)
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A number may continue in the next chunk
+                self._read(0)
+                continue
+            self._position = end
+            return value
+
+    def _raise_syntax_error(self, message: str, position: Optional[int] = None) -> None:
+        position = self._offset + (self._position if position is None else position)
+        error = ValueError(f"{message}: char {position}")
+        raise ValidationError([ErrorWrapper(error, loc=ROOT_KEY)], Program)
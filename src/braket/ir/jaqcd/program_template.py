@@ -0,0 +1,192 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import math
+import numbers
+import uuid
+from array import array
+from typing import Any, List, Sequence, Tuple
+
+from braket.ir.jaqcd.program_v1 import Program
+from braket.schema_common import json_codec
+from braket.schema_common.schema_arrays import keeping_arrays
+
+
+class ProgramTemplate:
+    """
+    A Program whose angles can be rebound, for running the same circuit with many sets of
+    parameters, as in variational algorithms.
+
+    The program is validated once, when the template is created. Each instruction with an
+    `angle`, such as `Rx` or `XX`, is an angle slot, and binding new angles to the slots
+    only checks that the angles are finite numbers; the other instructions, results and
+    basis rotation instructions are shared, unvalidated and unchanged, by all the programs
+    bound from the template, so they must not be modified.
+
+    Examples:
+        >>> template = ProgramTemplate(Program(instructions=[Rx(target=0, angle=0), H(target=1)]))
+        >>> template.angles
+        array('d', [0.0])
+        >>> template.bind([0.15])
+        Program(..., instructions=[Rx(angle=0.15, target=0, ...), H(target=1, ...)], ...)
+        >>> template.bind_json([0.15]) == template.bind([0.15]).json()
+        True
+        >>> template.bind_batch(numpy.linspace(0, math.pi, 100).reshape(100, 1))
+    """
+
+    def __init__(self, program: Program):
+        """
+        Args:
+            program (Program): The program, whose angles are the initial angles of the slots
+        """
+        self._program = program
+        self._slots = tuple(
+            index
+            for index, instruction in enumerate(program.instructions)
+            if "angle" in instruction.__fields__
+        )
+        self._json_segments: Tuple[Any, List[str]] = (None, [])
+
+    @property
+    def program(self) -> Program:
+        """
+        Program: The program the template was created from
+        """
+        return self._program
+
+    @property
+    def slots(self) -> Tuple[int, ...]:
+        """
+        Tuple[int, ...]: The index in the instructions of the program of each angle slot
+        """
+        return self._slots
+
+    @property
+    def angles(self) -> array:
+        """
+        array: The angles of the slots in the program the template was created from
+        """
+        instructions = self._program.instructions
+        return array("d", (instructions[index].angle for index in self._slots))
+
+    def bind(self, angles: Sequence[float]) -> Program:
+        """
+        Args:
+            angles (Sequence[float]): The angle of each slot, such as a list or a 1-D
+                NumPy array
+
+        Returns:
+            Program: The program with the given angles
+
+        Raises:
+            ValueError: If the number of angles is not the number of slots, or an angle is
+                not a finite number
+        """
+        angles = self._check_angles(angles)
+        instructions = list(self._program.instructions)
+        for index, angle in zip(self._slots, angles):
+            instruction = instructions[index]
+            values = dict(instruction.__dict__)
+            values["angle"] = angle
+            instructions[index] = instruction.construct(
+                _fields_set=instruction.__fields_set__, **values
+            )
+        values = dict(self._program.__dict__)
+        values["instructions"] = instructions
+        return Program.construct(_fields_set=self._program.__fields_set__, **values)
+
+    def bind_json(self, angles: Sequence[float]) -> str:
+        """
+        Args:
+            angles (Sequence[float]): The angle of each slot, such as a list or a 1-D
+                NumPy array
+
+        Returns:
+            str: The JSON of the program with the given angles, the same as that of
+            `bind(angles).json()`, built without creating the program
+
+        Raises:
+            ValueError: If the number of angles is not the number of slots, or an angle is
+                not a finite number
+        """
+        angles = self._check_angles(angles)
+        segments = self._segments()
+        if not angles:
+            return segments[0]
+        # The angles are encoded together, to be formatted as the codec formats floats
+        encoded = json_codec.dumps(angles)[1:-1].split(",")
+        parts = [segments[0]]
+        for angle, segment in zip(encoded, segments[1:]):
+            parts.append(angle.strip())
+            parts.append(segment)
+        return "".join(parts)
+
+    def bind_batch(self, angles: Sequence[Sequence[float]], as_json: bool = False) -> List[Any]:
+        """
+        Binds several sets of angles, for example for a parameter sweep.
+
+        Args:
+            angles (Sequence[Sequence[float]]): The angles of each program, one row per
+                program and one column per slot, such as a 2-D NumPy array
+            as_json (bool): Whether to return the JSON of the programs instead of the
+                programs. Default is False.
+
+        Returns:
+            List[Any]: The program, or its JSON, for each row of angles
+
+        Raises:
+            ValueError: If a row does not have one angle per slot, or an angle is not a
+                finite number
+        """
+        if hasattr(angles, "tolist"):
+            # NumPy arrays are converted to lists of floats at once
+            angles = angles.tolist()
+        bind = self.bind_json if as_json else self.bind
+        return [bind(row) for row in angles]
+
+    def _check_angles(self, angles: Sequence[float]) -> List[float]:
+        if hasattr(angles, "tolist"):
+            angles = angles.tolist()
+        if len(angles) != len(self._slots):
+            raise ValueError(f"Expected {len(self._slots)} angles, got {len(angles)}")
+        checked = []
+        for slot, angle in enumerate(angles):
+            if type(angle) is not float:
+                # Any real number, such as a NumPy scalar, but not a bool
+                if isinstance(angle, bool) or not isinstance(angle, numbers.Real):
+                    raise ValueError(f"Angle of slot {slot} is not a number: {angle!r}")
+                try:
+                    angle = float(angle)
+                except OverflowError:
+                    angle = math.inf
+            if not math.isfinite(angle):
+                raise ValueError(f"Angle of slot {slot} is not finite: {angle!r}")
+            checked.append(angle)
+        return checked
+
+    def _segments(self) -> List[str]:
+        # The JSON of the program split at its angles, for the current codec
+        codec = json_codec.get_json_codec()
+        cached_codec, segments = self._json_segments
+        if cached_codec is codec:
+            return segments
+        marker = f"braket-angle-slot-{uuid.uuid4().hex}"
+        with keeping_arrays():
+            document = self._program.dict()
+        for index in self._slots:
+            document["instructions"][index]["angle"] = marker
+        segments = self._program.__config__.json_dumps(
+            document, default=self._program.__json_encoder__
+        ).split(json_codec.dumps(marker))
+        self._json_segments = (codec, segments)
+        return segments
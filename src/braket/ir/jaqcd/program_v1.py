@@ -13,8 +13,11 @@
 
 from typing import Any, List, Optional, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseConfig, BaseModel, Field, PrivateAttr, ValidationError, validator
+from pydantic.fields import ModelField
 
+from braket.ir.jaqcd.instruction_decoders import instruction_decoders
+from braket.ir.jaqcd.instruction_interning import intern_instruction
 from braket.ir.jaqcd.instructions import (
     CY,
     CZ,
@@ -98,8 +101,57 @@ _valid_gates = {
     ZZ.Type.zz: ZZ,
 }
 
+# Decoders which build valid decoded instructions without running the field validators of
+# their class, which is the most expensive part of parsing a program
+_instruction_decoders = instruction_decoders(_valid_gates)
+
 Results = Union[Amplitude, Expectation, Probability, Sample, StateVector, Variance]
 
+# The result types keyed by their type, for the same O(1) lookup as `_valid_gates`; a plain
+# Union[] of the result types tries each of them in turn until one validates
+_valid_results = {
+    Amplitude.Type.amplitude: Amplitude,
+    Expectation.Type.expectation: Expectation,
+    Probability.Type.probability: Probability,
+    Sample.Type.sample: Sample,
+    StateVector.Type.statevector: StateVector,
+    Variance.Type.variance: Variance,
+}
+
+# Validates results without a type, which are resolved as by the plain Union[]
+_results_field = ModelField.infer(
+    name="results", value=..., annotation=Results, class_validators=None, config=BaseConfig
+)
+
+
+def validate_result(value: Any) -> BaseModel:
+    """
+    Validates a requested result, using the class given by its type.
+
+    Args:
+        value (Any): The result, as a result type object or its decoded JSON
+
+    Returns:
+        BaseModel: The result type object, such as `Expectation`
+
+    Raises:
+        ValueError: If the type of the result is not a supported result type
+        ValidationError: If the result is not valid for the class of its type
+    """
+    if isinstance(value, BaseModel):
+        if getattr(value, "type", None) not in _valid_results:
+            raise ValueError(f"Invalid result type specified: {value}")
+        return value
+    if isinstance(value, dict) and "type" in value:
+        result_class = _valid_results.get(value["type"])
+        if result_class is None:
+            raise ValueError(f"Invalid result type specified: {value}")
+        return result_class(**value)
+    result, errors = _results_field.validate(value, {}, loc=())
+    if errors:
+        raise ValidationError([errors], Program)
+    return result
+
 
 class Program(BraketSchemaBase):
     """
@@ -163,6 +215,43 @@ class Program(BraketSchemaBase):
     results: Optional[List[Results]]
     basis_rotation_instructions: Optional[List[Any]]
 
+    _TYPE_DISPATCH = {
+        "instructions": _valid_gates,
+        "results": _valid_results,
+        "basis_rotation_instructions": _valid_gates,
+    }
+    _circuit_statistics: Optional[Any] = PrivateAttr(default=None)
+    _CACHED_ATTRIBUTES = BraketSchemaBase._CACHED_ATTRIBUTES + ("_circuit_statistics",)
+
+    def circuit_statistics(self) -> "CircuitStatistics":
+        """
+        Computes the statistics of the instructions of the program in a single pass: the
+        number of instructions and of qubits, the depth, the number of instructions of each
+        gate type and the number of multi-qubit instructions. The basis rotation
+        instructions are not included.
+
+        The statistics are computed once and cached. Assigning a field, or copying the
+        program with updated fields, resets the cache, but modifying the instructions in
+        place does not. The gate counts returned are a copy, so modifying them does not
+        change the cached statistics.
+
+        Returns:
+            CircuitStatistics: The statistics of the instructions
+
+        Examples:
+            >>> Program(instructions=[H(target=0), CNot(control=0, target=1)]).circuit_statistics()
+            CircuitStatistics(instruction_count=2, qubit_count=2, depth=2,
+                gate_counts={'h': 1, 'cnot': 1}, multi_qubit_gate_count=1)
+        """
+        if self._circuit_statistics is None:
+            # Imported here, since the statistics are computed with the gate layouts of
+            # braket.ir.jaqcd.columnar, which is built from this module
+            from braket.ir.jaqcd.circuit_statistics import circuit_statistics
+
+            self._circuit_statistics = circuit_statistics(self.instructions)
+        statistics = self._circuit_statistics
+        return statistics._replace(gate_counts=dict(statistics.gate_counts))
+
     @validator("instructions", "basis_rotation_instructions", each_item=True, pre=True)
     def validate_instructions(cls, value, field):
         """
@@ -178,4 +267,23 @@ class Program(BraketSchemaBase):
 
         if value is None or "type" not in value or value["type"] not in _valid_gates:
             raise ValueError(f"Invalid gate specified: {value} for field: {field}")
-        return _valid_gates[value["type"]](**value)
+        decoder = _instruction_decoders.get(value["type"])
+        instruction = decoder(value) if decoder else None
+        if instruction is None:
+            # Invalid or unusual instructions are validated by their class, which raises
+            # the validation errors
+            instruction = _valid_gates[value["type"]](**value)
+        return intern_instruction(instruction)
+
+    @validator("results", each_item=True, pre=True)
+    def validate_results(cls, value):
+        """
+        Validates each result by the class of its type in O(1); see `validate_result`.
+        The result type object is then accepted by the `Results` union as it is.
+        """
+        return validate_result(value)
+
+    class Config:
+        # Accepts a value of the exact class of a member of a union without trying to
+        # validate it as each member in turn
+        smart_union = True
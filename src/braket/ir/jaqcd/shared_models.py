@@ -13,7 +13,10 @@
 
 from typing import Optional, Union
 
-from pydantic import BaseModel, confloat, conint, conlist, constr
+from pydantic import BaseModel, confloat, conint, conlist, constr, validator
+
+from braket.ir.jaqcd.matrix_arrays import check_hermitian_matrix, complex_matrix
+from braket.schema_common.schema_arrays import SchemaArray, SchemaArrayModel
 
 
 class SingleTarget(BaseModel):
@@ -129,7 +132,7 @@ class Angle(BaseModel):
     angle: confloat(gt=float("-inf"), lt=float("inf"))
 
 
-class TwoDimensionalMatrix(BaseModel):
+class TwoDimensionalMatrix(SchemaArrayModel):
     """
     Two dimensional non-empty matrix.
 
@@ -138,21 +141,26 @@ class TwoDimensionalMatrix(BaseModel):
             Each complex number is represented using a List[float] of size 2, with
             element[0] being the real part and element[1] imaginary.
             inf, -inf, and NaN are not allowable inputs for the element.
+            The matrix can also be given as a NumPy array, which must be square with a
+            power of two number of rows, and is kept as a SchemaArray; see `matrix_arrays`.
 
     Examples:
         >>> TwoDimensionalMatrix(matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]])
+        >>> TwoDimensionalMatrix(matrix=numpy.array([[0, 1], [1, 0]], dtype=complex))
     """
 
-    matrix: conlist(
+    matrix: complex_matrix(
         conlist(
-            conlist(confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2),
+            conlist(
+                conlist(confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2),
+                min_items=1,
+            ),
             min_items=1,
-        ),
-        min_items=1,
+        )
     )
 
 
-class Observable(BaseModel):
+class Observable(SchemaArrayModel):
     """
     An observable. If given list is more than one element, this is the tensor product
     of each operator in the list.
@@ -165,25 +173,43 @@ class Observable(BaseModel):
             element[0] being the real part and element[1] imaginary.
             inf, -inf, and NaN are not allowable inputs for the element.
 
+            A matrix can also be given as a NumPy array, which must be square with a
+            power of two number of rows, and is kept as a SchemaArray; see `matrix_arrays`.
+
     Examples:
         >>> Observable(observable=["x"])
         >>> Observable(observable=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]])
+        >>> Observable(observable=["x", numpy.array([[0, 1], [1, 0]], dtype=complex)])
     """
 
     observable: conlist(
         Union[
             constr(regex="(x|y|z|h|i)"),
-            conlist(
+            complex_matrix(
                 conlist(
-                    conlist(confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2),
+                    conlist(
+                        conlist(
+                            confloat(gt=float("-inf"), lt=float("inf")), min_items=2, max_items=2
+                        ),
+                        min_items=2,
+                    ),
                     min_items=2,
                 ),
-                min_items=2,
+                min_size=2,
             ),
         ],
         min_items=1,
     )
 
+    @validator("observable", each_item=True)
+    def validate_observable(cls, value):
+        """
+        Matrices kept as arrays may be checked to be Hermitian; see `check_hermitian_matrix`.
+        """
+        if isinstance(value, SchemaArray):
+            check_hermitian_matrix(value)
+        return value
+
 
 class MultiState(BaseModel):
     """
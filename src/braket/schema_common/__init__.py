@@ -11,5 +11,19 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License
 
+from braket.schema_common.json_codec import JsonCodec, get_json_codec, set_json_codec  # noqa: F401
+from braket.schema_common.schema_arrays import (  # noqa: F401
+    KeyedSchemaArray,
+    SchemaArray,
+    SchemaArrayModel,
+)
 from braket.schema_common.schema_base import BraketSchemaBase  # noqa: F401
+from braket.schema_common.schema_batch import parse_raw_schema_many  # noqa: F401
 from braket.schema_common.schema_header import BraketSchemaHeader  # noqa: F401
+from braket.schema_common.schema_metrics import (  # noqa: F401
+    OperationMetrics,
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+    reset_metrics,
+)
@@ -0,0 +1,294 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+The JSON codec used by BraketSchemaBase to decode and encode all schemas.
+
+The codec is selected with `set_json_codec`, or with the BRAKET_SCHEMAS_JSON_CODEC
+environment variable when the library is imported. The supported codecs are:
+    - "json": the standard library json module. This is the default.
+    - "orjson": orjson, which also decodes bytes-like buffers without copying them.
+    - "ujson": ujson
+    - "auto": the fastest of the above that is installed.
+If the requested codec is not installed, the next fastest installed codec is used instead.
+
+The codecs encode to equivalent JSON, but not byte for byte the same string; for example,
+orjson does not add whitespace after separators. Floats are encoded with the shortest
+representation that round-trips. Encoding falls back to the standard library for inputs
+a fast codec cannot encode, such as integers wider than 64 bits, NaN and infinite floats,
+which orjson would encode as null, or unsupported keyword arguments of `json()`. Likewise,
+decoding falls back to the standard library for documents a fast codec cannot decode,
+such as documents with the `NaN` and `Infinity` the standard library encodes.
+"""
+
+import json
+import math
+import os
+import sys
+from typing import Any, Callable, List, Optional
+
+JSON_CODEC_ENV_VAR = "BRAKET_SCHEMAS_JSON_CODEC"
+DEFAULT_JSON_CODEC = "json"
+
+
+class JsonCodec:
+    """
+    A JSON codec.
+
+    Attributes:
+        name (str): The name of the codec
+        loads (Callable[[Any], Any]): Decodes a JSON document from a str or bytes
+        dumps (Callable[..., str]): Encodes an object into a JSON string,
+            with the same signature as `json.dumps`
+        accepts_buffers (bool): Whether `loads` also accepts bytearray and memoryview
+        accepts_arrays (bool): Whether `dumps` encodes NumPy arrays of ints and floats
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Any], Any],
+        dumps: Callable[..., str],
+        accepts_buffers: bool = False,
+        accepts_arrays: bool = False,
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.accepts_buffers = accepts_buffers
+        self.accepts_arrays = accepts_arrays
+
+    def __repr__(self):
+        return f"JsonCodec(name={self.name!r})"
+
+
+def _json_codec() -> JsonCodec:
+    return JsonCodec("json", json.loads, json.dumps)
+
+
+def _array_lists(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    # The default of the json fallback of a codec which accepts arrays, where `default`
+    # may return NumPy arrays that json cannot encode
+    def array_default(obj):
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(obj, numpy.ndarray):
+            return obj.tolist()
+        if default is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return default(obj)
+
+    return array_default
+
+
+def _fallback_loads(loads: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    # Decodes with the standard library the documents the codec rejects, such as
+    # documents with NaN or Infinity
+    def fallback_loads(data):
+        try:
+            return loads(data)
+        except ValueError:
+            return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+    return fallback_loads
+
+
+def _default_value(default: Optional[Callable[[Any], Any]], value: Any) -> List[Any]:
+    if default is None:
+        return []
+    try:
+        return [default(value)]
+    except TypeError:
+        # A value the codec encodes itself, such as a datetime
+        return []
+
+
+def _has_non_finite_float(obj: Any, default: Optional[Callable[[Any], Any]]) -> bool:
+    # Whether the object holds a NaN or infinite float, including in the values `default`
+    # returns for it
+    numpy = sys.modules.get("numpy")
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, (dict, list, tuple)):
+            stack.extend(value.values() if isinstance(value, dict) else value)
+        elif numpy is not None and isinstance(value, (numpy.ndarray, numpy.generic)):
+            if value.dtype.kind in "fc" and not numpy.isfinite(value).all():
+                return True
+        elif value is not None and not isinstance(value, (str, int)):
+            stack.extend(_default_value(default, value))
+    return False
+
+
+def _encodes_non_finite_float(
+    loads: Callable[[Any], Any], encoded: bytes, obj: Any, default: Optional[Callable]
+) -> bool:
+    # orjson encodes NaN and infinite floats as null, so whether a document with a null
+    # encodes one. A document decoding back to the object has none; only documents which
+    # do not, such as those of objects encoded by `default`, are walked for them.
+    try:
+        if loads(encoded) == obj:
+            return False
+    except (TypeError, ValueError):
+        # Comparisons with NumPy arrays, whose truth value is ambiguous
+        pass
+    return _has_non_finite_float(obj, default)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    base_option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj, *, default=None, indent=None, sort_keys=False, **kwargs):
+        if kwargs or indent not in (None, 2):
+            default = _array_lists(default)
+            return json.dumps(obj, default=default, indent=indent, sort_keys=sort_keys, **kwargs)
+        option = base_option
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            encoded = orjson.dumps(obj, default=default, option=option)
+            if b"null" not in encoded or not _encodes_non_finite_float(
+                orjson.loads, encoded, obj, default
+            ):
+                return encoded.decode()
+        except TypeError:
+            pass
+        default = _array_lists(default)
+        return json.dumps(obj, default=default, indent=indent, sort_keys=sort_keys)
+
+    return JsonCodec(
+        "orjson",
+        _fallback_loads(orjson.loads),
+        dumps,
+        accepts_buffers=True,
+        accepts_arrays=True,
+    )
+
+
+def _ujson_codec() -> JsonCodec:
+    import ujson
+
+    def dumps(obj, *, default=None, indent=None, sort_keys=False, **kwargs):
+        if kwargs:
+            return json.dumps(obj, default=default, indent=indent, sort_keys=sort_keys, **kwargs)
+        try:
+            return ujson.dumps(
+                obj,
+                default=default,
+                indent=indent or 0,
+                sort_keys=sort_keys,
+                ensure_ascii=True,
+                escape_forward_slashes=False,
+            )
+        except (TypeError, OverflowError):
+            return json.dumps(obj, default=default, indent=indent, sort_keys=sort_keys)
+
+    return JsonCodec("ujson", _fallback_loads(ujson.loads), dumps)
+
+
+_CODECS = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": _json_codec,
+}
+_FASTEST_FIRST = list(_CODECS)
+
+_codec = _json_codec()
+
+
+def set_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Sets the JSON codec used to decode and encode all schemas.
+
+    Args:
+        name (Optional[str]): The name of the codec; one of "json", "orjson", "ujson" or
+            "auto". Default is None, meaning the value of the BRAKET_SCHEMAS_JSON_CODEC
+            environment variable, or "json" if it is not set.
+
+    Returns:
+        JsonCodec: The codec now in use. If the requested codec is not installed,
+        this is the next fastest codec that is.
+
+    Raises:
+        ValueError: If the name is not one of the supported codecs
+
+    Examples:
+        >>> set_json_codec("orjson")
+        >>> Program.parse_raw(program_json)
+    """
+    global _codec
+    if name is None:
+        name = os.environ.get(JSON_CODEC_ENV_VAR) or DEFAULT_JSON_CODEC
+    name = name.lower()
+    if name == "auto":
+        candidates = _FASTEST_FIRST
+    elif name in _CODECS:
+        candidates = _FASTEST_FIRST[_FASTEST_FIRST.index(name) :]
+    else:
+        raise ValueError(f"Unknown JSON codec {name}; must be one of {_FASTEST_FIRST + ['auto']}")
+    for candidate in candidates:
+        try:
+            _codec = _CODECS[candidate]()
+            return _codec
+        except ImportError:
+            continue
+
+
+def get_json_codec() -> JsonCodec:
+    """
+    Returns:
+        JsonCodec: The JSON codec used to decode and encode all schemas
+    """
+    return _codec
+
+
+def loads(data: Any) -> Any:
+    """
+    Decodes a JSON document with the current codec.
+
+    Args:
+        data (Any): The JSON document, as a str, bytes or bytearray. A memoryview is also
+            accepted; it is decoded without copying if the codec accepts buffers.
+
+    Returns:
+        Any: The decoded document
+    """
+    if isinstance(data, memoryview) and not _codec.accepts_buffers:
+        encoding = json.detect_encoding(data[:4].tobytes())
+        data = str(data, encoding, "surrogatepass")
+    return _codec.loads(data)
+
+
+def dumps(obj: Any, *, default: Optional[Callable[[Any], Any]] = None, **kwargs) -> str:
+    """
+    Encodes an object into a JSON string with the current codec.
+
+    Args:
+        obj (Any): The object to encode
+        default (Optional[Callable[[Any], Any]]): Called for objects that cannot otherwise
+            be encoded, as in `json.dumps`
+        **kwargs: Other keyword arguments of `json.dumps`
+
+    Returns:
+        str: The JSON string
+    """
+    return _codec.dumps(obj, default=default, **kwargs)
+
+
+set_json_codec()
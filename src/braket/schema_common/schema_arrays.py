@@ -0,0 +1,307 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+NumPy arrays held by the fields of schemas.
+
+NumPy is an optional dependency: it is only imported by the functions that build arrays,
+which are only called for inputs that are NumPy arrays or when an array mode that
+requires NumPy has been enabled.
+"""
+
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from braket.schema_common import json_codec
+
+
+def numpy_module() -> Any:
+    """
+    Returns:
+        module: The numpy module
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    import numpy
+
+    return numpy
+
+
+def is_ndarray(value: Any) -> bool:
+    """
+    Args:
+        value (Any): The value
+
+    Returns:
+        bool: Whether the value is a NumPy array. NumPy is not imported; if it has not
+        already been imported, the value cannot be an array.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+class SchemaArray:
+    """
+    A read-only NumPy array held by a field of a schema in place of the nested lists of
+    its JSON form. In the JSON form, complex numbers are `[real, imaginary]` pairs.
+
+    A SchemaArray is equal to another with an equal array, and to the nested lists of its
+    JSON form, so a model holding arrays is equal to the same model holding lists. It is
+    serialized directly from the array: with the orjson codec, no Python object is created
+    for the elements of the array.
+
+    Attributes:
+        array (numpy.ndarray): The array, which is not writeable
+
+    Examples:
+        >>> matrix = SchemaArray(numpy.array([[0, 1], [1, 0]], dtype=complex))
+        >>> matrix == [[[0.0, 0.0], [1.0, 0.0]], [[1.0, 0.0], [0.0, 0.0]]]
+        True
+        >>> numpy.asarray(matrix)
+        array([[0.+0.j, 1.+0.j],
+               [1.+0.j, 0.+0.j]])
+    """
+
+    __slots__ = ("array", "_hash")
+
+    def __init__(self, array: Any):
+        """
+        Args:
+            array (numpy.ndarray): The array, which is made read-only and must not be
+                modified afterwards
+        """
+        array.flags.writeable = False
+        self.array = array
+        self._hash = None
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Tuple[int, ...]: The shape of the array
+        """
+        return self.array.shape
+
+    @property
+    def dtype(self) -> Any:
+        """
+        numpy.dtype: The data type of the array
+        """
+        return self.array.dtype
+
+    def json_array(self) -> Any:
+        """
+        Returns:
+            numpy.ndarray: A C-contiguous array of the JSON form, in which complex numbers
+            are an additional last axis of `[real, imaginary]` pairs. This is a view of the
+            array if possible.
+        """
+        numpy = numpy_module()
+        array = numpy.ascontiguousarray(self.array)
+        if array.dtype.kind == "c":
+            real_type = numpy.float32 if array.dtype == numpy.complex64 else numpy.float64
+            array = array.view(real_type).reshape(array.shape + (2,))
+        return array
+
+    def tolist(self) -> List[Any]:
+        """
+        Returns:
+            List[Any]: The nested lists of the JSON form of the array
+        """
+        return self.json_array().tolist()
+
+    def json_form(self, arrays: bool = False) -> Any:
+        """
+        Args:
+            arrays (bool): Whether the JSON form may hold NumPy arrays, for codecs that
+                encode arrays themselves. Default is False.
+
+        Returns:
+            Any: The JSON form of the array: `json_array()` if `arrays` is True,
+            otherwise `tolist()`
+        """
+        return self.json_array() if arrays else self.tolist()
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        return self.array if dtype is None else self.array.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.tolist())
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.json_array()[index].tolist()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SchemaArray):
+            return self.array.shape == other.array.shape and bool((self.array == other.array).all())
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.array.shape, _canonical_bytes(self.array)))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"SchemaArray({self.array!r})"
+
+
+def _canonical_bytes(array: Any) -> bytes:
+    # Arrays of numbers are equal across data types, so they are hashed as float64, or as
+    # complex128 if they have an imaginary part, with -0.0 turned into the equal 0.0
+    if array.dtype.kind == "c" and array.imag.any():
+        return (array.astype("<c16") + 0.0).tobytes()
+    if array.dtype.kind in "biufc":
+        real = array.real if array.dtype.kind == "c" else array
+        return (real.astype("<f8") + 0.0).tobytes()
+    return array.dtype.str.encode() + array.tobytes()
+
+
+class KeyedSchemaArray(SchemaArray):
+    """
+    A SchemaArray held in place of a dict, such as the amplitudes of states, in which each
+    key maps to an item of the first axis of the array. Its JSON form is the dict of the
+    keys to the JSON forms of their items, and it is equal to that dict.
+
+    Attributes:
+        keys (Tuple[str, ...]): The keys, one for each item of the array
+
+    Examples:
+        >>> amplitudes = KeyedSchemaArray(["00", "11"], numpy.array([0.5j, -0.5]))
+        >>> amplitudes == {"00": [0.0, 0.5], "11": [-0.5, 0.0]}
+        True
+    """
+
+    __slots__ = ("keys",)
+
+    def __init__(self, keys: Sequence[str], array: Any):
+        """
+        Args:
+            keys (Sequence[str]): The keys, one for each item of the array
+            array (numpy.ndarray): The array, which is made read-only and must not be
+                modified afterwards
+
+        Raises:
+            ValueError: If the number of keys is not the length of the array
+        """
+        if len(keys) != len(array):
+            raise ValueError(f"{len(keys)} keys given for an array of length {len(array)}")
+        super().__init__(array)
+        self.keys = tuple(keys)
+
+    def json_form(self, arrays: bool = False) -> Dict[str, Any]:
+        """
+        Args:
+            arrays (bool): Whether the values of the JSON form may be NumPy arrays.
+                Default is False.
+
+        Returns:
+            Dict[str, Any]: The dict of the keys to the JSON forms of their items
+        """
+        return dict(zip(self.keys, self.json_array() if arrays else self.tolist()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys)
+
+    def __getitem__(self, key: str) -> Any:
+        return super().__getitem__(self.keys.index(key))
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return iter(self.json_form().items())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, KeyedSchemaArray):
+            return self.keys == other.keys and super().__eq__(other)
+        if isinstance(other, dict):
+            return self.json_form() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.keys, super().__hash__()))
+
+    def __repr__(self) -> str:
+        return f"KeyedSchemaArray({list(self.keys)!r}, {self.array!r})"
+
+
+def encode_array(value: SchemaArray) -> Any:
+    """
+    Encodes an array for the JSON codec, as the `default` of its `dumps`.
+
+    Args:
+        value (SchemaArray): The array
+
+    Returns:
+        Any: The JSON form of the array, holding NumPy arrays if the codec encodes them
+        itself, or nested lists otherwise
+    """
+    return value.json_form(json_codec.get_json_codec().accepts_arrays)
+
+
+ARRAY_JSON_ENCODERS = {SchemaArray: encode_array}
+"""The JSON encoders of models with fields that may hold a SchemaArray."""
+
+# Whether the dicts of models keep their arrays, for the serializers which encode them
+_keep_arrays = ContextVar("keep_arrays", default=False)
+
+
+@contextmanager
+def keeping_arrays() -> Iterator[None]:
+    """
+    Keeps the SchemaArrays in the `dict()` of the models converted within the context, for
+    serializers which encode the arrays with the JSON encoders of the models.
+    """
+    token = _keep_arrays.set(True)
+    try:
+        yield
+    finally:
+        _keep_arrays.reset(token)
+
+
+class SchemaArrayModel(BaseModel):
+    """
+    A model with fields that may hold a SchemaArray. Its `dict()` holds the nested lists of
+    the JSON forms of the arrays, so that it can be encoded by any JSON encoder, nested in
+    any model, while its `json()` encodes the arrays with its JSON encoders.
+    """
+
+    class Config:
+        # The codec encodes the arrays returned by the encoders if it accepts arrays
+        json_dumps = json_codec.dumps
+        json_encoders = ARRAY_JSON_ENCODERS
+
+    def json(self, **kwargs) -> str:
+        """
+        Serializes the model to JSON, encoding its arrays with its JSON encoders.
+
+        Args:
+            **kwargs: Keyword arguments of `pydantic.BaseModel.json`
+
+        Returns:
+            str: The JSON representation of the model
+        """
+        with keeping_arrays():
+            return super().json(**kwargs)
+
+    @classmethod
+    def _get_value(cls, v: Any, to_dict: bool, *args, **kwargs) -> Any:
+        if to_dict and isinstance(v, SchemaArray) and not _keep_arrays.get():
+            return v.json_form()
+        return super()._get_value(v, to_dict, *args, **kwargs)
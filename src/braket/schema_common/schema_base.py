@@ -12,15 +12,47 @@
 # language governing permissions and limitations under the License
 from __future__ import annotations
 
+import mmap
+import os
 import re
 from importlib import import_module
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Tuple, Type, Union
 
-from pydantic import BaseModel
+from pydantic import PrivateAttr, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.utils import ROOT_KEY
 
+from braket.schema_common import json_codec
+from braket.schema_common.json_codec import JsonCodec
+from braket.schema_common.schema_arrays import SchemaArrayModel
+from braket.schema_common.schema_construct import construct_model
+from braket.schema_common.schema_fingerprint import schema_fingerprint
 from braket.schema_common.schema_header import BraketSchemaHeader  # noqa: F401
+from braket.schema_common.schema_metrics import instrumented
+from braket.schema_common.schema_writer import write_json
 
+SCHEMA_ENTRY_POINT_GROUP = "braket.schemas"
+"""
+Entry point group for third-party schemas. Each entry point may reference either a
+BraketSchemaBase subclass or a module defining them; loading it registers the schemas.
+"""
 
-class BraketSchemaBase(BaseModel):
+RawSchemaSource = Union[str, bytes, bytearray, memoryview, mmap.mmap, os.PathLike, IO]
+"""
+The inputs accepted by the parsers of BraketSchemaBase: a JSON string, a bytes-like object
+holding the encoded JSON document, the path to a JSON file or a file object opened for reading.
+"""
+
+MMAP_THRESHOLD = 1 << 24
+"""Files of at least this many bytes are memory-mapped instead of read into memory."""
+
+_schema_registry: Dict[Tuple[str, str], Type[BraketSchemaBase]] = {}
+_entry_points_loaded = False
+
+
+class BraketSchemaBase(SchemaArrayModel):
     """
     BraketSchemaBase which includes the schema header and should be the parent class for all schemas
 
@@ -30,6 +62,63 @@ class BraketSchemaBase(BaseModel):
 
     braketSchemaHeader: BraketSchemaHeader
 
+    _LAZY_FIELDS: Tuple[str, ...] = ()
+    _lazy_values: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _fingerprint: Optional[str] = PrivateAttr(default=None)
+    # The private attributes caching values computed from the fields, which are reset
+    # when a field is assigned
+    _CACHED_ATTRIBUTES: Tuple[str, ...] = ("_fingerprint",)
+
+    class Config:
+        json_loads = json_codec.loads
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Only classes declaring their own header are registered, so that subclasses
+        # inheriting a header do not shadow the schema that defines it
+        if "braketSchemaHeader" in cls.__dict__.get("__annotations__", {}) and isinstance(
+            cls.__fields__["braketSchemaHeader"].default, BraketSchemaHeader
+        ):
+            BraketSchemaBase.register_schema(cls)
+
+    @staticmethod
+    def register_schema(schema_class: Type[BraketSchemaBase]) -> Type[BraketSchemaBase]:
+        """
+        Registers a schema class for dispatch by `parse_raw_schema`, keyed by the name and
+        version of its default schema header. Subclasses of BraketSchemaBase which declare
+        a default header are registered automatically when they are defined.
+
+        Args:
+            schema_class (Type[BraketSchemaBase]): The schema class to register
+
+        Returns:
+            Type[BraketSchemaBase]: The schema class, so this can be used as a decorator
+
+        Raises:
+            ValueError: If the schema class has no default schema header
+        """
+        header = schema_class.__fields__["braketSchemaHeader"].default
+        if not isinstance(header, BraketSchemaHeader):
+            raise ValueError(f"Schema {schema_class.__name__} has no default schema header")
+        _schema_registry[(header.name, header.version)] = schema_class
+        return schema_class
+
+    @staticmethod
+    def set_json_codec(name: Optional[str] = None) -> JsonCodec:
+        """
+        Sets the JSON codec used by `parse_raw`, `parse_raw_schema` and `json` of all schemas.
+
+        Args:
+            name (Optional[str]): The name of the codec; one of "json", "orjson", "ujson" or
+                "auto". Default is None, meaning the value of the BRAKET_SCHEMAS_JSON_CODEC
+                environment variable, or "json" if it is not set.
+
+        Returns:
+            JsonCodec: The codec now in use. If the requested codec is not installed,
+            this is the next fastest codec that is.
+        """
+        return json_codec.set_json_codec(name)
+
     @staticmethod
     def import_schema_module(schema: BraketSchemaBase):
         """
@@ -62,24 +151,457 @@ class BraketSchemaBase(BaseModel):
             )
 
     @staticmethod
-    def parse_raw_schema(json_str: str) -> BraketSchemaBase:
+    @instrumented(source_arg=0)
+    def parse_raw_schema(
+        json_str: RawSchemaSource, validate: bool = True, lazy: bool = False
+    ) -> BraketSchemaBase:
         """
         Return schema object given JSON string
 
+        The JSON string is only decoded once; the schema header is read from the
+        decoded document, which is then validated directly into the schema class.
+
+        Args:
+             json_str (RawSchemaSource): The JSON string of the schema. This can also be
+                a bytes-like object (bytes, bytearray, memoryview, mmap) holding the
+                encoded JSON, an `os.PathLike` path to a JSON file, or a file object.
+                Note that a `str` is always treated as JSON, never as a path.
+             validate (bool): Whether to validate the schema. If False, the schema is
+                built with `construct_trusted`; only use this for trusted documents,
+                such as results produced by Amazon Braket. Default is True.
+             lazy (bool): Whether to defer the validation of the lazy fields of the schema
+                until they are first accessed; see `parse_obj_lazy`. Default is False.
+
+        Returns:
+            BraketSchemaBase: The schema object. This can also be an
+            instance of a subclass of BraketSchemaBase.
+        """
+        return BraketSchemaBase.parse_obj_schema(
+            BraketSchemaBase._load_raw(json_str), validate, lazy
+        )
+
+    @staticmethod
+    @instrumented()
+    def parse_obj_schema(obj: dict, validate: bool = True, lazy: bool = False) -> BraketSchemaBase:
+        """
+        Return schema object given an already decoded JSON document
+
         Args:
-             json_str (str): The JSON string of the schema
+             obj (dict): The decoded JSON document of the schema
+             validate (bool): Whether to validate the schema. If False, the schema is
+                built with `construct_trusted`. Default is True.
+             lazy (bool): Whether to defer the validation of the lazy fields of the schema
+                until they are first accessed; see `parse_obj_lazy`. Default is False.
 
         Returns:
             BraketSchemaBase: The schema object. This can also be an
             instance of a subclass of BraketSchemaBase.
         """
-        schema = BraketSchemaBase.parse_raw(json_str)
+        schema = BraketSchemaBase.parse_obj(obj)
+        schema_class = BraketSchemaBase._get_schema_class(schema)
+        if not validate:
+            return schema_class.construct_trusted(obj)
+        if lazy:
+            return schema_class.parse_obj_lazy(obj)
+        return schema_class.parse_obj(obj)
+
+    @classmethod
+    def parse_raw_lazy(cls, b: RawSchemaSource) -> BraketSchemaBase:
+        """
+        Parses the schema from its JSON representation, deferring the validation of its lazy
+        fields until they are first accessed; see `parse_obj_lazy`.
+
+        Args:
+            b (RawSchemaSource): The JSON document of the schema
+
+        Returns:
+            BraketSchemaBase: The schema object
+        """
+        return cls.parse_obj_lazy(cls._load_raw(b))
+
+    @classmethod
+    def parse_obj_lazy(cls, obj: dict) -> BraketSchemaBase:
+        """
+        Parses the schema from a decoded JSON document, deferring the validation of the
+        fields listed in the `_LAZY_FIELDS` of the schema class. The decoded values of these
+        fields are kept as they are, and each field is validated when it is first accessed,
+        after which the validated value is cached. A validation error of a lazy field is
+        raised on access, with the same error location as when parsing eagerly.
+        All other fields are validated immediately. Serializing or comparing the schema
+        validates all remaining lazy fields, and so raises the validation error of an
+        invalid lazy field. The repr of the schema shows the decoded values of the lazy
+        fields not yet validated, and copying or pickling the schema keeps them as they
+        are, so neither validates them; only a `copy()` which includes, excludes or
+        updates fields validates them.
+
+        Args:
+            obj (dict): The decoded JSON document of the schema
+
+        Returns:
+            BraketSchemaBase: The schema object
+
+        Raises:
+            ValidationError: If any of the fields that are not lazy are invalid, or if a
+                required lazy field is missing
+
+        Examples:
+            >>> result = GateModelTaskResult.parse_obj_lazy(json.loads(result_json))
+            >>> result.taskMetadata  # validated while parsing
+            >>> result.measurements  # validated now
+        """
+        if not cls._LAZY_FIELDS or not isinstance(obj, dict):
+            return cls.parse_obj(obj)
+
+        values = {}
+        lazy_values = {}
+        errors = []
+        for name, field in cls.__fields__.items():
+            if field.alias not in obj:
+                if field.required:
+                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
+                else:
+                    values[name] = field.get_default()
+            elif name in cls._LAZY_FIELDS:
+                lazy_values[name] = obj[field.alias]
+            else:
+                value, error = field.validate(obj[field.alias], values, loc=field.alias, cls=cls)
+                if error:
+                    errors.append(error)
+                else:
+                    values[name] = value
+        if errors:
+            raise ValidationError(errors, cls)
+
+        schema = cls.__new__(cls)
+        object.__setattr__(schema, "__dict__", values)
+        object.__setattr__(
+            schema,
+            "__fields_set__",
+            {name for name, field in cls.__fields__.items() if field.alias in obj},
+        )
+        schema._init_private_attributes()
+        schema._lazy_values = lazy_values
+        return schema
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not set, such as lazy fields not yet validated
+        if not name.startswith("_") and self._lazy_values and name in self._lazy_values:
+            return self._validate_lazy_field(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _validate_lazy_field(self, name: str) -> Any:
+        raw = self._lazy_values.pop(name)
+        if name in self.__dict__:
+            # The field was assigned after parsing
+            return self.__dict__[name]
+        field = self.__fields__[name]
+        value, error = field.validate(raw, self.__dict__, loc=field.alias, cls=self.__class__)
+        if error:
+            self._lazy_values[name] = raw
+            raise ValidationError([error], self.__class__)
+        # Keep the values in field order, which serialization relies on
+        values = {**self.__dict__, name: value}
+        ordered = {key: values.pop(key) for key in self.__fields__ if key in values}
+        ordered.update(values)
+        object.__setattr__(self, "__dict__", ordered)
+        return value
+
+    def _validate_lazy_fields(self) -> None:
+        if self._lazy_values:
+            for name in list(self._lazy_values):
+                self._validate_lazy_field(name)
+
+    def _iter(self, *args, **kwargs):
+        self._validate_lazy_fields()
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self):
+        # Lazy fields not yet validated are shown as their decoded values, so that the
+        # repr of a schema with an invalid lazy field does not raise
+        args = super().__repr_args__()
+        if not self._lazy_values:
+            return args
+        values = {**self._lazy_values, **dict(args)}
+        return [(name, values[name]) for name in self.__fields__ if name in values]
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        if self._lazy_values:
+            # Each copy validates its own lazy fields
+            state["__private_attribute_values__"]["_lazy_values"] = dict(self._lazy_values)
+        return state
+
+    @classmethod
+    def construct_trusted(cls, obj: dict) -> BraketSchemaBase:
+        """
+        Builds the schema and all of its nested models from a decoded JSON document without
+        running any validation. Unlike `construct`, nested models, instructions and
+        result types are built as their model classes rather than left as dicts.
+
+        The document must be valid for the schema, for example because it was produced by
+        this library or by Amazon Braket; invalid documents result in undefined behavior.
+
+        Args:
+            obj (dict): The decoded JSON document of the schema
+
+        Returns:
+            BraketSchemaBase: The schema object
+
+        Examples:
+            >>> GateModelTaskResult.construct_trusted(json.loads(archived_result))
+        """
+        return construct_model(cls, obj)
+
+    @staticmethod
+    def _get_schema_class(schema: BraketSchemaBase) -> Type[BraketSchemaBase]:
+        header = schema.braketSchemaHeader
+        key = (header.name, header.version)
+        schema_class = _schema_registry.get(key)
+        if schema_class is not None:
+            return schema_class
+
+        global _entry_points_loaded
+        if not _entry_points_loaded:
+            _entry_points_loaded = True
+            _load_entry_point_schemas()
+            if key in _schema_registry:
+                return _schema_registry[key]
+
+        # Importing the schema module registers the schemas it defines
         module = BraketSchemaBase.import_schema_module(schema)
-        name = schema.braketSchemaHeader.name
+        if key in _schema_registry:
+            return _schema_registry[key]
 
         def capitalize_first_alpha(string):
             return re.sub("([a-z])", lambda x: x.groups()[0].upper(), string, 1)
 
-        class_name = "".join([capitalize_first_alpha(s) for s in name.split(".")[-1].split("_")])
+        class_name = "".join(
+            [capitalize_first_alpha(s) for s in header.name.split(".")[-1].split("_")]
+        )
         schema_class = getattr(module, class_name)
-        return schema_class.parse_raw(json_str)
+        _schema_registry[key] = schema_class
+        return schema_class
+
+    @classmethod
+    @instrumented()
+    def parse_obj(cls, obj: Any) -> BraketSchemaBase:
+        """
+        Parses the schema from a decoded JSON document.
+
+        Args:
+            obj (Any): The decoded JSON document of the schema
+
+        Returns:
+            BraketSchemaBase: The schema object
+        """
+        return super().parse_obj(obj)
+
+    @classmethod
+    @instrumented(source_arg=1)
+    def parse_raw(cls, b: RawSchemaSource, **kwargs) -> BraketSchemaBase:
+        """
+        Parses the schema from its JSON representation. In addition to the str and bytes
+        inputs supported by pydantic, this accepts any of the `RawSchemaSource` inputs
+        when decoding JSON.
+
+        Args:
+            b (RawSchemaSource): The JSON document of the schema
+            **kwargs: Keyword arguments of `pydantic.BaseModel.parse_raw`
+
+        Returns:
+            BraketSchemaBase: The schema object
+        """
+        if kwargs:
+            return super().parse_raw(b, **kwargs)
+        return cls.parse_obj(cls._load_raw(b))
+
+    @classmethod
+    @instrumented(source_arg=1, path_source=True)
+    def parse_file(cls, path: Union[str, Path, IO], **kwargs) -> BraketSchemaBase:
+        """
+        Parses the schema from a JSON file. Files of at least `MMAP_THRESHOLD` bytes are
+        memory-mapped, so that their contents are only copied once, into the decoded document.
+
+        Args:
+            path (Union[str, Path, IO]): The path of the JSON file or a file object
+                opened for reading
+            **kwargs: Keyword arguments of `pydantic.BaseModel.parse_file`
+
+        Returns:
+            BraketSchemaBase: The schema object
+        """
+        if kwargs:
+            return super().parse_file(path, **kwargs)
+        if isinstance(path, str):
+            path = Path(path)
+        return cls.parse_obj(cls._load_raw(path))
+
+    @instrumented(measure_output=True)
+    def json(self, **kwargs) -> str:
+        """
+        Serializes the schema to JSON.
+
+        Args:
+            **kwargs: Keyword arguments of `pydantic.BaseModel.json`
+
+        Returns:
+            str: The JSON representation of the schema
+        """
+        return super().json(**kwargs)
+
+    def write_json(self, target: Union[str, os.PathLike, IO], **kwargs) -> int:
+        """
+        Streams the JSON representation of the schema to a file, without building its
+        `dict()` representation or the whole JSON string in memory. The JSON written is the
+        same as that of `json()`.
+
+        Args:
+            target (Union[str, PathLike, IO]): The path of the file, which is overwritten,
+                or a file object opened for writing, in text or binary mode
+            **kwargs: The `by_alias`, `exclude_unset`, `exclude_defaults` and `exclude_none`
+                arguments of `json()`, and the `batch_size` of
+                `braket.schema_common.schema_writer.write_json`
+
+        Returns:
+            int: The number of characters written
+
+        Examples:
+            >>> with open("program.json", "w") as f:
+            ...     program.write_json(f)
+        """
+        return write_json(self, target, **kwargs)
+
+    def fingerprint(self) -> str:
+        """
+        Computes the canonical content fingerprint of the schema directly from its fields,
+        without serializing it to JSON; for example, the fingerprint of a Program covers its
+        gate types, qubit indices, the IEEE-754 bits of its angles and its matrices.
+        Equal schemas have the same fingerprint, regardless of how they were built, of the
+        order of their dict keys or of how their JSON was formatted.
+
+        Fingerprints are stable across versions of the library, so they can be stored and
+        used as cache keys; see `braket.schema_common.schema_fingerprint` for the canonical
+        encoding they are computed from.
+
+        The fingerprint is computed once and cached. Assigning a field, or copying the schema
+        with updated fields, resets the cache, but modifying the value of a field in place,
+        such as appending to a list, does not.
+
+        Returns:
+            str: The SHA-256 hex digest of the canonical encoding of the schema
+
+        Examples:
+            >>> Program(instructions=[H(target=0)]).fingerprint()
+            '0bcc62fa3309bc656f25ac2f94387502c3caa865151f94a45b60f1c952ecce0c'
+            >>> problem.fingerprint() == Problem.parse_raw(problem.json()).fingerprint()
+            True
+        """
+        if self._fingerprint is None:
+            self._fingerprint = schema_fingerprint(self)
+        return self._fingerprint
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._reset_cached_attributes()
+
+    def _reset_cached_attributes(self) -> None:
+        for name in self._CACHED_ATTRIBUTES:
+            object.__setattr__(self, name, None)
+
+    def copy(self, **kwargs) -> BraketSchemaBase:
+        """
+        Copies the schema. Lazy fields not yet validated are copied as they are, unless the
+        copy includes, excludes or updates fields; see `parse_obj_lazy`.
+
+        Args:
+            **kwargs: Keyword arguments of `pydantic.BaseModel.copy`
+
+        Returns:
+            BraketSchemaBase: The copy of the schema
+        """
+        if self._lazy_values and not any(
+            kwargs.get(name) for name in ("include", "exclude", "update")
+        ):
+            # The lazy fields not yet validated are copied as they are
+            deep = kwargs.get("deep", False)
+            copied = self._copy_and_set_values(
+                dict(self.__dict__), set(self.__fields_set__), deep=deep
+            )
+            if not deep:
+                copied._lazy_values = dict(self._lazy_values)
+            return copied
+        copied = super().copy(**kwargs)
+        if kwargs.get("update"):
+            copied._reset_cached_attributes()
+        return copied
+
+    @instrumented()
+    def dict(self, **kwargs) -> Dict[str, Any]:
+        """
+        Converts the schema to a dictionary.
+
+        Args:
+            **kwargs: Keyword arguments of `pydantic.BaseModel.dict`
+
+        Returns:
+            Dict[str, Any]: The fields of the schema, with nested models also converted, and
+            arrays as the nested lists of their JSON forms; see `SchemaArrayModel`
+        """
+        return super().dict(**kwargs)
+
+    @classmethod
+    def _load_raw(cls, source: RawSchemaSource) -> Any:
+        # Mirrors the decoding step of pydantic's parse_raw, including wrapping
+        # decoding errors into a ValidationError
+        try:
+            if isinstance(source, (str, bytes, bytearray)):
+                return cls.__config__.json_loads(source)
+            if isinstance(source, os.PathLike):
+                with open(source, "rb") as f:
+                    return cls._load_file(f)
+            if hasattr(source, "read"):
+                return cls._load_file(source)
+            return cls._load_buffer(source)
+        except (ValueError, TypeError, UnicodeDecodeError) as e:
+            raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], cls)
+
+    @classmethod
+    def _load_file(cls, f: IO) -> Any:
+        if "b" in getattr(f, "mode", ""):
+            try:
+                fileno = f.fileno()
+                size = os.fstat(fileno).st_size
+            except (AttributeError, OSError):
+                size = 0
+            if size >= MMAP_THRESHOLD:
+                offset = f.tell()
+                # Every view of the map is released explicitly, since a traceback of a
+                # decoding error still refers to them and the map cannot be closed while
+                # they are exported
+                with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view, view[offset:] as sliced:
+                        return cls._load_buffer(sliced)
+        return cls.__config__.json_loads(f.read())
+
+    @classmethod
+    def _load_buffer(cls, buffer: Union[memoryview, mmap.mmap]) -> Any:
+        with memoryview(buffer) as view:
+            return cls.__config__.json_loads(view)
+
+
+def _load_entry_point_schemas() -> None:
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # pragma: no cover
+        # importlib.metadata is not available in Python 3.7
+        return
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        group = eps.select(group=SCHEMA_ENTRY_POINT_GROUP)
+    else:  # pragma: no cover
+        group = eps.get(SCHEMA_ENTRY_POINT_GROUP, [])
+    for entry_point in group:
+        loaded = entry_point.load()
+        if isinstance(loaded, type) and issubclass(loaded, BraketSchemaBase):
+            BraketSchemaBase.register_schema(loaded)
@@ -0,0 +1,126 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
+
+from braket.schema_common.schema_base import BraketSchemaBase
+
+
+def parse_raw_schema_many(
+    documents: Iterable[Union[str, bytes]],
+    *,
+    executor: Optional[Executor] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    return_exceptions: bool = False,
+) -> List[Union[BraketSchemaBase, Exception]]:
+    """
+    Parses many JSON documents with `BraketSchemaBase.parse_raw_schema`, preserving input order.
+
+    Documents are parsed serially unless an executor or a number of workers is given,
+    in which case they are sent to the executor in chunks of `chunksize` documents
+    to amortize the cost of transferring them between processes.
+
+    Args:
+        documents (Iterable[Union[str, bytes]]): The JSON documents of the schemas
+        executor (Optional[Executor]): Executor used to parse the chunks of documents.
+            The executor is not shut down after parsing. If `return_exceptions` is False,
+            the chunks not yet started are cancelled once a document fails to parse.
+            Default is None.
+        workers (Optional[int]): If no executor is given, the number of processes of the
+            process pool created to parse the documents. Default is None, meaning
+            documents are parsed serially unless an executor is given.
+        chunksize (int): The number of documents sent to the executor at a time.
+            Default is 64.
+        return_exceptions (bool): If True, the exception raised while parsing a document
+            is returned in place of its schema instead of being raised, so that one
+            invalid document does not abort the batch. Default is False.
+
+    Returns:
+        List[Union[BraketSchemaBase, Exception]]: The schema objects, in the order of the
+        input documents. If `return_exceptions` is True, this also contains the
+        exceptions raised for invalid documents.
+
+    Raises:
+        ValueError: If `chunksize` or `workers` is less than 1
+
+    Examples:
+        >>> parse_raw_schema_many(json_strings, workers=4, return_exceptions=True)
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, not {chunksize}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, not {workers}")
+
+    if executor is None and workers is None:
+        results = _parse_chunk(documents, return_exceptions)
+    elif executor is not None:
+        results = _parse_with_executor(executor, documents, chunksize, return_exceptions)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = _parse_with_executor(pool, documents, chunksize, return_exceptions)
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+    return results
+
+
+def _parse_with_executor(
+    executor: Executor,
+    documents: Iterable[Union[str, bytes]],
+    chunksize: int,
+    return_exceptions: bool,
+) -> List[Union[BraketSchemaBase, Exception]]:
+    results = []
+    futures = [
+        executor.submit(_parse_chunk, chunk, return_exceptions)
+        for chunk in _chunked(documents, chunksize)
+    ]
+    try:
+        for future in futures:
+            chunk = future.result()
+            results.extend(chunk)
+            if not return_exceptions and chunk and isinstance(chunk[-1], Exception):
+                # The caller raises this error, so the chunks not yet parsed are not needed
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+    return results
+
+
+def _parse_chunk(
+    documents: Iterable[Union[str, bytes]], return_exceptions: bool
+) -> List[Union[BraketSchemaBase, Exception]]:
+    results = []
+    for document in documents:
+        try:
+            results.append(BraketSchemaBase.parse_raw_schema(document))
+        except Exception as e:
+            results.append(e)
+            if not return_exceptions:
+                # The caller raises the first error, so the rest of the chunk can be skipped
+                break
+    return results
+
+
+def _chunked(documents: Iterable[Union[str, bytes]], chunksize: int) -> Iterator[list]:
+    iterator = iter(documents)
+    chunk = list(islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
@@ -0,0 +1,222 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Recursive construction of models from trusted, already valid documents.
+
+pydantic's construct() only sets the top-level fields, leaving nested models as dicts.
+The converters built here walk the field types of a model once and build the full tree
+of nested models without running any validators. Values are taken as they are, except for:
+    - nested models, which are constructed recursively
+    - enums, which are converted from their values
+    - integer dict keys, which are converted from the strings JSON requires for keys
+    - floats, which are converted from the ints JSON does not tell apart from them
+    - datetimes, dates, times and timedeltas, which are parsed from their JSON strings
+    - tuples, which are converted from the lists of JSON
+    - unions of models, which are resolved from the schema header or the "type" value
+    - fields listed in the `_TYPE_DISPATCH` attribute of a model, which maps the field
+      name to a lookup of the model class to use given the "type" value of each item
+    - custom field types with a `construct_trusted` class method, which converts the
+      values of the type
+"""
+
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from functools import lru_cache
+from inspect import isclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+from pydantic.datetime_parse import parse_date, parse_datetime, parse_duration, parse_time
+from pydantic.fields import SHAPE_SINGLETON
+from pydantic.typing import get_args, get_origin
+
+_Converter = Optional[Callable[[Any], Any]]
+
+
+def construct_model(model_class: Type[BaseModel], obj: Dict[str, Any]) -> BaseModel:
+    """
+    Constructs a model and all of its nested models from a decoded document
+    without validating it.
+
+    Args:
+        model_class (Type[BaseModel]): The class of the model
+        obj (Dict[str, Any]): The decoded document, which must be valid for the model
+
+    Returns:
+        BaseModel: The model
+    """
+    return _model_converter(model_class)(obj)
+
+
+@lru_cache(maxsize=None)
+def _model_converter(model_class: Type[BaseModel]) -> Callable[[Any], Any]:
+    dispatch = getattr(model_class, "_TYPE_DISPATCH", {})
+    fields = []
+    for name, field in model_class.__fields__.items():
+        if name in dispatch:
+            converter = _dispatch_converter(dispatch[name], field.shape == SHAPE_SINGLETON)
+        else:
+            converter = _type_converter(field.outer_type_)
+        fields.append((name, field.alias, converter))
+
+    def convert(value):
+        if not isinstance(value, dict):
+            return value
+        values = {}
+        for name, alias, converter in fields:
+            if alias in value:
+                item = value[alias]
+                values[name] = item if converter is None or item is None else converter(item)
+        return model_class.construct(_fields_set=set(values), **values)
+
+    return convert
+
+
+def _type_converter(type_: Any) -> _Converter:
+    origin = get_origin(type_)
+    if origin is Union:
+        return _union_converter(get_args(type_))
+    if origin is list:
+        args = get_args(type_)
+        item_converter = _type_converter(args[0]) if args else None
+        if item_converter is None:
+            return None
+        return lambda value: [item if item is None else item_converter(item) for item in value]
+    if origin is tuple:
+        return _tuple_converter(get_args(type_))
+    if origin is dict:
+        args = get_args(type_)
+        key_converter = _key_converter(args[0]) if args else None
+        value_converter = _type_converter(args[1]) if args else None
+        if key_converter is None and value_converter is None:
+            return None
+        key_converter = key_converter or _identity
+        value_converter = value_converter or _identity
+        return lambda value: {
+            key_converter(key): item if item is None else value_converter(item)
+            for key, item in value.items()
+        }
+    if isclass(type_):
+        return _class_converter(type_)
+    return None
+
+
+def _class_converter(type_: type) -> _Converter:
+    if issubclass(type_, BaseModel):
+        return _model_converter(type_)
+    if issubclass(type_, Enum):
+        return type_
+    if issubclass(type_, float):
+        return _float
+    # datetime before date, of which it is a subclass
+    for time_type, parse in _TIME_PARSERS:
+        if issubclass(type_, time_type):
+            return parse
+    return getattr(type_, "construct_trusted", None)
+
+
+def _tuple_converter(args: tuple) -> Callable[[Any], Any]:
+    if not args:
+        return tuple
+    if len(args) == 2 and args[1] is Ellipsis:
+        item_converter = _type_converter(args[0]) or _identity
+        return lambda value: tuple(item if item is None else item_converter(item) for item in value)
+    converters = [_type_converter(arg) or _identity for arg in args]
+    return lambda value: tuple(
+        item if item is None else converter(item) for converter, item in zip(converters, value)
+    )
+
+
+def _key_converter(type_: Any) -> _Converter:
+    if isclass(type_) and issubclass(type_, int) and not issubclass(type_, (bool, Enum)):
+        return int
+    return _type_converter(type_)
+
+
+def _union_converter(members: tuple) -> _Converter:
+    models = [member for member in members if isclass(member) and issubclass(member, BaseModel)]
+    if not models:
+        return None
+    by_header, by_type = _union_lookups(models)
+    required = [
+        ({name for name, field in model.__fields__.items() if field.required}, model)
+        for model in models
+    ]
+
+    def convert(value):
+        if not isinstance(value, dict):
+            return value
+        converter = None
+        header = value.get("braketSchemaHeader")
+        if isinstance(header, dict):
+            converter = by_header.get((header.get("name"), header.get("version")))
+        if converter is None and "type" in value:
+            converter = by_type.get(_enum_value(value["type"]))
+        if converter is None:
+            # Fall back to the first model whose required fields are all present
+            model = next((model for names, model in required if names <= value.keys()), None)
+            if model is None:
+                return value
+            converter = _model_converter(model)
+        return converter(value)
+
+    return convert
+
+
+def _union_lookups(models: list) -> Tuple[Dict[Tuple[str, str], Callable], Dict[Any, Callable]]:
+    by_header = {}
+    by_type = {}
+    for model in models:
+        converter = _model_converter(model)
+        header_field = model.__fields__.get("braketSchemaHeader")
+        if header_field is not None and header_field.default is not None:
+            header = header_field.default
+            by_header[(header.name, header.version)] = converter
+        type_field = model.__fields__.get("type")
+        if type_field is not None and type_field.default is not None:
+            by_type[_enum_value(type_field.default)] = converter
+    return by_header, by_type
+
+
+def _dispatch_converter(lookup: Dict[Any, Type[BaseModel]], singleton: bool) -> Callable:
+    converters = {_enum_value(key): _model_converter(model) for key, model in lookup.items()}
+
+    def convert_item(item):
+        if not isinstance(item, dict):
+            return item
+        return converters[_enum_value(item["type"])](item)
+
+    if singleton:
+        return convert_item
+    return lambda value: [convert_item(item) for item in value]
+
+
+def _float(value: Any) -> Any:
+    return float(value) if type(value) is int else value
+
+
+_TIME_PARSERS = (
+    (datetime, parse_datetime),
+    (date, parse_date),
+    (time, parse_time),
+    (timedelta, parse_duration),
+)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -0,0 +1,243 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Canonical content fingerprints of models, computed directly from their fields.
+
+The fingerprint is the SHA-256 digest, in hex, of a canonical binary encoding of the model.
+Version 1 of the encoding, which starts with the bytes `b"braket-fingerprint\\x00\\x01"`,
+encodes each value with a one byte tag followed by its content, in little-endian order:
+    - None: `N`; True: `T`; False: `F`
+    - int: `I` and the 8 byte two's complement value, or `L`, the length of its decimal
+      digits as 8 bytes and the digits, for ints outside the 64-bit range
+    - float: `D` and the 8 bytes of its IEEE-754 double, with -0.0 encoded as 0.0
+    - str, including the values of enums: `S`, the length of its UTF-8 encoding as 8 bytes
+      and the encoding
+    - list or tuple: `[`, the number of items as 8 bytes and the items
+    - dict: `{`, the number of items as 8 bytes and the items, each encoded as its key
+      then its value, ordered by the encoding of their keys
+    - datetime: `Z`, date: `Y`, time: `H`, each followed by the length of its ISO 8601
+      form as 8 bytes and the form, as given by `isoformat`; datetimes and times with a
+      time zone are first converted to UTC
+    - SchemaArray: the nested lists of its JSON form, or the dict of a KeyedSchemaArray
+    - model: `M`, the number of fields that are not None as 8 bytes and these fields, each
+      encoded as the name of the field (a str) then its value, ordered by field name
+
+The encoding does not depend on the order of fields or of dict keys, or on how floats are
+formatted in JSON, so equal models have the same fingerprint. Fields that are None are
+left out, so that adding an optional field to a model does not change the fingerprints of
+existing models. This encoding will not change between versions of the library; a change
+would be a new version of the encoding, with a different prefix.
+"""
+
+import hashlib
+import struct
+from datetime import date, datetime, time, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from pydantic import BaseModel
+
+from braket.schema_common.schema_arrays import KeyedSchemaArray, SchemaArray, numpy_module
+
+FINGERPRINT_VERSION = 1
+"""The version of the canonical encoding of fingerprints."""
+
+_PREFIX = b"braket-fingerprint\x00" + bytes([FINGERPRINT_VERSION])
+_FLUSH_SIZE = 1 << 12
+_pack_count = struct.Struct("<Q").pack
+_pack_int = struct.Struct("<q").pack
+_pack_float = struct.Struct("<d").pack
+_ANY_DATE = date(2000, 1, 1)
+
+
+class _Encoder:
+    def __init__(self):
+        self.digest = hashlib.sha256(_PREFIX)
+        self.parts: List[bytes] = []
+        self._encoders: Dict[type, Callable[[Any], None]] = {
+            type(None): self._none,
+            bool: self._bool,
+            int: self._int,
+            float: self._float,
+            str: self._str,
+            list: self._sequence,
+            tuple: self._sequence,
+            dict: self._mapping,
+            # datetime before date, of which it is a subclass
+            datetime: self._datetime,
+            date: self._date,
+            time: self._time,
+            SchemaArray: self._array,
+            KeyedSchemaArray: self._keyed_array,
+        }
+        self._model_fields: Dict[Type[BaseModel], Tuple[Tuple[str, bytes], ...]] = {}
+
+    def encode(self, value: Any) -> None:
+        encoder = self._encoders.get(type(value))
+        if encoder is None:
+            encoder = self._subclass_encoder(type(value))
+        encoder(value)
+        if len(self.parts) >= _FLUSH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        self.digest.update(b"".join(self.parts))
+        self.parts.clear()
+
+    def _subclass_encoder(self, value_type: type) -> Callable[[Any], None]:
+        if issubclass(value_type, BaseModel):
+            encoder = self._model
+        elif issubclass(value_type, Enum):
+            encoder = self._enum
+        else:
+            for base, base_encoder in list(self._encoders.items()):
+                if issubclass(value_type, base):
+                    encoder = base_encoder
+                    break
+            else:
+                raise TypeError(f"Cannot fingerprint value of type {value_type.__name__}")
+        self._encoders[value_type] = encoder
+        return encoder
+
+    def _none(self, value: None) -> None:
+        self.parts.append(b"N")
+
+    def _bool(self, value: bool) -> None:
+        self.parts.append(b"T" if value else b"F")
+
+    def _int(self, value: int) -> None:
+        try:
+            self.parts.append(b"I" + _pack_int(value))
+        except struct.error:
+            digits = str(int(value)).encode()
+            self.parts.append(b"L" + _pack_count(len(digits)) + digits)
+
+    def _float(self, value: float) -> None:
+        # Adding 0.0 turns -0.0 into 0.0, which is equal to it
+        self.parts.append(b"D" + _pack_float(value + 0.0))
+
+    def _str(self, value: str) -> None:
+        encoded = str.encode(value)
+        self.parts.append(b"S" + _pack_count(len(encoded)) + encoded)
+
+    def _iso_format(self, tag: bytes, value: str) -> None:
+        encoded = str.encode(value)
+        self.parts.append(tag + _pack_count(len(encoded)) + encoded)
+
+    def _datetime(self, value: datetime) -> None:
+        # Datetimes with a time zone are equal if they are the same time in UTC
+        if value.utcoffset() is not None:
+            value = value.astimezone(timezone.utc)
+        self._iso_format(b"Z", value.isoformat())
+
+    def _date(self, value: date) -> None:
+        self._iso_format(b"Y", value.isoformat())
+
+    def _time(self, value: time) -> None:
+        offset = value.utcoffset()
+        if offset is not None:
+            utc = datetime.combine(_ANY_DATE, value.replace(tzinfo=None)) - offset
+            value = utc.time().replace(tzinfo=timezone.utc)
+        self._iso_format(b"H", value.isoformat())
+
+    def _enum(self, value: Enum) -> None:
+        self.encode(value.value)
+
+    def _sequence(self, value: list) -> None:
+        self.parts.append(b"[" + _pack_count(len(value)))
+        for item in value:
+            self.encode(item)
+
+    def _mapping(self, value: dict) -> None:
+        parts = self.parts
+        items = []
+        for key, item in value.items():
+            # Keys are encoded on their own, to be sorted by their encoding
+            self.parts = []
+            self.encode(key)
+            items.append((b"".join(self.parts), item))
+        self.parts = parts
+        items.sort(key=lambda encoded_item: encoded_item[0])
+        self.parts.append(b"{" + _pack_count(len(items)))
+        for encoded_key, item in items:
+            self.parts.append(encoded_key)
+            self.encode(item)
+
+    def _array(self, value: SchemaArray) -> None:
+        array = value.json_array()
+        if array.size == 0 or array.dtype.kind not in "iuf" or array.dtype == "uint64":
+            # Unsigned 64-bit ints may not fit the encoding of ints in 64 bits
+            self._sequence(array.tolist())
+            return
+        # The encoding of the nested lists is written into a structured array, one nested
+        # structure per axis, so that no Python object is created for the elements
+        numpy = numpy_module()
+        if array.dtype.kind == "f":
+            dtype = numpy.dtype([("tag", "S1"), ("value", "<f8")])
+            tag, values = b"D", array.astype("<f8") + 0.0
+        else:
+            dtype = numpy.dtype([("tag", "S1"), ("value", "<i8")])
+            tag, values = b"I", array.astype("<i8")
+        for size in reversed(array.shape):
+            dtype = numpy.dtype([("open", "S1"), ("count", "<u8"), ("items", dtype, (size,))])
+        encoded = numpy.zeros((), dtype=dtype)
+        level = encoded
+        for size in array.shape:
+            level["open"] = b"["
+            level["count"] = size
+            level = level["items"]
+        level["tag"] = tag
+        level["value"] = values
+        self.parts.append(encoded.tobytes())
+
+    def _keyed_array(self, value: KeyedSchemaArray) -> None:
+        self._mapping(value.json_form())
+
+    def _model(self, value: BaseModel) -> None:
+        fields = self._model_fields.get(type(value))
+        if fields is None:
+            fields = tuple(
+                (name, b"S" + _pack_count(len(name.encode())) + name.encode())
+                for name in sorted(type(value).__fields__)
+            )
+            self._model_fields[type(value)] = fields
+        values = value.__dict__
+        present = [(encoded, values[name]) for name, encoded in fields if values[name] is not None]
+        self.parts.append(b"M" + _pack_count(len(present)))
+        for encoded_name, field_value in present:
+            self.parts.append(encoded_name)
+            self.encode(field_value)
+
+
+def schema_fingerprint(model: BaseModel) -> str:
+    """
+    Computes the canonical content fingerprint of a model from its fields, without
+    serializing it to JSON. See the module documentation for the canonical encoding.
+
+    Args:
+        model (BaseModel): The model
+
+    Returns:
+        str: The SHA-256 hex digest of the canonical encoding of the model
+
+    Raises:
+        TypeError: If the model has a value which is not None, a bool, int, float, str,
+            enum, list, tuple, dict, datetime, date, time, SchemaArray or model
+    """
+    if hasattr(model, "_validate_lazy_fields"):
+        model._validate_lazy_fields()
+    encoder = _Encoder()
+    encoder.encode(model)
+    encoder.flush()
+    return encoder.digest.hexdigest()
@@ -0,0 +1,237 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Opt-in instrumentation of the parsers and serializers of BraketSchemaBase.
+
+When enabled with `enable_metrics`, every call of an instrumented method records, under the
+schema class it parsed or serialized and the name of the method, its wall time and the size
+of its JSON input or output. Only the outermost instrumented call is recorded, so that the
+time of `parse_raw_schema` is not also counted under the `parse_obj` it calls. When disabled,
+which is the default, an instrumented call costs a single check of a global.
+"""
+
+import mmap
+import os
+import threading
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isclass, signature
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class OperationMetrics(NamedTuple):
+    """
+    The metrics of calls to one method of one schema class.
+
+    Attributes:
+        calls (int): The number of calls
+        errors (int): The number of calls that raised an exception
+        seconds (float): The total wall time of the calls
+        input_bytes (int): The total size of the JSON documents parsed; 0 for
+            methods that do not parse JSON, such as `parse_obj`
+        output_bytes (int): The total size of the JSON documents serialized; 0 for
+            methods that do not produce JSON, such as `dict`
+    """
+
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    input_bytes: int = 0
+    output_bytes: int = 0
+
+    def __add__(self, other: "OperationMetrics") -> "OperationMetrics":
+        return OperationMetrics(*(a + b for a, b in zip(self, other)))
+
+
+MetricsExporter = Callable[[str, str, OperationMetrics], None]
+"""
+Called with the qualified name of the schema class, the name of the method and the
+metrics of a single call, after each recorded call.
+"""
+
+_enabled = False
+_exporter: Optional[MetricsExporter] = None
+_metrics: Dict[str, Dict[str, OperationMetrics]] = {}
+_lock = threading.Lock()
+_in_call: ContextVar[bool] = ContextVar("braket_schema_metrics_in_call", default=False)
+
+
+def enable_metrics(exporter: Optional[MetricsExporter] = None) -> None:
+    """
+    Starts recording the calls to the parsers and serializers of all schemas.
+
+    Args:
+        exporter (Optional[MetricsExporter]): Called after each recorded call with the
+            qualified name of the schema class, the name of the method and the metrics of
+            the call, for example to forward them to a metrics system. The exporter is
+            called on the thread that made the call, so it should be fast. Default is None.
+
+    Examples:
+        >>> enable_metrics(lambda schema, method, metrics: statsd.timing(
+        ...     f"braket.{method}", metrics.seconds, tags=[f"schema:{schema}"]
+        ... ))
+    """
+    global _enabled, _exporter
+    _exporter = exporter
+    _enabled = True
+
+
+def disable_metrics() -> None:
+    """
+    Stops recording calls. The metrics recorded so far are kept until `reset_metrics`.
+    """
+    global _enabled, _exporter
+    _enabled = False
+    _exporter = None
+
+
+def get_metrics() -> Dict[str, Dict[str, OperationMetrics]]:
+    """
+    Returns:
+        Dict[str, Dict[str, OperationMetrics]]: A snapshot of the metrics recorded so far,
+        keyed by the qualified name of the schema class and then by the name of the method
+
+    Examples:
+        >>> get_metrics()["braket.ir.jaqcd.program_v1.Program"]["parse_raw_schema"].seconds
+    """
+    with _lock:
+        return {name: dict(methods) for name, methods in _metrics.items()}
+
+
+def reset_metrics() -> None:
+    """
+    Discards the metrics recorded so far.
+    """
+    with _lock:
+        _metrics.clear()
+
+
+def instrumented(
+    source_arg: Optional[int] = None, path_source: bool = False, measure_output: bool = False
+) -> Callable:
+    """
+    Instruments a method of BraketSchemaBase.
+
+    Args:
+        source_arg (Optional[int]): The index of the argument holding the JSON document
+            parsed by the method, if any, which may also be passed by keyword. Default is None.
+        path_source (bool): Whether a str source is the path of the JSON file rather than
+            the JSON document itself. Default is False.
+        measure_output (bool): Whether the method returns a JSON string whose size is
+            recorded. Default is False.
+
+    Returns:
+        Callable: The decorator
+    """
+
+    def decorator(method: Callable) -> Callable:
+        source_name = None
+        if source_arg is not None:
+            source_name = list(signature(method).parameters)[source_arg]
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            if not _enabled or _in_call.get():
+                return method(*args, **kwargs)
+            input_bytes = 0
+            if source_name is not None:
+                source = args[source_arg] if len(args) > source_arg else kwargs.get(source_name)
+                input_bytes = _size(
+                    Path(source) if path_source and isinstance(source, str) else source
+                )
+            token = _in_call.set(True)
+            start = perf_counter()
+            result = None
+            error = False
+            try:
+                result = method(*args, **kwargs)
+                return result
+            except Exception:
+                error = True
+                raise
+            finally:
+                seconds = perf_counter() - start
+                _in_call.reset(token)
+                _record(
+                    _schema_class_name(args, result),
+                    method.__name__,
+                    OperationMetrics(
+                        1,
+                        int(error),
+                        seconds,
+                        input_bytes,
+                        _size(result) if measure_output and not error else 0,
+                    ),
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def _record(schema: str, method: str, metrics: OperationMetrics) -> None:
+    with _lock:
+        methods = _metrics.setdefault(schema, {})
+        methods[method] = methods.get(method, OperationMetrics()) + metrics
+    exporter = _exporter
+    if exporter is not None:
+        exporter(schema, method, metrics)
+
+
+def _schema_class_name(args: tuple, result: Any) -> str:
+    # The class of the parsed schema, which for parse_raw_schema is only known from the result
+    if result is not None and hasattr(result, "__fields__"):
+        schema_class = type(result)
+    elif args and isclass(args[0]):
+        schema_class = args[0]
+    elif args and hasattr(args[0], "__fields__"):
+        schema_class = type(args[0])
+    else:
+        from braket.schema_common.schema_base import BraketSchemaBase
+
+        schema_class = BraketSchemaBase
+    return f"{schema_class.__module__}.{schema_class.__qualname__}"
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, str):
+        # isascii is constant time for str
+        return len(value) if value.isascii() else len(value.encode("utf-8", "surrogatepass"))
+    if isinstance(value, (bytes, bytearray, mmap.mmap)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, os.PathLike):
+        try:
+            return os.path.getsize(value)
+        except OSError:
+            return 0
+    return _file_size(value)
+
+
+def _file_size(f: Any) -> int:
+    # The size of the rest of a file object, which is what is parsed from it
+    try:
+        position = f.tell()
+        try:
+            size = os.fstat(f.fileno()).st_size
+        except OSError:
+            # In-memory files such as BytesIO have no file descriptor
+            size = f.seek(0, os.SEEK_END)
+            f.seek(position)
+        return size - position
+    except (AttributeError, OSError, ValueError):
+        return 0
@@ -0,0 +1,183 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Streams the JSON representation of a model to a file without building it in memory.
+
+The fields of the model and of its nested models are written one at a time, and lists
+and dicts are written in batches of items, so only one batch of a list is converted and
+encoded at a time. The JSON written is the same as that of `json()` with the same
+arguments, for every JSON codec.
+"""
+
+import io
+import os
+from itertools import islice
+from typing import IO, Any, Callable, Dict, Union
+
+from pydantic import BaseModel
+
+from braket.schema_common import json_codec
+from braket.schema_common.schema_arrays import keeping_arrays
+
+WRITE_BATCH_SIZE = 1000
+"""The number of items of a list or dict encoded at a time."""
+
+WRITE_CHUNK_SIZE = 1 << 16
+"""The number of characters buffered before they are written to the file."""
+
+
+class _JsonWriter:
+    def __init__(
+        self,
+        write: Callable[[str], None],
+        default: Callable[[Any], Any],
+        options: Dict[str, bool],
+        batch_size: int,
+    ):
+        self._write = write
+        self._default = default
+        self._options = options
+        self._batch_size = batch_size
+        # The separators of the codec, which differ between codecs
+        sample = json_codec.dumps({"a": [0, 0]})
+        self._key_separator = sample[sample.index('"a"') + 3 : sample.index("[")]
+        self._item_separator = sample[sample.index("0") + 1 : sample.rindex("0")]
+
+    def _encode(self, value: Any) -> str:
+        return json_codec.dumps(value, default=self._default)
+
+    def _plain(self, value: Any) -> Any:
+        return value.dict(**self._options) if isinstance(value, BaseModel) else value
+
+    def value(self, value: Any) -> None:
+        if isinstance(value, BaseModel):
+            self.model(value)
+        elif isinstance(value, (list, tuple)):
+            self.sequence(value)
+        elif isinstance(value, dict):
+            self.mapping(value)
+        else:
+            self._write(self._encode(value))
+
+    def model(self, model: BaseModel) -> None:
+        self._write("{")
+        separator = ""
+        for key, value in model._iter(to_dict=False, **self._options):
+            self._write(separator + self._encode(key) + self._key_separator)
+            self.value(value)
+            separator = self._item_separator
+        self._write("}")
+
+    def sequence(self, items: Union[list, tuple]) -> None:
+        self._write("[")
+        separator = ""
+        for start in range(0, len(items), self._batch_size):
+            batch = [self._plain(item) for item in items[start : start + self._batch_size]]
+            # The items of the encoded batch, without its brackets
+            self._write(separator + self._encode(batch)[1:-1])
+            separator = self._item_separator
+        self._write("]")
+
+    def mapping(self, items: dict) -> None:
+        self._write("{")
+        separator = ""
+        iterator = iter(items.items())
+        while True:
+            batch = {key: self._plain(item) for key, item in islice(iterator, self._batch_size)}
+            if not batch:
+                break
+            self._write(separator + self._encode(batch)[1:-1])
+            separator = self._item_separator
+        self._write("}")
+
+
+def write_json(
+    model: BaseModel,
+    target: Union[str, os.PathLike, IO],
+    *,
+    by_alias: bool = False,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+    exclude_none: bool = False,
+    batch_size: int = WRITE_BATCH_SIZE,
+) -> int:
+    """
+    Streams the JSON representation of a model to a file. The JSON is the same as that of
+    `model.json()` with the same arguments, but the `dict()` representation of the model is
+    never built; only one batch of each list or dict is converted and encoded at a time.
+
+    Args:
+        model (BaseModel): The model
+        target (Union[str, PathLike, IO]): The path of the file, which is overwritten,
+            or a file object opened for writing, in text or binary mode. Binary files
+            are written in UTF-8.
+        by_alias (bool): Whether to use the aliases of fields as keys. Default is False.
+        exclude_unset (bool): Whether to exclude fields that were not set. Default is False.
+        exclude_defaults (bool): Whether to exclude fields equal to their default.
+            Default is False.
+        exclude_none (bool): Whether to exclude fields that are None. Default is False.
+        batch_size (int): The number of items of a list or dict encoded at a time.
+            Default is `WRITE_BATCH_SIZE`.
+
+    Returns:
+        int: The number of characters written
+
+    Examples:
+        >>> with open("result.json", "w") as f:
+        ...     write_json(result, f)
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8") as f:
+            return write_json(
+                model,
+                f,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                batch_size=batch_size,
+            )
+    binary = isinstance(target, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(
+        target, "mode", ""
+    )
+    parts = []
+    buffered = 0
+    written = 0
+
+    def flush():
+        nonlocal buffered, written
+        chunk = "".join(parts)
+        parts.clear()
+        buffered = 0
+        written += len(chunk)
+        target.write(chunk.encode() if binary else chunk)
+
+    def write(part):
+        nonlocal buffered
+        parts.append(part)
+        buffered += len(part)
+        if buffered >= WRITE_CHUNK_SIZE:
+            flush()
+
+    options = {
+        "by_alias": by_alias,
+        "exclude_unset": exclude_unset,
+        "exclude_defaults": exclude_defaults,
+        "exclude_none": exclude_none,
+    }
+    # The arrays of the nested models are encoded by the encoder of the model, as in `json()`
+    with keeping_arrays():
+        _JsonWriter(write, model.__json_encoder__, options, batch_size).model(model)
+    flush()
+    return written
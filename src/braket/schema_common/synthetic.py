@@ -0,0 +1,758 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Deterministic synthetic documents of the Braket schemas, for load tests and benchmarks.
+
+Each generator returns a SyntheticDocument, which generates the document from its seed on
+demand: as a schema object with `build`, as a dict with `document`, or streamed straight to
+a JSON file with `write`. Writing holds only one item of the large lists of the document in
+memory at a time, so files of any size can be produced. The same seed always produces the
+same document, however it is consumed.
+
+Examples:
+    >>> from braket.schema_common import synthetic
+    >>> synthetic.program(1_000_000, qubits=40, seed=7).write("program.json")
+    >>> result = synthetic.gate_model_task_result(shots=1000, qubits=10).build()
+"""
+
+import cmath
+import io
+import json
+import math
+import os
+import random
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from braket.schema_common.schema_base import BraketSchemaBase
+
+DEFAULT_GATE_MIX = {
+    "h": 0.15,
+    "x": 0.05,
+    "rx": 0.1,
+    "ry": 0.1,
+    "rz": 0.2,
+    "cnot": 0.2,
+    "cz": 0.05,
+    "swap": 0.05,
+    "ccnot": 0.05,
+    "unitary": 0.05,
+}
+"""The relative frequencies of the instructions of `program`, by instruction type."""
+
+_WRITE_BUFFER_ITEMS = 4096
+
+
+class _Stream:
+    # A lazily generated list, or dict if `mapping` is True, of the values of `items`
+    def __init__(self, items: Iterator, mapping: bool = False):
+        self.items = items
+        self.mapping = mapping
+
+
+class SyntheticDocument:
+    """
+    A synthetic JSON document of a schema, generated on demand from a seed.
+
+    Attributes:
+        seed (int): The seed of the document
+    """
+
+    def __init__(self, generate: Callable[[random.Random], Dict[str, Any]], seed: int):
+        self._generate = generate
+        self.seed = seed
+
+    def _root(self) -> Dict[str, Any]:
+        return self._generate(random.Random(self.seed))
+
+    def document(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: The document, with all of its lists generated in memory
+        """
+        return _materialize(self._root())
+
+    def json(self) -> str:
+        """
+        Returns:
+            str: The JSON string of the document, formatted as `json.dumps` formats it
+        """
+        buffer = io.StringIO()
+        self.write(buffer)
+        return buffer.getvalue()
+
+    def build(self, validate: bool = True) -> BraketSchemaBase:
+        """
+        Args:
+            validate (bool): Whether to validate the document. Default is True.
+
+        Returns:
+            BraketSchemaBase: The schema object of the document
+        """
+        return BraketSchemaBase.parse_obj_schema(self.document(), validate=validate)
+
+    def write(self, target: Union[str, os.PathLike, IO[str]]) -> int:
+        """
+        Streams the JSON document to a file, without holding the document in memory.
+
+        Args:
+            target (Union[str, PathLike, IO[str]]): The path of the file, which is overwritten,
+                or a file object opened for writing text
+
+        Returns:
+            int: The number of characters written
+        """
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, "w", encoding="utf-8", buffering=1 << 20) as f:
+                return self.write(f)
+        parts = []
+        written = 0
+
+        def write(part):
+            nonlocal written
+            parts.append(part)
+            if len(parts) >= _WRITE_BUFFER_ITEMS:
+                chunk = "".join(parts)
+                parts.clear()
+                written += len(chunk)
+                target.write(chunk)
+
+        _write_value(write, self._root())
+        chunk = "".join(parts)
+        target.write(chunk)
+        return written + len(chunk)
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, _Stream):
+        return dict(value.items) if value.mapping else list(value.items)
+    if isinstance(value, dict):
+        return {key: _materialize(item) for key, item in value.items()}
+    return value
+
+
+def _write_value(write: Callable[[str], None], value: Any) -> None:
+    if isinstance(value, _Stream):
+        write("{" if value.mapping else "[")
+        separator = ""
+        if value.mapping:
+            for key, item in value.items:
+                write(f"{separator}{json.dumps(str(key))}: {json.dumps(item)}")
+                separator = ", "
+        else:
+            for item in value.items:
+                write(separator + json.dumps(item))
+                separator = ", "
+        write("}" if value.mapping else "]")
+    elif isinstance(value, dict):
+        write("{")
+        separator = ""
+        for key, item in value.items():
+            write(f"{separator}{json.dumps(str(key))}: ")
+            _write_value(write, item)
+            separator = ", "
+        write("}")
+    else:
+        write(json.dumps(value))
+
+
+def _header(name: str) -> Dict[str, str]:
+    return {"name": name, "version": "1"}
+
+
+def _substream(rng: random.Random) -> random.Random:
+    # Each stream has its own generator, so that documents do not depend on the order
+    # in which their streams are consumed
+    return random.Random(rng.getrandbits(64))
+
+
+def _random_su2(rng: random.Random) -> List[List[complex]]:
+    theta = rng.uniform(0, math.pi / 2)
+    alpha, beta = rng.uniform(-math.pi, math.pi), rng.uniform(-math.pi, math.pi)
+    cos, sin = math.cos(theta), math.sin(theta)
+    return [
+        [cos * cmath.exp(1j * alpha), -sin * cmath.exp(1j * beta)],
+        [sin * cmath.exp(-1j * beta), cos * cmath.exp(-1j * alpha)],
+    ]
+
+
+def _random_unitary(rng: random.Random, qubits: int) -> List[List[List[float]]]:
+    # The tensor product of single-qubit unitaries, times a diagonal of random phases
+    # to entangle the qubits
+    matrix = [[1 + 0j]]
+    for _ in range(qubits):
+        factor = _random_su2(rng)
+        matrix = [
+            [a * b for a in row for b in factor_row] for row in matrix for factor_row in factor
+        ]
+    for row in matrix:
+        phase = cmath.exp(1j * rng.uniform(-math.pi, math.pi))
+        row[:] = [entry * phase for entry in row]
+    return [[[entry.real, entry.imag] for entry in row] for row in matrix]
+
+
+def _instruction_generator(gate_class: type) -> Tuple[int, Callable]:
+    from braket.ir.jaqcd.shared_models import DoubleTarget
+
+    fields = gate_class.__fields__
+    type_ = fields["type"].default.value
+    min_qubits = sum(
+        count for name, count in (("target", 1), ("control", 1), ("controls", 2)) if name in fields
+    )
+    fixed_targets = 2 if issubclass(gate_class, DoubleTarget) else None
+    min_qubits += 1 if "targets" in fields and not fixed_targets else fixed_targets or 0
+
+    def generate(rng, qubits):
+        targets = (fixed_targets or rng.randint(1, min(2, qubits))) if "targets" in fields else 0
+        controls = ("control" in fields) + 2 * ("controls" in fields)
+        drawn = rng.sample(range(qubits), controls + targets + ("target" in fields))
+        instruction = {"type": type_}
+        if "control" in fields:
+            instruction["control"] = drawn.pop()
+        if "controls" in fields:
+            instruction["controls"] = [drawn.pop(), drawn.pop()]
+        if "target" in fields:
+            instruction["target"] = drawn.pop()
+        if "targets" in fields:
+            instruction["targets"] = drawn
+        if "angle" in fields:
+            instruction["angle"] = rng.uniform(-math.pi, math.pi)
+        if "matrix" in fields:
+            instruction["matrix"] = _random_unitary(rng, targets)
+        return instruction
+
+    return min_qubits, generate
+
+
+def _instructions(
+    rng: random.Random, count: int, qubits: int, gate_mix: Dict[str, float]
+) -> Iterator[dict]:
+    from braket.ir.jaqcd import Program
+
+    gate_classes = Program._TYPE_DISPATCH["instructions"]
+    generators = []
+    cumulative_weights = []
+    total = 0
+    for name, weight in gate_mix.items():
+        if name not in gate_classes:
+            raise ValueError(f"Unknown instruction type {name}")
+        if weight <= 0:
+            continue
+        min_qubits, generator = _instruction_generator(gate_classes[name])
+        if min_qubits > qubits:
+            raise ValueError(f"Instruction {name} requires {min_qubits} qubits, not {qubits}")
+        total += weight
+        generators.append(generator)
+        cumulative_weights.append(total)
+    if not generators:
+        raise ValueError("The gate mix must have a positive weight")
+
+    def generate():
+        remaining = count
+        while remaining:
+            batch = min(remaining, 1024)
+            for generator in rng.choices(generators, cum_weights=cumulative_weights, k=batch):
+                yield generator(rng, qubits)
+            remaining -= batch
+
+    return generate()
+
+
+def program(
+    instructions: int,
+    qubits: int = 32,
+    gate_mix: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+) -> SyntheticDocument:
+    """
+    A jaqcd Program of random gates.
+
+    Args:
+        instructions (int): The number of instructions
+        qubits (int): The number of qubits the gates act on. Default is 32.
+        gate_mix (Optional[Dict[str, float]]): The relative frequencies of the instructions,
+            keyed by instruction type. Default is None, meaning `DEFAULT_GATE_MIX`.
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The program
+
+    Raises:
+        ValueError: If the gate mix has an unknown instruction type, no positive weight,
+            or an instruction that acts on more qubits than there are
+    """
+    gate_mix = DEFAULT_GATE_MIX if gate_mix is None else gate_mix
+    # Generate the first instruction now to raise errors in the gate mix immediately
+    next(_instructions(random.Random(seed), 1, qubits, gate_mix), None)
+
+    def generate(rng):
+        return {
+            "braketSchemaHeader": _header("braket.ir.jaqcd.program"),
+            "instructions": _Stream(_instructions(_substream(rng), instructions, qubits, gate_mix)),
+            "results": [{"type": "probability"}],
+        }
+
+    return SyntheticDocument(generate, seed)
+
+
+def _ghz_measurements(rng: random.Random, shots: int, qubits: int, error_rate: float):
+    for _ in range(shots):
+        outcome = rng.getrandbits(1)
+        yield [outcome ^ (rng.random() < error_rate) for _ in range(qubits)]
+
+
+def gate_model_task_result(
+    shots: int, qubits: int = 10, error_rate: float = 0.02, seed: int = 0
+) -> SyntheticDocument:
+    """
+    A GateModelTaskResult of a GHZ circuit measured on a noisy device.
+
+    Args:
+        shots (int): The number of shots
+        qubits (int): The number of measured qubits. Default is 10.
+        error_rate (float): The probability of each measured bit being flipped.
+            Default is 0.02.
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The task result
+    """
+
+    def generate(rng):
+        instructions = [{"type": "h", "target": 0}] + [
+            {"type": "cnot", "control": qubit - 1, "target": qubit} for qubit in range(1, qubits)
+        ]
+        task_id = f"arn:aws:braket:us-west-2:123456789012:quantum-task/{rng.getrandbits(64):016x}"
+        return {
+            "braketSchemaHeader": _header("braket.task_result.gate_model_task_result"),
+            "measurements": _Stream(_ghz_measurements(_substream(rng), shots, qubits, error_rate)),
+            "measuredQubits": list(range(qubits)),
+            "taskMetadata": {
+                "braketSchemaHeader": _header("braket.task_result.task_metadata"),
+                "id": task_id,
+                "shots": shots,
+                "deviceId": "arn:aws:braket:::device/quantum-simulator/amazon/sv1",
+            },
+            "additionalMetadata": {
+                "action": {
+                    "braketSchemaHeader": _header("braket.ir.jaqcd.program"),
+                    "instructions": instructions,
+                }
+            },
+        }
+
+    return SyntheticDocument(generate, seed)
+
+
+def _pairs(rng: random.Random, variables: int, density: float) -> Iterator[Tuple[int, int]]:
+    # Each pair is included with probability `density`; the gaps between included pairs are
+    # drawn from the geometric distribution, so that sparse problems take time proportional
+    # to the number of pairs included rather than to the number of all pairs
+    if density >= 1:
+        for i in range(variables):
+            for j in range(i + 1, variables):
+                yield i, j
+        return
+    if density <= 0:
+        return
+    log_q = math.log1p(-density)
+    total = variables * (variables - 1) // 2
+    index = -1
+    row, row_start = 0, 0
+    while True:
+        index += 1 + int(math.log(1 - rng.random()) / log_q)
+        if index >= total:
+            return
+        while index >= row_start + variables - 1 - row:
+            row_start += variables - 1 - row
+            row += 1
+        yield row, row + 1 + index - row_start
+
+
+def problem(
+    variables: int, density: float, problem_type: str = "QUBO", seed: int = 0
+) -> SyntheticDocument:
+    """
+    An annealing Problem with random coefficients.
+
+    Args:
+        variables (int): The number of variables, which all have a linear term
+        density (float): The probability of each pair of variables having a quadratic term
+        problem_type (str): "QUBO" or "ISING". Default is "QUBO".
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The problem
+    """
+
+    def generate(rng):
+        linear_rng, quadratic_rng = _substream(rng), _substream(rng)
+        return {
+            "braketSchemaHeader": _header("braket.ir.annealing.problem"),
+            "type": problem_type,
+            "linear": _Stream(
+                ((str(i), linear_rng.uniform(-1, 1)) for i in range(variables)), mapping=True
+            ),
+            "quadratic": _Stream(
+                (
+                    (f"{i},{j}", quadratic_rng.uniform(-1, 1))
+                    for i, j in _pairs(quadratic_rng, variables, density)
+                ),
+                mapping=True,
+            ),
+        }
+
+    return SyntheticDocument(generate, seed)
+
+
+def annealing_task_result(solutions: int, variables: int, seed: int = 0) -> SyntheticDocument:
+    """
+    An AnnealingTaskResult of an Ising problem, with random solutions.
+
+    Args:
+        solutions (int): The number of distinct solutions
+        variables (int): The number of variables of each solution
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The task result
+    """
+
+    def generate(rng):
+        solution_rng = _substream(rng)
+        task_id = f"arn:aws:braket:us-west-2:123456789012:quantum-task/{rng.getrandbits(64):016x}"
+        return {
+            "braketSchemaHeader": _header("braket.task_result.annealing_task_result"),
+            "solutions": _Stream(
+                [solution_rng.choice((-1, 1)) for _ in range(variables)] for _ in range(solutions)
+            ),
+            "solutionCounts": [rng.randint(1, 10) for _ in range(solutions)],
+            "values": [rng.uniform(-100, 0) for _ in range(solutions)],
+            "variableCount": variables,
+            "taskMetadata": {
+                "braketSchemaHeader": _header("braket.task_result.task_metadata"),
+                "id": task_id,
+                "shots": solutions,
+                "deviceId": "arn:aws:braket:::device/qpu/d-wave/Advantage_system4",
+            },
+            "additionalMetadata": {
+                "action": {
+                    "braketSchemaHeader": _header("braket.ir.annealing.problem"),
+                    "type": "ISING",
+                    "linear": {},
+                    "quadratic": {},
+                }
+            },
+        }
+
+    return SyntheticDocument(generate, seed)
+
+
+# The offsets of the qubits each qubit is coupled to, which gives an average degree close to
+# the Pegasus topology of D-Wave Advantage systems
+_DWAVE_COUPLER_OFFSETS = (1, 2, 12, 24, 36, 48, 96)
+
+
+def dwave_provider_properties(
+    qubit_count: int = 5760, yield_rate: float = 0.977, seed: int = 0
+) -> SyntheticDocument:
+    """
+    The DwaveProviderProperties of a device the size of an Advantage system.
+
+    Args:
+        qubit_count (int): The number of qubits of the device. Default is 5760.
+        yield_rate (float): The fraction of qubits that are working. Default is 0.977.
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The provider properties
+    """
+    return SyntheticDocument(
+        lambda rng: _dwave_provider_properties(rng, qubit_count, yield_rate), seed
+    )
+
+
+def _dwave_provider_properties(rng: random.Random, qubit_count: int, yield_rate: float) -> dict:
+    active = [qubit for qubit in range(qubit_count) if rng.random() < yield_rate]
+    active_set = set(active)
+    couplers = (
+        [qubit, qubit + offset]
+        for qubit in active
+        for offset in _DWAVE_COUPLER_OFFSETS
+        if qubit + offset in active_set
+    )
+    offset_rng = _substream(rng)
+    offset_ranges = (
+        [round(-offset_rng.uniform(0.05, 0.1), 6), round(offset_rng.uniform(0.02, 0.05), 6)]
+        for _ in range(qubit_count)
+    )
+    return {
+        "braketSchemaHeader": _header("braket.device_schema.dwave.dwave_provider_properties"),
+        "annealingOffsetStep": 1.45e-4,
+        "annealingOffsetStepPhi0": 1.45e-4,
+        "annealingOffsetRanges": _Stream(offset_ranges),
+        "annealingDurationRange": [1, 2000],
+        "couplers": _Stream(couplers),
+        "defaultAnnealingDuration": 20,
+        "defaultProgrammingThermalizationDuration": 1000,
+        "defaultReadoutThermalizationDuration": 0,
+        "extendedJRange": [-2.0, 1.0],
+        "hGainScheduleRange": [-4.0, 4.0],
+        "hRange": [-4.0, 4.0],
+        "jRange": [-1.0, 1.0],
+        "maximumAnnealingSchedulePoints": 12,
+        "maximumHGainSchedulePoints": 20,
+        "perQubitCouplingRange": [-18.0, 15.0],
+        "programmingThermalizationDurationRange": [0, 10000],
+        "qubits": active,
+        "qubitCount": qubit_count,
+        "quotaConversionRate": 1,
+        "readoutThermalizationDurationRange": [0, 10000],
+        "taskRunDurationRange": [100, 2000000],
+        "topology": {"type": "pegasus", "shape": [16]},
+    }
+
+
+def _service_properties(shots_range: List[int]) -> dict:
+    return {
+        "braketSchemaHeader": _header("braket.device_schema.device_service_properties"),
+        "executionWindows": [
+            {"executionDay": "Everyday", "windowStartHour": "00:00", "windowEndHour": "23:59"}
+        ],
+        "shotsRange": shots_range,
+        "deviceCost": {"price": 0.00035, "unit": "shot"},
+        "deviceDocumentation": {
+            "imageUrl": "https://example.com/device.png",
+            "summary": "Synthetic device",
+            "externalDocumentationUrl": "https://example.com/device",
+        },
+        "deviceLocation": "us-west-1",
+        "updatedAt": "2021-01-01T00:00:00",
+    }
+
+
+def _jaqcd_action(operations: List[str]) -> dict:
+    return {
+        "braket.ir.jaqcd.program": {
+            "actionType": "braket.ir.jaqcd.program",
+            "version": ["1"],
+            "supportedOperations": operations,
+            "supportedResultTypes": [
+                {"name": name, "observables": ["x", "y", "z", "h", "i"], "minShots": 10}
+                for name in ("Sample", "Expectation", "Variance")
+            ]
+            + [{"name": "Probability", "minShots": 10, "maxShots": 100000}],
+        }
+    }
+
+
+def _gate_model_qpu_paradigm(
+    qubit_count: int, native_gates: List[str], connectivity_graph: Dict[str, List[str]]
+) -> dict:
+    return {
+        "braketSchemaHeader": _header("braket.device_schema.gate_model_qpu_paradigm_properties"),
+        "qubitCount": qubit_count,
+        "nativeGateSet": native_gates,
+        "connectivity": {
+            "fullyConnected": not connectivity_graph,
+            "connectivityGraph": connectivity_graph,
+        },
+    }
+
+
+def _octagonal_lattice(octagons: int) -> List[Tuple[int, int]]:
+    # Octagons of qubits 10 * octagon + 0..7, in two rows, with neighboring octagons
+    # coupled by two edges as in Rigetti Aspen devices
+    columns = max(1, (octagons + 1) // 2)
+    edges = []
+    for octagon in range(octagons):
+        base = 10 * octagon
+        edges.extend((base + k, base + (k + 1) % 8) for k in range(8))
+        if octagon % columns < columns - 1 and octagon + 1 < octagons:
+            edges.extend([(base + 1, base + 16), (base + 2, base + 15)])
+        if octagon + columns < octagons:
+            below = 10 * (octagon + columns)
+            edges.extend([(base + 3, below + 0), (base + 4, below + 7)])
+    return edges
+
+
+def rigetti_device_capabilities(octagons: int = 10, seed: int = 0) -> SyntheticDocument:
+    """
+    The RigettiDeviceCapabilities of an Aspen-like device, with one- and two-qubit specs
+    for every qubit and edge.
+
+    Args:
+        octagons (int): The number of octagons of 8 qubits. Default is 10.
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The device capabilities
+    """
+
+    def generate(rng):
+        edges = _octagonal_lattice(octagons)
+        qubits = sorted({qubit for edge in edges for qubit in edge})
+        graph = {}
+        for a, b in edges:
+            graph.setdefault(str(a), []).append(str(b))
+            graph.setdefault(str(b), []).append(str(a))
+        one_qubit = {
+            str(qubit): {
+                "T1": rng.uniform(1e-5, 5e-5),
+                "T2": rng.uniform(1e-5, 5e-5),
+                "f1QRB": rng.uniform(0.99, 1),
+                "f1QRB_std_err": rng.uniform(0, 1e-3),
+                "f1Q_simultaneous_RB": rng.uniform(0.98, 1),
+                "f1Q_simultaneous_RB_std_err": rng.uniform(0, 1e-3),
+                "fActiveReset": rng.uniform(0.99, 1),
+                "fRO": rng.uniform(0.9, 1),
+            }
+            for qubit in qubits
+        }
+        two_qubit = {
+            f"{a}-{b}": {
+                "fCZ": rng.uniform(0.85, 1),
+                "fCZ_std_err": rng.uniform(0, 0.01),
+                "fCPHASE": rng.uniform(0.85, 1),
+                "fCPHASE_std_err": rng.uniform(0, 0.01),
+                "fXY": rng.uniform(0.85, 1),
+                "fXY_std_err": rng.uniform(0, 0.01),
+            }
+            for a, b in sorted(tuple(sorted(edge)) for edge in edges)
+        }
+        return {
+            "braketSchemaHeader": _header(
+                "braket.device_schema.rigetti.rigetti_device_capabilities"
+            ),
+            "service": _service_properties([10, 100000]),
+            "action": _jaqcd_action(
+                ["cz", "xy", "ccnot", "cnot", "cphaseshift", "h", "rx", "ry", "rz", "x", "y", "z"]
+            ),
+            "paradigm": _gate_model_qpu_paradigm(len(qubits), ["rx", "rz", "cz", "xy"], graph),
+            "provider": {
+                "braketSchemaHeader": _header(
+                    "braket.device_schema.rigetti.rigetti_provider_properties"
+                ),
+                "specs": {"1Q": one_qubit, "2Q": two_qubit},
+            },
+            "deviceParameters": {},
+        }
+
+    return SyntheticDocument(generate, seed)
+
+
+def ionq_device_capabilities(qubit_count: int = 11, seed: int = 0) -> SyntheticDocument:
+    """
+    The IonqDeviceCapabilities of a fully connected trapped ion device.
+
+    Args:
+        qubit_count (int): The number of qubits. Default is 11.
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The device capabilities
+    """
+
+    def generate(rng):
+        return {
+            "braketSchemaHeader": _header("braket.device_schema.ionq.ionq_device_capabilities"),
+            "service": _service_properties([1, 10000]),
+            "action": _jaqcd_action(
+                ["x", "y", "z", "rx", "ry", "rz", "h", "cnot", "s", "si", "t", "ti", "v", "vi"]
+                + ["xx", "yy", "zz", "swap", "i"]
+            ),
+            "paradigm": _gate_model_qpu_paradigm(qubit_count, ["gpi", "gpi2", "ms"], {}),
+            "provider": {
+                "braketSchemaHeader": _header("braket.device_schema.ionq.ionq_provider_properties"),
+                "fidelity": {
+                    "1Q": {"mean": rng.uniform(0.995, 0.999)},
+                    "2Q": {"mean": rng.uniform(0.95, 0.98)},
+                    "spam": {"mean": rng.uniform(0.99, 0.999)},
+                },
+                "timing": {
+                    "T1": 10000000000,
+                    "T2": 500000,
+                    "1Q": 1.1e-05,
+                    "2Q": 0.00021,
+                    "readout": 0.000175,
+                    "reset": 3.5e-05,
+                },
+            },
+            "deviceParameters": {},
+        }
+
+    return SyntheticDocument(generate, seed)
+
+
+def dwave_device_capabilities(qubit_count: int = 5760, seed: int = 0) -> SyntheticDocument:
+    """
+    The DwaveDeviceCapabilities of a device the size of an Advantage system.
+
+    Args:
+        qubit_count (int): The number of qubits of the device. Default is 5760.
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The device capabilities, with the provider properties of
+        `dwave_provider_properties`
+    """
+
+    def generate(rng):
+        return {
+            "braketSchemaHeader": _header("braket.device_schema.dwave.dwave_device_capabilities"),
+            "provider": _dwave_provider_properties(rng, qubit_count, 0.977),
+            "service": _service_properties([1, 100000]),
+            "action": {
+                "braket.ir.annealing.problem": {
+                    "actionType": "braket.ir.annealing.problem",
+                    "version": ["1"],
+                }
+            },
+            "paradigm": {
+                "braketSchemaHeader": _header("braket.device_schema.device_paradigm_properties")
+            },
+            "deviceParameters": {},
+        }
+
+    return SyntheticDocument(generate, seed)
+
+
+def simulator_device_capabilities(qubit_count: int = 34, seed: int = 0) -> SyntheticDocument:
+    """
+    The GateModelSimulatorDeviceCapabilities of a state vector simulator.
+
+    Args:
+        qubit_count (int): The maximum number of qubits of the simulator. Default is 34.
+        seed (int): The seed of the document. Default is 0.
+
+    Returns:
+        SyntheticDocument: The device capabilities
+    """
+
+    def generate(rng):
+        return {
+            "braketSchemaHeader": _header(
+                "braket.device_schema.simulators.gate_model_simulator_device_capabilities"
+            ),
+            "service": _service_properties([1, 100000]),
+            "action": _jaqcd_action(["h", "x", "y", "z", "rx", "cnot", "swap", "unitary"]),
+            "paradigm": {
+                "braketSchemaHeader": _header(
+                    "braket.device_schema.simulators.gate_model_simulator_paradigm_properties"
+                ),
+                "qubitCount": qubit_count,
+            },
+            "deviceParameters": {},
+        }
+
+    return SyntheticDocument(generate, seed)
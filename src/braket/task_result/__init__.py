@@ -18,5 +18,11 @@ from braket.task_result.gate_model_task_result_v1 import (  # noqa: F401
     GateModelTaskResult,
     ResultTypeValue,
 )
+from braket.task_result.result_type_arrays import (  # noqa: F401
+    disable_result_type_arrays,
+    enable_result_type_arrays,
+    result_type_arrays_enabled,
+)
+from braket.task_result.result_type_index import ResultTypeIndex  # noqa: F401
 from braket.task_result.rigetti_metadata_v1 import NativeQuilMetadata, RigettiMetadata  # noqa: F401
 from braket.task_result.task_metadata_v1 import TaskMetadata  # noqa: F401
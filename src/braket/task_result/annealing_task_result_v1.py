@@ -49,3 +49,5 @@ class AnnealingTaskResult(BraketSchemaBase):
     variableCount: Optional[conint(ge=0)]
     taskMetadata: TaskMetadata
     additionalMetadata: AdditionalMetadata
+
+    _LAZY_FIELDS = ("solutions", "solutionCounts", "values", "additionalMetadata")
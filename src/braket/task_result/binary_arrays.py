@@ -0,0 +1,296 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+The binary encoding of the large arrays of task results.
+
+An array is encoded as a BinaryArray: its elements in C order as little-endian binary,
+or as packed bits for arrays of 0s and 1s, encoded in base64, along with its data type
+and shape. A BinarySchemaArray is a SchemaArray which is serialized as a BinaryArray if it
+has at least `BINARY_MIN_SIZE` elements, and as the nested lists of its JSON form
+otherwise. Schemas holding BinarySchemaArrays serialize them with the encoders of
+`BINARY_JSON_ENCODERS`.
+
+Decoding BinaryArrays, like building BinarySchemaArrays, requires NumPy.
+"""
+
+import base64
+import binascii
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator
+
+from pydantic import BaseConfig, BaseModel, ValidationError, conint, conlist
+from pydantic.fields import ModelField
+from pydantic.schema import field_schema
+
+from braket.schema_common.schema_arrays import SchemaArray, encode_array, is_ndarray, numpy_module
+from braket.task_result.result_type_arrays import ResultValue
+
+BINARY_MIN_SIZE = 1 << 10
+"""Arrays with at least this many elements are serialized as BinaryArrays."""
+
+
+class BinaryDataType(str, Enum):
+    """
+    The data type of the elements of a BinaryArray.
+
+    Values:
+        bit: 0 or 1, packed eight to a byte, the first element in the high bit
+        int64: A little-endian signed 64-bit int
+        float64: A little-endian IEEE-754 double
+        complex128: A complex number, as the float64 of its real part followed by the
+            float64 of its imaginary part
+    """
+
+    bit = "bit"
+    int64 = "<i8"
+    float64 = "<f8"
+    complex128 = "<c16"
+
+
+_DATA_TYPES = {
+    "i": BinaryDataType.int64,
+    "u": BinaryDataType.int64,
+    "c": BinaryDataType.complex128,
+}
+
+
+class BinaryArray(BaseModel):
+    """
+    The binary encoding of an array.
+
+    Attributes:
+        dtype (BinaryDataType): The data type of the elements
+        shape (List[int]): The shape of the array, with at least one dimension
+        data (str): The base64 encoding of the elements in C order
+
+    Examples:
+        >>> BinaryArray(dtype="<f8", shape=[2], data="AAAAAAAA4D8AAAAAAADgPw==")
+    """
+
+    dtype: BinaryDataType
+    shape: conlist(conint(ge=0), min_items=1)
+    data: str
+
+    @classmethod
+    def from_array(cls, array: Any) -> "BinaryArray":
+        """
+        Args:
+            array (numpy.ndarray): The array, with at least one dimension. Arrays of
+                unsigned 8-bit ints must only hold 0s and 1s, and are encoded as bits.
+                Other arrays of ints are encoded as int64, real arrays as float64 and
+                complex arrays as complex128.
+
+        Returns:
+            BinaryArray: The binary encoding of the array
+        """
+        numpy = numpy_module()
+        if array.dtype == numpy.uint8 or array.dtype.kind == "b":
+            dtype = BinaryDataType.bit
+            data = numpy.packbits(array, axis=None).tobytes()
+        else:
+            dtype = _DATA_TYPES.get(array.dtype.kind, BinaryDataType.float64)
+            data = numpy.ascontiguousarray(array, dtype=dtype.value).tobytes()
+        return cls.construct(
+            dtype=dtype, shape=list(array.shape), data=base64.b64encode(data).decode()
+        )
+
+    def to_array(self) -> Any:
+        """
+        Returns:
+            numpy.ndarray: The read-only array, of unsigned 8-bit ints for bits
+
+        Raises:
+            ValueError: If the data is not valid base64, or its length does not match the
+                shape and data type
+        """
+        numpy = numpy_module()
+        try:
+            data = base64.b64decode(self.data, validate=True)
+        except binascii.Error:
+            raise ValueError("data must be base64")
+        size = 1
+        for dimension in self.shape:
+            size *= dimension
+        if self.dtype == BinaryDataType.bit:
+            expected = (size + 7) // 8
+            array = None if len(data) != expected else numpy.frombuffer(data, numpy.uint8)
+            array = None if array is None else numpy.unpackbits(array, count=size)
+        else:
+            dtype = numpy.dtype(self.dtype.value)
+            expected = size * dtype.itemsize
+            array = None if len(data) != expected else numpy.frombuffer(data, dtype)
+        if array is None:
+            raise ValueError(
+                f"data has {len(data)} bytes, but shape {self.shape} of {self.dtype.value} "
+                f"requires {expected}"
+            )
+        array.flags.writeable = False
+        return array.reshape(self.shape)
+
+
+class BinarySchemaArray(SchemaArray):
+    """
+    A SchemaArray which is serialized as a BinaryArray if it has at least
+    `BINARY_MIN_SIZE` elements; see the module documentation.
+    """
+
+    __slots__ = ()
+
+
+def is_binary_array(value: Any) -> bool:
+    """
+    Args:
+        value (Any): A decoded JSON value
+
+    Returns:
+        bool: Whether the value is the JSON form of a BinaryArray. This cannot be mistaken
+        for the dict of the amplitudes of an `Amplitude` result type, whose keys are states.
+    """
+    return type(value) is dict and "dtype" in value and "data" in value
+
+
+def decode_binary_array(value: Dict[str, Any]) -> Any:
+    """
+    Args:
+        value (Dict[str, Any]): The JSON form of a BinaryArray
+
+    Returns:
+        numpy.ndarray: The array
+
+    Raises:
+        ValidationError: If the value is not a valid BinaryArray
+        ValueError: If the data of the BinaryArray is invalid; see `BinaryArray.to_array`
+    """
+    return BinaryArray.parse_obj(value).to_array()
+
+
+def _construct_binary_array(value: Dict[str, Any]) -> BinarySchemaArray:
+    # Decodes a trusted BinaryArray without validating it
+    binary = BinaryArray.construct(**{**value, "dtype": BinaryDataType(value["dtype"])})
+    return BinarySchemaArray(binary.to_array())
+
+
+def encode_binary_array(value: BinarySchemaArray) -> Any:
+    """
+    Encodes a BinarySchemaArray for the JSON codec, as the `default` of its `dumps`.
+
+    Args:
+        value (BinarySchemaArray): The array
+
+    Returns:
+        Any: The dict of the BinaryArray of the array if it has at least
+        `BINARY_MIN_SIZE` elements, or its JSON form otherwise; see `encode_array`
+    """
+    if value.array.size < BINARY_MIN_SIZE:
+        return encode_array(value)
+    binary = BinaryArray.from_array(value.array)
+    return {"dtype": binary.dtype.value, "shape": binary.shape, "data": binary.data}
+
+
+BINARY_JSON_ENCODERS = {SchemaArray: encode_array, BinarySchemaArray: encode_binary_array}
+"""The JSON encoders of schemas with fields that may hold a BinarySchemaArray."""
+
+
+def _binary_schema(json_field: ModelField) -> Dict[str, Any]:
+    json_schema = field_schema(json_field, model_name_map={})[0]
+    json_schema.pop("title", None)
+    binary_schema = BinaryArray.schema()
+    binary_schema.pop("definitions", None)
+    binary_schema.pop("description", None)
+    binary_schema["properties"]["dtype"] = {"enum": [dtype.value for dtype in BinaryDataType]}
+    members = json_schema.pop("anyOf", [json_schema])
+    return {"anyOf": [binary_schema, *members]}
+
+
+class BinaryMeasurements:
+    """
+    The type of the measurements of a task result: a matrix of 0s and 1s with a row for
+    each shot and a column for each measured qubit, given as a BinaryArray, a NumPy array
+    or nested lists, and kept as a BinarySchemaArray of unsigned 8-bit ints.
+    """
+
+    list_field = ModelField.infer(
+        name="measurements",
+        value=...,
+        annotation=conlist(conlist(conint(ge=0, le=1), min_items=1), min_items=1),
+        class_validators=None,
+        config=BaseConfig,
+    )
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[..., Any]]:
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, schema: Dict[str, Any]) -> None:
+        schema.update(_binary_schema(cls.list_field))
+
+    @classmethod
+    def validate(cls, value: Any) -> BinarySchemaArray:
+        numpy = numpy_module()
+        if is_binary_array(value):
+            array = decode_binary_array(value)
+        elif is_ndarray(value) or isinstance(value, SchemaArray):
+            array = numpy.asarray(value)
+        else:
+            validated, errors = cls.list_field.validate(value, {}, loc=())
+            if errors:
+                raise ValidationError(errors if isinstance(errors, list) else [errors], cls)
+            array = numpy.array(validated, dtype=numpy.uint8)
+        if (
+            array.ndim != 2
+            or not array.size
+            or array.dtype.kind not in "biu"
+            or not ((array == 0) | (array == 1)).all()
+        ):
+            raise ValueError("measurements must be a matrix of 0s and 1s")
+        return BinarySchemaArray(array.astype(numpy.uint8))
+
+    @classmethod
+    def construct_trusted(cls, value: Any) -> Any:
+        return _construct_binary_array(value) if is_binary_array(value) else value
+
+
+class BinaryResultValue(ResultValue):
+    """
+    The type of the value of a result type, which also accepts a BinaryArray, decoded into
+    a NumPy array for the validators of the model holding the result type.
+    """
+
+    @classmethod
+    def __modify_schema__(cls, schema: Dict[str, Any]) -> None:
+        schema.update(_binary_schema(cls.json_field))
+
+    @classmethod
+    def validate(cls, value: Any) -> Any:
+        if is_binary_array(value):
+            return decode_binary_array(value)
+        return super().validate(value)
+
+    @classmethod
+    def construct_trusted(cls, value: Any) -> Any:
+        return _construct_binary_array(value) if is_binary_array(value) else value
+
+
+def binary_schema_array(value: Any) -> Any:
+    """
+    Args:
+        value (Any): A value
+
+    Returns:
+        Any: The value as a BinarySchemaArray if it is a SchemaArray that is not keyed
+    """
+    if type(value) is SchemaArray:
+        return BinarySchemaArray(value.array)
+    return value
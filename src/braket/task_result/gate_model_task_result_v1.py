@@ -11,28 +11,59 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License
 
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, confloat, conint, conlist, constr
+from pydantic import BaseModel, Field, PrivateAttr, confloat, conint, conlist, constr, validator
 
-from braket.ir.jaqcd.program_v1 import Results
+from braket.ir.jaqcd.program_v1 import Results, _valid_results, validate_result
 from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common.schema_arrays import SchemaArrayModel
 from braket.task_result.additional_metadata import AdditionalMetadata
+from braket.task_result.result_type_arrays import ResultValue, result_type_value
+from braket.task_result.result_type_index import ResultTypeIndex
 from braket.task_result.task_metadata_v1 import TaskMetadata
 
 
-class ResultTypeValue(BaseModel):
+class ResultTypeValue(SchemaArrayModel):
     """
     Requested result type and value of gate model task result.
 
     Attributes:
          type (Union[Expectation, Sample, StateVector, Variance, Probability, Amplitude]): The
-            requested result type
+            requested result type, validated by the class of its type
          value (Union[List, float, Dict]): The value of the requested result
+
+            The value can also be given as a NumPy array, which is decoded by the result
+            type and kept as a SchemaArray; see `result_type_arrays`.
+
+    Examples:
+        >>> ResultTypeValue(type=Probability(targets=[0]), value=[0.5, 0.5])
+        >>> ResultTypeValue(type=StateVector(), value=numpy.array([1, 0, 0, 1j]) / 2 ** 0.5)
     """
 
     type: Union[Results]
-    value: Union[List, float, Dict]
+    value: ResultValue
+
+    _TYPE_DISPATCH = {"type": _valid_results}
+
+    @validator("type", pre=True)
+    def validate_type(cls, value):
+        """
+        Validates the result type by the class of its type in O(1); see `validate_result`.
+        """
+        return validate_result(value)
+
+    @validator("value")
+    def validate_value(cls, value, values):
+        """
+        Arrays and, if enabled, lists and dicts are decoded by the result type; see
+        `result_type_value`.
+        """
+        return result_type_value(values.get("type"), value)
+
+    class Config:
+        # Accepts the result type object of `validate_type` as it is; see `Program`
+        smart_union = True
 
 
 class GateModelTaskResult(BraketSchemaBase):
@@ -71,3 +102,49 @@ class GateModelTaskResult(BraketSchemaBase):
     measuredQubits: Optional[conlist(conint(ge=0), min_items=1)]
     taskMetadata: TaskMetadata
     additionalMetadata: AdditionalMetadata
+
+    _LAZY_FIELDS = ("measurements", "measurementProbabilities", "resultTypes", "additionalMetadata")
+    _result_type_index: Optional[ResultTypeIndex] = PrivateAttr(default=None)
+    _CACHED_ATTRIBUTES = BraketSchemaBase._CACHED_ATTRIBUTES + ("_result_type_index",)
+
+    def result_type_index(self) -> ResultTypeIndex:
+        """
+        Indexes the values of the result types by the canonical keys of the result types,
+        for lookups in constant time; see `ResultTypeIndex`.
+
+        The index is built once and cached. Assigning a field, or copying the result with
+        updated fields, resets the cache, but modifying the result types in place does not.
+
+        Returns:
+            ResultTypeIndex: The index of the values of `resultTypes`
+
+        Examples:
+            >>> index = result.result_type_index()
+            >>> index[Expectation(targets=[0], observable=["z"])]
+        """
+        if self._result_type_index is None:
+            self._result_type_index = ResultTypeIndex(self.resultTypes or [], self.measuredQubits)
+        return self._result_type_index
+
+    def get_value_by_result_type(self, result_type: Union[BaseModel, Dict[str, Any]]) -> Any:
+        """
+        Gets the value of a result type in constant time; see `result_type_index`.
+
+        Args:
+            result_type (Union[BaseModel, Dict[str, Any]]): The result type, such as
+                `Expectation(targets=[0], observable=["z"])`, or its JSON form
+
+        Returns:
+            Any: The value of the result type
+
+        Raises:
+            ValueError: If the result type is not valid, or has no value in the result
+
+        Examples:
+            >>> result.get_value_by_result_type(Probability(targets=[0]))
+            [0.5, 0.5]
+        """
+        try:
+            return self.result_type_index()[result_type]
+        except KeyError:
+            raise ValueError(f"Result type {result_type} not found in the result types")
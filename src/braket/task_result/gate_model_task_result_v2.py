@@ -0,0 +1,104 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License
+
+from typing import List, Optional
+
+from pydantic import Field, validator
+
+from braket.schema_common import BraketSchemaHeader
+from braket.task_result import gate_model_task_result_v1
+from braket.task_result.binary_arrays import (
+    BINARY_JSON_ENCODERS,
+    BinaryMeasurements,
+    BinaryResultValue,
+    binary_schema_array,
+)
+from braket.task_result.result_type_arrays import result_type_value
+
+
+class ResultTypeValue(gate_model_task_result_v1.ResultTypeValue):
+    """
+    Requested result type and value of gate model task result, with the value of the
+    result type decoded into an array by the result type where possible.
+
+    Attributes:
+         type (Union[Expectation, Sample, StateVector, Variance, Probability, Amplitude]): The
+            requested result type, validated by the class of its type
+         value (Union[BinaryArray, List, float, Dict]): The value of the requested result.
+            Arrays are kept as BinarySchemaArrays, which are serialized as BinaryArrays
+            if they are large; see `binary_arrays`.
+    """
+
+    value: BinaryResultValue
+
+    @validator("value")
+    def validate_binary_value(cls, value, values):
+        """
+        Lists are decoded by the result type as well, and arrays are kept as
+        BinarySchemaArrays, except for amplitudes.
+        """
+        return binary_schema_array(result_type_value(values.get("type"), value, True))
+
+    class Config:
+        json_encoders = BINARY_JSON_ENCODERS
+
+
+class GateModelTaskResult(gate_model_task_result_v1.GateModelTaskResult):
+    """
+    Version 2 of the gate model task result schema, in which the measurements and the
+    large arrays of the values of result types are encoded as BinaryArrays: their elements
+    as little-endian binary, or as packed bits for measurements, in base64. Version 2
+    documents are several times smaller than version 1 documents with large values, and
+    are parsed without building a Python object for each element. Parsing them requires
+    NumPy.
+
+    Documents of both versions are parsed by `BraketSchemaBase.parse_raw_schema`,
+    which detects the version from the schema header. Version 1 is still the default
+    `GateModelTaskResult`; readers that only know version 1 reject version 2 documents.
+
+    Attributes:
+        braketSchemaHeader (BraketSchemaHeader): Schema header. Users do not need
+            to set this value. Only default is allowed.
+        measurements (BinarySchemaArray): The measurements, a matrix of unsigned 8-bit ints
+            in which each row represents a shot and each column a qubit. This can be given
+            as a BinaryArray, a NumPy array or a list of lists. Default is `None`.
+        measurementProbabilities (Dict[str, float]): A dictionary of probabilistic results.
+            Key is the measurements in a big endian binary string.
+            Value is the probability the measurement occurred.
+            Default is `None`.
+        measuredQubits (List[int]): The indices of the measured qubits.
+            Indicates which qubits are in `measurements`. Default is `None`.
+        resultTypes (List[ResultTypeValue]): Requested result types and their values.
+            Default is `None`.
+        taskMetadata (TaskMetadata): The task metadata
+        additionalMetadata (AdditionalMetadata): Additional metadata of the task
+
+    Examples:
+        >>> result_v1 = GateModelTaskResult_v1.parse_raw(result_json)
+        >>> result = GateModelTaskResult(**result_v1.dict(exclude={"braketSchemaHeader"}))
+        >>> BraketSchemaBase.parse_raw_schema(result.json()) == result
+        True
+    """
+
+    _GATE_MODEL_TASK_RESULT_HEADER = BraketSchemaHeader(
+        name="braket.task_result.gate_model_task_result", version="2"
+    )
+
+    braketSchemaHeader: BraketSchemaHeader = Field(
+        default=_GATE_MODEL_TASK_RESULT_HEADER, const=_GATE_MODEL_TASK_RESULT_HEADER
+    )
+    measurements: Optional[BinaryMeasurements]
+    resultTypes: Optional[List[ResultTypeValue]]
+
+    class Config:
+        json_encoders = BINARY_JSON_ENCODERS
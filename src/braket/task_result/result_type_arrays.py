@@ -0,0 +1,219 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+NumPy-backed values of the result types of gate model task results.
+
+The value of a result type given as a NumPy array is decoded by its result type and kept
+in a read-only SchemaArray, which is serialized straight from the array:
+    - StateVector: a complex128 vector, given as a complex array or an array of
+      `[real, imaginary]` pairs
+    - Amplitude: a complex128 vector of the amplitudes of the states of the result type,
+      kept in a KeyedSchemaArray equal to the dict of the JSON form
+    - Probability: a float64 vector
+    - Sample: an int64 or float64 array of the eigenvalues, with one row per target
+      if the samples of every target are given
+    - Expectation and Variance: a float64 vector, if the value of every target is given
+
+Values given as lists or dicts are kept as they are, unless result type arrays are
+enabled with `enable_result_type_arrays`, in which case they are decoded into arrays as
+well. Lists or dicts that do not have the form of the value of their result type, such as
+ragged lists, are still kept as they are.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Union
+
+from pydantic import BaseConfig, BaseModel, ValidationError
+from pydantic.fields import ModelField
+from pydantic.schema import field_schema
+
+from braket.ir.jaqcd.results import (
+    Amplitude,
+    Expectation,
+    Probability,
+    Sample,
+    StateVector,
+    Variance,
+)
+from braket.schema_common.schema_arrays import (
+    KeyedSchemaArray,
+    SchemaArray,
+    is_ndarray,
+    numpy_module,
+)
+
+_arrays_enabled = False
+
+
+def enable_result_type_arrays() -> None:
+    """
+    Enables result type arrays: the values of result types given as lists or dicts, for
+    example while parsing a task result, are decoded into arrays by their result type,
+    like values given as NumPy arrays.
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Examples:
+        >>> enable_result_type_arrays()
+        >>> result = GateModelTaskResult.parse_raw(result_json)
+        >>> numpy.asarray(result.resultTypes[0].value)
+    """
+    global _arrays_enabled
+    numpy_module()
+    _arrays_enabled = True
+
+
+def disable_result_type_arrays() -> None:
+    """
+    Disables result type arrays. Values given as NumPy arrays are still kept as arrays.
+    """
+    global _arrays_enabled
+    _arrays_enabled = False
+
+
+def result_type_arrays_enabled() -> bool:
+    """
+    Returns:
+        bool: Whether the values of result types given as lists or dicts are decoded
+        into arrays
+    """
+    return _arrays_enabled
+
+
+def _complex_vector(value: Any) -> Any:
+    numpy = numpy_module()
+    array = numpy.array(value)
+    if array.ndim == 1 and array.dtype.kind in "iufc":
+        return array.astype(numpy.complex128)
+    if array.ndim == 2 and array.shape[-1] == 2 and array.dtype.kind in "iuf":
+        pairs = array.astype(numpy.float64)
+        array = numpy.empty(len(pairs), dtype=numpy.complex128)
+        array.real = pairs[:, 0]
+        array.imag = pairs[:, 1]
+        return array
+    raise ValueError("value must be a vector of complex numbers")
+
+
+def _state_vector(result_type: StateVector, value: Any) -> SchemaArray:
+    return SchemaArray(_complex_vector(value))
+
+
+def _amplitudes(result_type: Amplitude, value: Any) -> KeyedSchemaArray:
+    if isinstance(value, dict):
+        return KeyedSchemaArray(list(value), _complex_vector(list(value.values())))
+    return KeyedSchemaArray(result_type.states, _complex_vector(value))
+
+
+def _real_array(value: Any, max_dimensions: int, kinds: str = "iuf") -> Any:
+    numpy = numpy_module()
+    array = numpy.array(value)
+    if not 1 <= array.ndim <= max_dimensions or array.dtype.kind not in kinds:
+        raise ValueError("value must be an array of real numbers")
+    return array
+
+
+def _probabilities(result_type: Probability, value: Any) -> SchemaArray:
+    return SchemaArray(_real_array(value, 1).astype(numpy_module().float64))
+
+
+def _samples(result_type: Sample, value: Any) -> SchemaArray:
+    numpy = numpy_module()
+    array = _real_array(value, 2)
+    return SchemaArray(array.astype(numpy.int64 if array.dtype.kind in "iu" else numpy.float64))
+
+
+def _target_values(result_type: Union[Expectation, Variance], value: Any) -> Any:
+    numpy = numpy_module()
+    if is_ndarray(value) and value.ndim == 0:
+        return float(value)
+    return SchemaArray(_real_array(value, 1).astype(numpy.float64))
+
+
+_DECODERS: Dict[type, Callable[[Any, Any], Any]] = {
+    StateVector: _state_vector,
+    Amplitude: _amplitudes,
+    Probability: _probabilities,
+    Sample: _samples,
+    Expectation: _target_values,
+    Variance: _target_values,
+}
+
+
+def result_type_value(result_type: BaseModel, value: Any, decode_lists: bool = False) -> Any:
+    """
+    Decodes the value of a result type into an array by its result type if the value is
+    a NumPy array, or if result type arrays are enabled; see the module documentation.
+
+    Args:
+        result_type (BaseModel): The result type, such as a `StateVector`
+        value (Any): The value
+        decode_lists (bool): Whether to decode lists and dicts even if result type arrays
+            are not enabled. Default is False.
+
+    Returns:
+        Any: The value, as a SchemaArray if it is decoded into an array
+
+    Raises:
+        ValueError: If the value is a NumPy array which is not a value of the result type
+    """
+    if is_ndarray(value):
+        decoder = _DECODERS.get(type(result_type))
+        if decoder is None:
+            raise ValueError("value given as an array must have a valid result type")
+        return decoder(result_type, value)
+    if (decode_lists or _arrays_enabled) and type(value) in (list, dict):
+        decoder = _DECODERS.get(type(result_type))
+        if decoder is not None:
+            try:
+                return decoder(result_type, value)
+            except (ValueError, TypeError, OverflowError):
+                # Lists that are not values of the result type are kept as they are
+                pass
+    return value
+
+
+class ResultValue:
+    """
+    The type of the value of a result type, which accepts the lists, floats and dicts of
+    its JSON form, validated as `Union[List, float, Dict]`, or a NumPy array, which is
+    decoded by the validators of the model holding the result type.
+    """
+
+    json_field = ModelField.infer(
+        name="value",
+        value=...,
+        annotation=Union[List, float, Dict],
+        class_validators=None,
+        config=BaseConfig,
+    )
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[..., Any]]:
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, schema: Dict[str, Any]) -> None:
+        # The schema is that of the JSON form
+        json_schema = field_schema(cls.json_field, model_name_map={})[0]
+        json_schema.pop("title", None)
+        schema.update(json_schema)
+
+    @classmethod
+    def validate(cls, value: Any) -> Any:
+        if is_ndarray(value) or isinstance(value, SchemaArray):
+            return value
+        validated, errors = cls.json_field.validate(value, {}, loc=())
+        if errors:
+            raise ValidationError(errors if isinstance(errors, list) else [errors], cls)
+        return validated
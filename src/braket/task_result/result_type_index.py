@@ -0,0 +1,157 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Lookup of the values of result types by their canonical keys.
+
+The key of a result type is the tuple of its type, its targets, its observable and its
+states, each None if the result type does not have it:
+    - targets are kept in order, since the value depends on it
+    - the items of an observable are kept in order; a matrix is keyed by the SHA-256
+      digest of its entries as float64, so a matrix given as nested lists and the same
+      matrix given as an array have the same key
+    - states are sorted, since the value of an `Amplitude` is a dict keyed by state
+"""
+
+import hashlib
+import struct
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from braket.ir.jaqcd.program_v1 import validate_result
+from braket.schema_common.schema_arrays import SchemaArray
+
+_ResultTypeKey = Tuple[Hashable, ...]
+_MISSING = object()
+
+
+def _matrix_key(matrix: Any) -> Tuple[str, bytes]:
+    if isinstance(matrix, SchemaArray):
+        # Adding 0.0 turns -0.0 into 0.0, which is equal to it
+        data = (matrix.json_array().astype("<f8").ravel() + 0.0).tobytes()
+    else:
+        entries = [float(part) + 0.0 for row in matrix for entry in row for part in entry]
+        data = struct.pack(f"<{len(entries)}d", *entries)
+    return "hermitian", hashlib.sha256(data).digest()
+
+
+def _observable_key(observable: Optional[List[Any]]) -> Optional[Tuple[Hashable, ...]]:
+    if observable is None:
+        return None
+    return tuple(item if isinstance(item, str) else _matrix_key(item) for item in observable)
+
+
+def result_type_key(result_type: Union[BaseModel, Dict[str, Any]]) -> _ResultTypeKey:
+    """
+    Args:
+        result_type (Union[BaseModel, Dict[str, Any]]): The result type, such as
+            `Expectation(targets=[0], observable=["z"])`, or its JSON form
+
+    Returns:
+        Tuple[Hashable, ...]: The canonical key of the result type; see the module
+        documentation
+
+    Raises:
+        ValueError: If the result type is not valid
+    """
+    result_type = validate_result(result_type)
+    targets = getattr(result_type, "targets", None)
+    states = getattr(result_type, "states", None)
+    return (
+        result_type.type.value,
+        None if targets is None else tuple(targets),
+        _observable_key(getattr(result_type, "observable", None)),
+        None if states is None else tuple(sorted(states)),
+    )
+
+
+class ResultTypeIndex:
+    """
+    An index of the values of the result types of a task result by the canonical keys of
+    the result types, built once in a single pass.
+
+    A result type whose observable acts on a single qubit and which has no targets is
+    applied to every qubit, and its value holds a value for each qubit: for the qubits of
+    `measured_qubits` in order if given, otherwise for qubits 0, 1, 2 and so on. Such a
+    result type with a single target is looked up in that value if it is not in the
+    index itself.
+
+    Examples:
+        >>> index = ResultTypeIndex(result.resultTypes, result.measuredQubits)
+        >>> index[Expectation(targets=[0], observable=["z"])]
+        0.5
+        >>> Probability(targets=[1]) in index
+        False
+    """
+
+    def __init__(self, result_types: Iterable[Any], measured_qubits: Optional[List[int]] = None):
+        """
+        Args:
+            result_types (Iterable[Any]): The result types and their values, such as the
+                `resultTypes` of a `GateModelTaskResult`. Only the first value of result
+                types with the same key is kept.
+            measured_qubits (Optional[List[int]]): The qubits of the values of result
+                types applied to every qubit. Default is None.
+        """
+        self._values: Dict[_ResultTypeKey, Any] = {}
+        for result_type_value in result_types:
+            self._values.setdefault(
+                result_type_key(result_type_value.type), result_type_value.value
+            )
+        self._qubit_positions = (
+            None
+            if measured_qubits is None
+            else {qubit: position for position, qubit in enumerate(measured_qubits)}
+        )
+
+    def get(self, result_type: Union[BaseModel, Dict[str, Any]], default: Any = None) -> Any:
+        """
+        Args:
+            result_type (Union[BaseModel, Dict[str, Any]]): The result type, or its JSON form
+            default (Any): The value to return if the result type is not in the index.
+                Default is None.
+
+        Returns:
+            Any: The value of the result type, or `default`
+        """
+        key = result_type_key(result_type)
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._broadcast_value(key)
+        return default if value is _MISSING else value
+
+    def _broadcast_value(self, key: _ResultTypeKey) -> Any:
+        result_type, targets, observable, states = key
+        if targets is None or len(targets) != 1 or observable is None or len(observable) != 1:
+            return _MISSING
+        value = self._values.get((result_type, None, observable, states), _MISSING)
+        if not isinstance(value, (list, SchemaArray)):
+            return _MISSING
+        qubit = targets[0]
+        position = qubit if self._qubit_positions is None else self._qubit_positions.get(qubit)
+        if position is None or not 0 <= position < len(value):
+            return _MISSING
+        return value[position]
+
+    def __getitem__(self, result_type: Union[BaseModel, Dict[str, Any]]) -> Any:
+        value = self.get(result_type, _MISSING)
+        if value is _MISSING:
+            raise KeyError(result_type)
+        return value
+
+    def __contains__(self, result_type: Union[BaseModel, Dict[str, Any]]) -> bool:
+        return self.get(result_type, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,94 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Compares the size and parse time of a GateModelTaskResult with large values, a state
+vector, its probabilities and the measurements of many shots, in the JSON form of
+version 1 against the binary arrays of version 2.
+
+Usage: python test/benchmarks/benchmark_binary.py [--qubits N] [--shots N] [--codec NAME]
+"""
+
+import argparse
+import gc
+import time
+
+import numpy
+
+from braket.schema_common import BraketSchemaBase, set_json_codec
+from braket.task_result import GateModelTaskResult, gate_model_task_result_v2
+
+
+def _result(qubits, shots):
+    rng = numpy.random.default_rng(0)
+    state = rng.normal(size=1 << qubits) + 1j * rng.normal(size=1 << qubits)
+    state /= numpy.linalg.norm(state)
+    return {
+        "measurements": rng.integers(0, 2, size=(shots, qubits)).tolist(),
+        "measuredQubits": list(range(qubits)),
+        "resultTypes": [
+            {"type": {"type": "statevector"}, "value": numpy.stack([state.real, state.imag], -1)},
+            {"type": {"type": "probability"}, "value": numpy.abs(state) ** 2},
+        ],
+        "taskMetadata": {
+            "braketSchemaHeader": {"name": "braket.task_result.task_metadata", "version": "1"},
+            "id": "arn:aws:braket:us-west-2:123456789012:quantum-task/benchmark",
+            "shots": shots,
+            "deviceId": "arn:aws:braket:::device/quantum-simulator/amazon/sv1",
+        },
+        "additionalMetadata": {
+            "action": {
+                "braketSchemaHeader": {"name": "braket.ir.jaqcd.program", "version": "1"},
+                "instructions": [{"type": "h", "target": qubit} for qubit in range(qubits)],
+            }
+        },
+    }
+
+
+def _seconds(function):
+    gc.collect()
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--qubits", type=int, default=20)
+    parser.add_argument("--shots", type=int, default=10000)
+    parser.add_argument("--codec", default="auto")
+    args = parser.parse_args()
+
+    print(f"codec: {set_json_codec(args.codec).name}")
+    result = _result(args.qubits, args.shots)
+    result_v1 = GateModelTaskResult.parse_obj(
+        {
+            **result,
+            "resultTypes": [
+                {**value, "value": value["value"].tolist()} for value in result["resultTypes"]
+            ],
+        }
+    )
+    result_v2 = gate_model_task_result_v2.GateModelTaskResult.parse_obj(result)
+    for label, model in (("version 1", result_v1), ("version 2", result_v2)):
+        json_str = model.json()
+        parse = _seconds(lambda: BraketSchemaBase.parse_raw_schema(json_str))
+        serialize = _seconds(model.json)
+        print(
+            f"{label}: {len(json_str) / (1 << 20):.1f} MB, parse {parse:.2f} s, "
+            f"serialize {serialize:.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+The documents measured by the benchmark suite, for each schema family and scale.
+
+Documents are generated by `braket.schema_common.synthetic` with a fixed seed, so the same
+case always measures the same document, and are encoded with the standard library json
+module so that they do not depend on the JSON codec under test.
+"""
+
+import json
+import random
+from typing import Callable, List, NamedTuple
+
+from braket.schema_common import synthetic
+
+SEED = 1234
+SCALES = ("quick", "full")
+
+# Every kind of instruction, from single-qubit gates to two-qubit unitaries, equally often
+_GATE_MIX = {
+    name: 1 for name in ("h", "x", "rx", "cnot", "cphaseshift", "ccnot", "swap", "xx", "unitary")
+}
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    A document to benchmark.
+
+    Attributes:
+        name (str): The unique name of the case, "<family>/<size>"
+        build (Callable[[], str]): Builds the JSON document of the case
+    """
+
+    name: str
+    build: Callable[[], str]
+
+
+def program_document(instructions: int, qubits: int = 30) -> str:
+    """
+    Args:
+        instructions (int): The number of instructions
+        qubits (int): The number of qubits the instructions act on. Default is 30.
+
+    Returns:
+        str: A Program of single and multi-qubit gates, parametrized gates and unitaries
+    """
+    return synthetic.program(instructions, qubits, gate_mix=_GATE_MIX, seed=SEED).json()
+
+
+def gate_model_task_result_document(shots: int, qubits: int) -> str:
+    """
+    Args:
+        shots (int): The number of shots
+        qubits (int): The number of measured qubits
+
+    Returns:
+        str: A GateModelTaskResult with the measurements of every shot
+    """
+    return synthetic.gate_model_task_result(shots, qubits, seed=SEED).json()
+
+
+def result_types_document(result_types: int, qubits: int = 20) -> str:
+    """
+    Args:
+        result_types (int): The number of result types, cycling through every type
+        qubits (int): The number of qubits
+
+    Returns:
+        str: A GateModelTaskResult of a simulator, with the value of every result type
+    """
+    rng = random.Random(SEED)
+    observables = ["x", "y", "z", "h", "i"]
+    result_types_values = []
+    for index in range(result_types):
+        targets = [index % qubits]
+        observable = [observables[index % len(observables)]]
+        kind = index % 6
+        if kind == 0:
+            result_type = {"type": "expectation", "observable": observable, "targets": targets}
+            value = rng.uniform(-1, 1)
+        elif kind == 1:
+            result_type = {"type": "variance", "observable": observable, "targets": targets}
+            value = rng.random()
+        elif kind == 2:
+            result_type = {"type": "sample", "observable": observable, "targets": targets}
+            value = [rng.choice((-1, 1)) for _ in range(10)]
+        elif kind == 3:
+            result_type = {"type": "probability", "targets": targets}
+            value = [0.5, 0.5]
+        elif kind == 4:
+            state = format(rng.getrandbits(qubits), f"0{qubits}b")
+            result_type = {"type": "amplitude", "states": [state]}
+            value = {state: [rng.random(), rng.random()]}
+        else:
+            result_type = {"type": "statevector"}
+            value = [[rng.random(), rng.random()] for _ in range(4)]
+        result_types_values.append({"type": result_type, "value": value})
+    # A result of a simulator run without shots, which has result types but no measurements
+    document = synthetic.gate_model_task_result(0, qubits, seed=SEED).document()
+    del document["measurements"]
+    document["resultTypes"] = result_types_values
+    document["additionalMetadata"]["action"]["results"] = [
+        result["type"] for result in result_types_values
+    ]
+    return json.dumps(document)
+
+
+def annealing_task_result_document(solutions: int, variables: int) -> str:
+    """
+    Args:
+        solutions (int): The number of distinct solutions
+        variables (int): The number of variables of each solution
+
+    Returns:
+        str: An AnnealingTaskResult of an Ising problem
+    """
+    return synthetic.annealing_task_result(solutions, variables, seed=SEED).json()
+
+
+def problem_document(variables: int, density: float) -> str:
+    """
+    Args:
+        variables (int): The number of variables
+        density (float): The probability of each pair of variables having a quadratic term
+
+    Returns:
+        str: A QUBO Problem
+    """
+    return synthetic.problem(variables, density, seed=SEED).json()
+
+
+def dwave_device_capabilities_document(qubits: int) -> str:
+    """
+    Args:
+        qubits (int): The number of qubits of the device
+
+    Returns:
+        str: The DwaveDeviceCapabilities of a device the size of an Advantage system
+    """
+    return synthetic.dwave_device_capabilities(qubits, seed=SEED).json()
+
+
+def rigetti_device_capabilities_document(octagons: int) -> str:
+    """
+    Args:
+        octagons (int): The number of octagons of 8 qubits of the device
+
+    Returns:
+        str: The RigettiDeviceCapabilities of the device, with one- and two-qubit specs
+    """
+    return synthetic.rigetti_device_capabilities(octagons, seed=SEED).json()
+
+
+def ionq_device_capabilities_document(qubits: int) -> str:
+    """
+    Args:
+        qubits (int): The number of qubits of the device, which is fully connected
+
+    Returns:
+        str: The IonqDeviceCapabilities of the device
+    """
+    return synthetic.ionq_device_capabilities(qubits, seed=SEED).json()
+
+
+def simulator_device_capabilities_document(qubits: int) -> str:
+    """
+    Args:
+        qubits (int): The maximum number of qubits of the simulator
+
+    Returns:
+        str: The GateModelSimulatorDeviceCapabilities of the simulator
+    """
+    return synthetic.simulator_device_capabilities(qubits, seed=SEED).json()
+
+
+def benchmark_cases(scale: str = "quick") -> List[BenchmarkCase]:
+    """
+    Args:
+        scale (str): "quick" for documents that parse in well under a second, or "full"
+            for the complete range of sizes, up to programs of 1M instructions.
+            Default is "quick".
+
+    Returns:
+        List[BenchmarkCase]: The cases of every schema family at the given scale
+
+    Raises:
+        ValueError: If the scale is not one of SCALES
+    """
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale {scale}; must be one of {SCALES}")
+    full = scale == "full"
+
+    cases = []
+
+    def add(name, build, *args):
+        cases.append(BenchmarkCase(name, lambda: build(*args)))
+
+    for instructions in (1000, 10000, 100000, 1000000) if full else (1000, 10000):
+        add(f"program/{instructions}", program_document, instructions)
+    for shots in (100, 1000, 10000, 100000) if full else (100, 1000):
+        for qubits in (5, 10, 20, 40) if full else (5, 20):
+            add(
+                f"gate_model_task_result/{shots}x{qubits}",
+                gate_model_task_result_document,
+                shots,
+                qubits,
+            )
+    for result_types in (1000, 10000, 100000) if full else (1000,):
+        add(f"result_types/{result_types}", result_types_document, result_types)
+    for solutions, variables in ((1000, 2000), (10000, 1000)) if full else ((100, 2000),):
+        add(
+            f"annealing_task_result/{solutions}x{variables}",
+            annealing_task_result_document,
+            solutions,
+            variables,
+        )
+    for variables in (200, 1000) if full else (200,):
+        add(f"problem/dense/{variables}", problem_document, variables, 1)
+    for variables in (5000, 50000) if full else (5000,):
+        add(f"problem/sparse/{variables}", problem_document, variables, 3 / variables)
+    add("device/dwave/5760", dwave_device_capabilities_document, 5760)
+    add("device/rigetti/80", rigetti_device_capabilities_document, 10)
+    add("device/ionq/11", ionq_device_capabilities_document, 11)
+    add("device/simulator/34", simulator_device_capabilities_document, 34)
+    return cases
@@ -0,0 +1,83 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Compares the memory and parse time of the instructions of a Program stored as a list of
+instruction objects against ColumnarInstructions.
+
+Usage: python test/benchmarks/benchmark_columnar.py [--instructions N] [--qubits N]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from braket.ir.jaqcd import ColumnarInstructions, Program
+from braket.schema_common import synthetic
+
+
+def _parse_list(json_str):
+    return Program.parse_raw(json_str).instructions
+
+
+def _parse_columnar(json_str):
+    return ColumnarInstructions(json.loads(json_str)["instructions"])
+
+
+def _retained_and_peak_mb(function):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current / (1 << 20), peak / (1 << 20)
+
+
+def _seconds(function):
+    gc.collect()
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instructions", type=int, default=500000)
+    parser.add_argument("--qubits", type=int, default=32)
+    args = parser.parse_args()
+
+    json_str = synthetic.program(args.instructions, qubits=args.qubits).json()
+    print(f"Program: {args.instructions} instructions, {len(json_str) / (1 << 20):.1f} MB of JSON")
+    for label, parse in (("list", _parse_list), ("columnar", _parse_columnar)):
+        seconds = _seconds(lambda: parse(json_str))
+        retained, peak = _retained_and_peak_mb(lambda: parse(json_str))
+        print(f"{label:>9}: parse {seconds:.2f} s, retained {retained:.1f} MB, peak {peak:.1f} MB")
+
+    instructions = _parse_list(json_str)
+    columns = ColumnarInstructions.from_list(instructions)
+    print(f"columns: {columns.nbytes / (1 << 20):.1f} MB, {len(columns.matrices)} matrices")
+    print(
+        f"list -> columnar: {_seconds(lambda: ColumnarInstructions.from_list(instructions)):.2f} s"
+    )
+    print(f"columnar -> list: {_seconds(columns.to_list):.2f} s")
+    print(f"iterate columnar: {_seconds(lambda: sum(1 for _ in columns)):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
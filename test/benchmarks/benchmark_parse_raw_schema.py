@@ -0,0 +1,70 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Compares the single-pass dispatch of BraketSchemaBase.parse_raw_schema against
+decoding the document twice, once for the header and once for the schema class.
+
+Usage: python test/benchmarks/benchmark_parse_raw_schema.py [--shots N] [--qubits N]
+"""
+
+import argparse
+import timeit
+
+from braket.ir.jaqcd import CNot, H, Program
+from braket.schema_common import BraketSchemaBase
+from braket.task_result import AdditionalMetadata, GateModelTaskResult, TaskMetadata
+
+
+def _two_pass_parse_raw_schema(json_str):
+    schema = BraketSchemaBase.parse_raw(json_str)
+    schema_class = BraketSchemaBase._get_schema_class(schema)
+    return schema_class.parse_raw(json_str)
+
+
+def _gate_model_task_result_json(shots, qubits):
+    return GateModelTaskResult(
+        measurements=[[(shot >> qubit) & 1 for qubit in range(qubits)] for shot in range(shots)],
+        measuredQubits=list(range(qubits)),
+        taskMetadata=TaskMetadata(id="task_id", deviceId="device_id", shots=shots),
+        additionalMetadata=AdditionalMetadata(
+            action=Program(instructions=[H(target=0), CNot(control=0, target=1)])
+        ),
+    ).json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shots", type=int, default=100000)
+    parser.add_argument("--qubits", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    json_str = _gate_model_task_result_json(args.shots, args.qubits)
+    assert _two_pass_parse_raw_schema(json_str) == BraketSchemaBase.parse_raw_schema(json_str)
+
+    print(f"GateModelTaskResult: {args.shots} shots x {args.qubits} qubits, {len(json_str)} bytes")
+    for label, parse in (
+        ("two-pass", _two_pass_parse_raw_schema),
+        ("single-pass", BraketSchemaBase.parse_raw_schema),
+    ):
+        best = min(timeit.repeat(lambda: parse(json_str), number=1, repeat=args.repeat))
+        print(f"{label:>12}: {best * 1000:.1f} ms")
+    best = min(
+        timeit.repeat(lambda: BraketSchemaBase._load_raw(json_str), number=1, repeat=args.repeat)
+    )
+    print(f"{'decode only':>12}: {best * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
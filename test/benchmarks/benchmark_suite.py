@@ -0,0 +1,225 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""
+Measures the parse and serialize throughput and peak memory of every schema family.
+
+Each case is parsed with BraketSchemaBase.parse_raw_schema and serialized with json().
+Times are the best of several runs; peak memory is measured with tracemalloc in a separate
+run, so that tracing does not skew the times.
+
+Usage:
+    Run the suite and save the results as a baseline:
+        python test/benchmarks/benchmark_suite.py run --output baseline.json
+    Run the suite and compare it against a baseline, exiting with 1 on regressions:
+        python test/benchmarks/benchmark_suite.py run --compare baseline.json
+    Compare two saved results:
+        python test/benchmarks/benchmark_suite.py compare baseline.json current.json
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pydantic
+from benchmark_cases import SCALES, BenchmarkCase, benchmark_cases
+
+from braket.schema_common import BraketSchemaBase, get_json_codec, set_json_codec
+
+# Metrics compared between runs; lower is better for all of them
+COMPARED_METRICS = ("parse_seconds", "serialize_seconds", "parse_peak_mb", "serialize_peak_mb")
+DEFAULT_THRESHOLD = 0.1
+_MB = 1 << 20
+
+
+def _best_time(function: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(function: Callable[[], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1] / _MB
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case: BenchmarkCase, repeat: int) -> Dict[str, float]:
+    """
+    Measures one case.
+
+    Args:
+        case (BenchmarkCase): The case
+        repeat (int): The number of timed runs of each operation
+
+    Returns:
+        Dict[str, float]: The metrics of the case
+    """
+    document = case.build()
+    schema = BraketSchemaBase.parse_raw_schema(document)
+    serialized_bytes = len(schema.json())
+    parse_seconds = _best_time(lambda: BraketSchemaBase.parse_raw_schema(document), repeat)
+    serialize_seconds = _best_time(schema.json, repeat)
+    return {
+        "document_bytes": len(document),
+        "parse_seconds": parse_seconds,
+        "parse_mb_per_second": len(document) / _MB / parse_seconds,
+        "parse_peak_mb": _peak_memory(lambda: BraketSchemaBase.parse_raw_schema(document)),
+        "serialize_seconds": serialize_seconds,
+        "serialize_mb_per_second": serialized_bytes / _MB / serialize_seconds,
+        "serialize_peak_mb": _peak_memory(schema.json),
+    }
+
+
+def run(cases: List[BenchmarkCase], repeat: int) -> Dict[str, Any]:
+    """
+    Measures the given cases.
+
+    Args:
+        cases (List[BenchmarkCase]): The cases
+        repeat (int): The number of timed runs of each operation
+
+    Returns:
+        Dict[str, Any]: The results, with the environment they were measured in
+    """
+    results = {}
+    for case in cases:
+        results[case.name] = metrics = measure(case, repeat)
+        print(
+            f"{case.name:<40} parse {metrics['parse_seconds'] * 1000:>10.2f} ms "
+            f"{metrics['parse_mb_per_second']:>7.1f} MB/s {metrics['parse_peak_mb']:>8.1f} MB peak"
+            f" | serialize {metrics['serialize_seconds'] * 1000:>10.2f} ms "
+            f"{metrics['serialize_mb_per_second']:>7.1f} MB/s "
+            f"{metrics['serialize_peak_mb']:>8.1f} MB peak",
+            flush=True,
+        )
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "pydantic": pydantic.VERSION,
+            "pydantic_compiled": pydantic.compiled,
+            "json_codec": get_json_codec().name,
+            "platform": platform.platform(),
+            "time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Tuple[str, str, float, float]]:
+    """
+    Compares results against a baseline.
+
+    Args:
+        baseline (Dict[str, Any]): The baseline results, as returned by `run`
+        current (Dict[str, Any]): The current results, as returned by `run`
+        threshold (float): The relative increase of a metric over the baseline above which
+            it is a regression. Default is 0.1.
+
+    Returns:
+        List[Tuple[str, str, float, float]]: The regressions, as tuples of the case name,
+        the metric, the baseline value and the current value
+    """
+    regressions = []
+    for name, metrics in current["results"].items():
+        baseline_metrics = baseline["results"].get(name)
+        if baseline_metrics is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = baseline_metrics.get(metric), metrics.get(metric)
+            if before and after is not None and after > before * (1 + threshold):
+                regressions.append((name, metric, before, after))
+    return regressions
+
+
+def _report(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    for key in ("python", "pydantic", "json_codec", "platform"):
+        before = baseline.get("environment", {}).get(key)
+        after = current.get("environment", {}).get(key)
+        if before != after:
+            print(f"warning: {key} differs from the baseline: {before} != {after}")
+    missing = sorted(set(current["results"]) - set(baseline["results"]))
+    if missing:
+        print(f"warning: no baseline for {', '.join(missing)}")
+    regressions = compare(baseline, current, threshold)
+    for name, metric, before, after in regressions:
+        print(
+            f"REGRESSION {name} {metric}: {before:.6g} -> {after:.6g} (+{after / before - 1:.0%})"
+        )
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("--scale", choices=SCALES, default="quick")
+    run_parser.add_argument("--filter", help="only run the cases whose name matches this regex")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--json-codec", help="the JSON codec to use, e.g. orjson")
+    run_parser.add_argument("--output", help="save the results to this JSON file")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="compare against a baseline")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return _report(_load(args.baseline), _load(args.current), args.threshold)
+
+    if args.json_codec:
+        set_json_codec(args.json_codec)
+    cases = benchmark_cases(args.scale)
+    if args.filter:
+        cases = [case for case in cases if re.search(args.filter, case.name)]
+    current = run(cases, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        return _report(_load(args.compare), current, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
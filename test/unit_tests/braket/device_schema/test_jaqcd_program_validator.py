@@ -0,0 +1,228 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import pytest
+
+from braket.device_schema import JaqcdProgramValidator, Violation, ViolationType
+from braket.device_schema.rigetti import RigettiDeviceCapabilities
+from braket.device_schema.simulators import GateModelSimulatorDeviceCapabilities
+from braket.ir.jaqcd import (
+    CZ,
+    CNot,
+    Expectation,
+    H,
+    Probability,
+    Program,
+    Rx,
+    Sample,
+    StateVector,
+    Swap,
+    X,
+)
+
+
+def _capabilities(action, paradigm):
+    return {
+        "braketSchemaHeader": {
+            "name": "braket.device_schema.rigetti.rigetti_device_capabilities",
+            "version": "1",
+        },
+        "service": {
+            "braketSchemaHeader": {
+                "name": "braket.device_schema.device_service_properties",
+                "version": "1",
+            },
+            "executionWindows": [
+                {"executionDay": "Everyday", "windowStartHour": "11:00", "windowEndHour": "12:00"}
+            ],
+            "shotsRange": [1, 10],
+        },
+        "action": {"braket.ir.jaqcd.program": action},
+        "paradigm": paradigm,
+        "deviceParameters": {},
+    }
+
+
+@pytest.fixture
+def action():
+    return {
+        "actionType": "braket.ir.jaqcd.program",
+        "version": ["1"],
+        "supportedOperations": ["H", "cnot", "rx", "x"],
+        "supportedResultTypes": [
+            {"name": "Sample", "observables": ["x", "z", "h"], "minShots": 10, "maxShots": 100},
+            {"name": "Probability", "minShots": 10, "maxShots": 100},
+        ],
+    }
+
+
+@pytest.fixture
+def qpu(action):
+    paradigm = {
+        "braketSchemaHeader": {
+            "name": "braket.device_schema.gate_model_qpu_paradigm_properties",
+            "version": "1",
+        },
+        "qubitCount": 4,
+        "nativeGateSet": ["cz"],
+        "connectivity": {
+            "fullyConnected": False,
+            "connectivityGraph": {"0": ["1"], "1": ["2"], "2": ["3"]},
+        },
+    }
+    return RigettiDeviceCapabilities.parse_obj(_capabilities(action, paradigm))
+
+
+@pytest.fixture
+def validator(qpu):
+    return JaqcdProgramValidator(qpu)
+
+
+def test_valid_program(validator):
+    program = Program(
+        instructions=[H(target=0), CNot(control=0, target=1), CNot(control=2, target=1)],
+        results=[Sample(targets=[1], observable=["z"]), Probability()],
+        basis_rotation_instructions=[H(target=1)],
+    )
+    assert validator.validate(program) == []
+    assert validator.validate(program, shots=50) == []
+
+
+def test_instruction_violations(validator):
+    program = Program(
+        instructions=[
+            H(target=0),
+            CZ(control=0, target=1),
+            CNot(control=0, target=2),
+            Rx(target=4, angle=0.15),
+            Swap(targets=[3, 4]),
+        ]
+    )
+    assert [violation[:2] for violation in validator.validate(program)] == [
+        (ViolationType.UNSUPPORTED_OPERATION, ("instructions", 1)),
+        (ViolationType.QUBITS_NOT_CONNECTED, ("instructions", 2)),
+        (ViolationType.QUBIT_OUT_OF_RANGE, ("instructions", 3)),
+        (ViolationType.UNSUPPORTED_OPERATION, ("instructions", 4)),
+        (ViolationType.QUBIT_OUT_OF_RANGE, ("instructions", 4)),
+        (ViolationType.QUBITS_NOT_CONNECTED, ("instructions", 4)),
+    ]
+
+
+def test_result_violations(validator):
+    program = Program(
+        instructions=[X(target=0)],
+        results=[
+            Sample(targets=[0], observable=["y"]),
+            Sample(targets=[0, 1], observable=[[[[0, 0], [1, 0]], [[1, 0], [0, 0]]], "x"]),
+            Expectation(targets=[0], observable=["z"]),
+            Probability(targets=[7]),
+        ],
+        basis_rotation_instructions=[CZ(control=0, target=1)],
+    )
+    assert validator.validate(program, shots=1000) == [
+        Violation(
+            ViolationType.UNSUPPORTED_OBSERVABLE,
+            ("results", 0),
+            "Observable y is not supported for result type sample",
+        ),
+        Violation(
+            ViolationType.SHOTS_OUT_OF_RANGE,
+            ("results", 0),
+            "Result type sample does not support 1000 shots; the range is [10, 100]",
+        ),
+        Violation(
+            ViolationType.UNSUPPORTED_OBSERVABLE,
+            ("results", 1),
+            "Observable hermitian is not supported for result type sample",
+        ),
+        Violation(
+            ViolationType.SHOTS_OUT_OF_RANGE,
+            ("results", 1),
+            "Result type sample does not support 1000 shots; the range is [10, 100]",
+        ),
+        Violation(
+            ViolationType.UNSUPPORTED_RESULT_TYPE,
+            ("results", 2),
+            "Result type expectation is not supported",
+        ),
+        Violation(
+            ViolationType.QUBIT_OUT_OF_RANGE,
+            ("results", 3),
+            "Qubit 7 is out of range for 4 qubits",
+        ),
+        Violation(
+            ViolationType.SHOTS_OUT_OF_RANGE,
+            ("results", 3),
+            "Result type probability does not support 1000 shots; the range is [10, 100]",
+        ),
+        Violation(
+            ViolationType.UNSUPPORTED_OPERATION,
+            ("basis_rotation_instructions", 0),
+            "Operation cz is not supported",
+        ),
+    ]
+
+
+def test_many_programs(validator):
+    programs = [Program(instructions=[CNot(control=i, target=i + 1)]) for i in range(4)]
+    assert [len(validator.validate(program)) for program in programs] == [0, 0, 0, 2]
+
+
+def test_fully_connected(qpu):
+    qpu.paradigm.connectivity.fullyConnected = True
+    validator = JaqcdProgramValidator(qpu)
+    assert validator.validate(Program(instructions=[CNot(control=3, target=0)])) == []
+
+
+def test_non_integer_connectivity_labels(qpu):
+    qpu.paradigm.connectivity.connectivityGraph = {"0": ["1", "q2"], "q2": ["3"]}
+    validator = JaqcdProgramValidator(qpu)
+    programs = [
+        Program(instructions=[CNot(control=1, target=0)]),
+        Program(instructions=[CNot(control=0, target=2)]),
+        Program(instructions=[CNot(control=2, target=3)]),
+    ]
+    assert [len(validator.validate(program)) for program in programs] == [0, 1, 1]
+
+
+def test_result_types_not_checked(qpu):
+    qpu.action["braket.ir.jaqcd.program"].supportedResultTypes = None
+    validator = JaqcdProgramValidator(qpu)
+    program = Program(instructions=[X(target=0)], results=[StateVector()])
+    assert validator.validate(program, shots=0) == []
+
+
+def test_simulator(action):
+    paradigm = {
+        "braketSchemaHeader": {
+            "name": "braket.device_schema.simulators.gate_model_simulator_paradigm_properties",
+            "version": "1",
+        },
+        "qubitCount": 26,
+    }
+    capabilities = _capabilities(action, paradigm)
+    capabilities["braketSchemaHeader"] = {
+        "name": "braket.device_schema.simulators.gate_model_simulator_device_capabilities",
+        "version": "1",
+    }
+    validator = JaqcdProgramValidator(GateModelSimulatorDeviceCapabilities.parse_obj(capabilities))
+    assert validator.validate(Program(instructions=[CNot(control=3, target=25)])) == []
+    assert validator.validate(Program(instructions=[X(target=26)]))[0].type == (
+        ViolationType.QUBIT_OUT_OF_RANGE
+    )
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_no_jaqcd_action(qpu):
+    qpu.action.clear()
+    JaqcdProgramValidator(qpu)
@@ -0,0 +1,135 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from collections import Counter
+
+import pytest
+
+from braket.ir.jaqcd import (
+    CCNot,
+    CircuitStatistics,
+    CNot,
+    ColumnarInstructions,
+    CSwap,
+    Expectation,
+    H,
+    Program,
+    ProgramReader,
+    Rx,
+    Unitary,
+    X,
+    circuit_statistics,
+)
+from braket.ir.jaqcd.program_v1 import _valid_gates
+from braket.schema_common import synthetic
+
+
+@pytest.fixture
+def all_gates_program():
+    gate_mix = {gate_type.value: 1 for gate_type in _valid_gates}
+    return synthetic.program(1000, qubits=6, gate_mix=gate_mix).build()
+
+
+def _qubits(instruction):
+    # The qubits of an instruction, found from its fields rather than its class
+    qubits = []
+    for name in ("controls", "control", "targets", "target"):
+        value = getattr(instruction, name, None)
+        if value is not None:
+            qubits.extend(value if isinstance(value, list) else [value])
+    return qubits
+
+
+def _naive_statistics(instructions):
+    layers = {}
+    multi_qubit_gate_count = 0
+    for instruction in instructions:
+        qubits = _qubits(instruction)
+        layer = max(layers.get(qubit, 0) for qubit in qubits) + 1
+        layers.update({qubit: layer for qubit in qubits})
+        multi_qubit_gate_count += len(qubits) > 1
+    return CircuitStatistics(
+        instruction_count=len(instructions),
+        qubit_count=len(layers),
+        depth=max(layers.values(), default=0),
+        gate_counts=dict(Counter(instruction.type.value for instruction in instructions)),
+        multi_qubit_gate_count=multi_qubit_gate_count,
+    )
+
+
+def test_ghz():
+    program = Program(
+        instructions=[H(target=0), CNot(control=0, target=1), CNot(control=1, target=2)]
+    )
+    assert program.circuit_statistics() == CircuitStatistics(
+        instruction_count=3,
+        qubit_count=3,
+        depth=3,
+        gate_counts={"h": 1, "cnot": 2},
+        multi_qubit_gate_count=2,
+    )
+
+
+def test_parallel_gates():
+    instructions = [
+        H(target=0),
+        H(target=1),
+        X(target=5),
+        CCNot(controls=[0, 1], target=2),
+        CSwap(control=3, targets=[4, 5]),
+        Unitary(targets=[2, 5], matrix=[[[1, 0]] + [[0, 0]] * 3] * 4),
+        Rx(target=7, angle=0.1),
+    ]
+    statistics = circuit_statistics(instructions)
+    assert statistics.qubit_count == 7
+    assert statistics.depth == 3
+    assert statistics.multi_qubit_gate_count == 3
+    assert statistics.gate_counts == {"h": 2, "x": 1, "ccnot": 1, "cswap": 1, "unitary": 1, "rx": 1}
+
+
+def test_empty():
+    assert circuit_statistics([]) == CircuitStatistics(0, 0, 0, {}, 0)
+    assert circuit_statistics(ColumnarInstructions()) == CircuitStatistics(0, 0, 0, {}, 0)
+
+
+def test_all_gates(all_gates_program):
+    expected = _naive_statistics(all_gates_program.instructions)
+    assert all_gates_program.circuit_statistics() == expected
+    assert circuit_statistics(ColumnarInstructions(all_gates_program.instructions)) == expected
+    assert circuit_statistics(ProgramReader(all_gates_program.json())) == expected
+
+
+def test_cached(all_gates_program):
+    statistics = all_gates_program.circuit_statistics()
+    statistics.gate_counts.clear()
+    assert all_gates_program.circuit_statistics() == _naive_statistics(
+        all_gates_program.instructions
+    )
+    all_gates_program.instructions = all_gates_program.instructions[:10]
+    assert all_gates_program.circuit_statistics().instruction_count == 10
+    copied = all_gates_program.copy(update={"instructions": [H(target=0)]})
+    assert copied.circuit_statistics().instruction_count == 1
+
+
+def test_basis_rotation_instructions_excluded():
+    program = Program(
+        instructions=[H(target=0)],
+        results=[Expectation(targets=[1], observable=["x"])],
+        basis_rotation_instructions=[H(target=1)],
+    )
+    assert program.circuit_statistics() == CircuitStatistics(1, 1, 1, {"h": 1}, 0)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_gate():
+    circuit_statistics([Expectation(targets=[0], observable=["x"])])
@@ -0,0 +1,157 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import math
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.jaqcd import (
+    CCNot,
+    CNot,
+    ColumnarInstructions,
+    Expectation,
+    H,
+    Program,
+    Rx,
+    Unitary,
+    instruction_qubits,
+)
+from braket.schema_common import synthetic
+
+
+@pytest.fixture
+def instructions():
+    return [
+        H(target=0),
+        CNot(control=0, target=1),
+        Rx(target=2, angle=0.15),
+        CCNot(controls=[0, 1], target=2),
+        Unitary(targets=[1], matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]]),
+        Unitary(targets=[3, 2], matrix=[[[1, 0], [0, 0]], [[0, 0], [1, 0]]]),
+    ]
+
+
+@pytest.fixture
+def all_gates_program():
+    gate_mix = {gate_type.value: 1 for gate_type in Program._TYPE_DISPATCH["instructions"]}
+    return synthetic.program(500, qubits=5, gate_mix=gate_mix).build()
+
+
+def test_round_trip(instructions):
+    columns = ColumnarInstructions.from_list(instructions)
+    assert len(columns) == len(instructions)
+    assert columns.to_list() == instructions
+    assert list(columns) == instructions
+    assert columns == instructions
+
+
+def test_round_trip_all_gates(all_gates_program):
+    columns = ColumnarInstructions.from_list(all_gates_program.instructions)
+    assert columns.to_list() == all_gates_program.instructions
+    assert [type(instruction) for instruction in columns] == [
+        type(instruction) for instruction in all_gates_program.instructions
+    ]
+    program = Program(instructions=columns.to_list(), results=all_gates_program.results)
+    assert program == all_gates_program
+
+
+def test_decoded_instructions(all_gates_program):
+    decoded = all_gates_program.dict()["instructions"]
+    assert ColumnarInstructions(decoded) == ColumnarInstructions(all_gates_program.instructions)
+
+
+def test_columns(instructions):
+    columns = ColumnarInstructions(instructions)
+    assert [columns.gate_type(i) for i in range(len(columns))] == [
+        instruction.type for instruction in instructions
+    ]
+    assert columns.offsets.tolist() == [0, 1, 3, 4, 7, 8, 10]
+    assert columns.qubits.tolist() == [0, 0, 1, 2, 0, 1, 2, 1, 3, 2]
+    assert columns.qubits_of(3).tolist() == [0, 1, 2]
+    assert columns.qubits_of(-1).tolist() == [3, 2]
+    assert columns.angle(2) == 0.15
+    assert columns.angle(0) is None
+    assert math.isnan(columns.angles[0])
+    assert list(columns.matrices) == [4, 5]
+    assert columns.nbytes == 6 + 7 * 8 + 10 * 4 + 6 * 8
+
+
+def test_instruction_qubits(instructions):
+    columns = ColumnarInstructions(instructions)
+    assert [instruction_qubits(instruction) for instruction in instructions] == [
+        columns.qubits_of(i).tolist() for i in range(len(columns))
+    ]
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_instruction_qubits_invalid_gate():
+    instruction_qubits(Expectation(targets=[0], observable=["x"]))
+
+
+def test_indexing(instructions):
+    columns = ColumnarInstructions(instructions)
+    assert columns[1] == instructions[1]
+    assert columns[-1] == instructions[-1]
+    assert columns[1:4] == instructions[1:4]
+    assert columns[::-2] == instructions[::-2]
+    with pytest.raises(IndexError):
+        columns[len(instructions)]
+    with pytest.raises(IndexError):
+        columns.qubits_of(-len(instructions) - 1)
+
+
+def test_materialized_instruction(instructions):
+    instruction = ColumnarInstructions(instructions)[1]
+    assert isinstance(instruction, CNot)
+    assert instruction.type == CNot.Type.cnot
+    assert instruction.json() == CNot.parse_raw(instructions[1].json()).json()
+
+
+def test_append_and_extend(instructions):
+    columns = ColumnarInstructions()
+    columns.append(instructions[0])
+    columns.append({"type": "cnot", "control": 0, "target": 1})
+    columns.extend(instructions[2:])
+    assert columns == instructions
+
+
+def test_large_qubit_indices():
+    instructions = [H(target=1), CNot(control=2**40, target=0)]
+    columns = ColumnarInstructions(instructions)
+    assert columns.qubits.typecode == "Q"
+    assert columns.to_list() == instructions
+    assert columns == ColumnarInstructions(instructions[:1] + instructions[1:])
+
+
+def test_equality(instructions):
+    columns = ColumnarInstructions(instructions)
+    assert columns == ColumnarInstructions(instructions)
+    assert columns != ColumnarInstructions(instructions[:-1])
+    assert columns != instructions[:-1]
+    assert columns != "foo"
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_gate():
+    ColumnarInstructions([{"type": "foo", "target": 0}])
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_non_instruction():
+    ColumnarInstructions([Expectation(targets=[0], observable=["x"])])
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_instruction():
+    ColumnarInstructions([{"type": "h", "target": -1}])
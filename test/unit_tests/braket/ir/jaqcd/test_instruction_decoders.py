@@ -0,0 +1,167 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import math
+
+import pytest
+from pydantic import BaseModel, ValidationError, root_validator, validator
+
+from braket.ir.jaqcd import Program, Unitary, program_v1
+from braket.ir.jaqcd.instruction_decoders import instruction_decoder
+from braket.schema_common import synthetic
+
+
+def _decoded_instructions():
+    gate_mix = {gate_type.value: 1 for gate_type in program_v1._valid_gates}
+    return synthetic.program(300, qubits=4, gate_mix=gate_mix).document()["instructions"]
+
+
+def _validate_by_class(value):
+    return program_v1._valid_gates[value["type"]](**value)
+
+
+def test_all_gates_have_decoders():
+    assert set(program_v1._instruction_decoders) == set(program_v1._valid_gates)
+
+
+@pytest.mark.parametrize("value", _decoded_instructions())
+def test_same_as_class(value):
+    decoded = program_v1._instruction_decoders[value["type"]](value)
+    expected = _validate_by_class(value)
+    assert type(decoded) is type(expected)
+    assert decoded == expected
+    assert decoded.__fields_set__ == expected.__fields_set__
+    assert decoded.json() == expected.json()
+    assert list(decoded.__dict__) == list(expected.__dict__)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"type": "rx", "target": 0, "angle": 1},
+        {"type": "unitary", "targets": [0], "matrix": [[[0, 0], [1, 0]], [[1, 0], [0, 0]]]},
+        {"type": "unitary", "targets": [0, 1, 2], "matrix": [[[1, 0.5]]]},
+    ],
+)
+def test_ints_converted_to_floats(value):
+    decoded = program_v1._instruction_decoders[value["type"]](value)
+    expected = _validate_by_class(value)
+    assert decoded == expected
+    assert decoded.json() == expected.json()
+
+
+def test_inputs_are_copied():
+    targets = [0, 1]
+    decoded = program_v1._instruction_decoders["swap"]({"type": "swap", "targets": targets})
+    targets.append(2)
+    assert decoded.targets == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"type": "h", "target": "1"},
+        {"type": "h", "target": True},
+        {"type": "h", "target": 1.0},
+        {"type": "h", "target": 0, "extra": 1},
+        {"type": "rx", "target": 0, "angle": "0.5"},
+        {"type": "rx", "target": 0, "angle": False},
+        {"type": "swap", "targets": (0, 1)},
+        {"type": "unitary", "targets": [0], "matrix": (([1, 0],),)},
+        {"type": "rx", "target": 0, "angle": 10**400},
+    ],
+)
+def test_unusual_inputs_use_class(value):
+    assert program_v1._instruction_decoders[value["type"]](value) is None
+    try:
+        expected = _validate_by_class(value)
+    except Exception as e:
+        with pytest.raises(type(e)):
+            Program(instructions=[value])
+    else:
+        assert Program(instructions=[value]).instructions[0] == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"type": "h"},
+        {"type": "h", "target": -1},
+        {"type": "h", "target": None},
+        {"type": "cnot", "control": 0},
+        {"type": "ccnot", "controls": [0], "target": 1},
+        {"type": "ccnot", "controls": [0, 1, 2], "target": 3},
+        {"type": "swap", "targets": [0, -1]},
+        {"type": "swap", "targets": [0]},
+        {"type": "rx", "target": 0, "angle": math.inf},
+        {"type": "rx", "target": 0, "angle": math.nan},
+        {"type": "rx", "target": 0},
+        {"type": "unitary", "targets": [], "matrix": [[[1, 0]]]},
+        {"type": "unitary", "targets": [0], "matrix": []},
+        {"type": "unitary", "targets": [0], "matrix": [[]]},
+        {"type": "unitary", "targets": [0], "matrix": [[[1, 0, 0]]]},
+        {"type": "unitary", "targets": [0], "matrix": [[[1, math.nan]]]},
+    ],
+)
+def test_errors_unchanged(value, monkeypatch):
+    with pytest.raises(ValidationError) as decoded_error:
+        Program(instructions=[value])
+    monkeypatch.setattr(program_v1, "_instruction_decoders", {})
+    with pytest.raises(ValidationError) as class_error:
+        Program(instructions=[value])
+    assert str(decoded_error.value) == str(class_error.value)
+    assert decoded_error.value.errors() == class_error.value.errors()
+
+
+def test_unsupported_fields():
+    class Custom(BaseModel):
+        type = "custom"
+        label: str
+
+    assert instruction_decoder(Custom) is None
+
+
+class _CheckedUnitary(Unitary):
+    @validator("matrix")
+    def check_unitary(cls, value, values):
+        matrix = [[complex(*entry) for entry in row] for row in value]
+        for i, row in enumerate(matrix):
+            for j, other in enumerate(matrix):
+                if abs(sum(a * b.conjugate() for a, b in zip(row, other)) - (i == j)) > 1e-9:
+                    raise ValueError("matrix is not unitary")
+        return value
+
+
+def test_class_validators_run():
+    decoder = instruction_decoder(_CheckedUnitary)
+    valid = {"type": "unitary", "targets": [0], "matrix": [[[0, 0], [1, 0]], [[1, 0], [0, 0]]]}
+    assert decoder(valid) == _CheckedUnitary(**valid)
+    invalid = {"type": "unitary", "targets": [0], "matrix": [[[1, 0], [1, 0]], [[0, 0], [0, 0]]]}
+    assert decoder(invalid) is None
+    with pytest.raises(ValidationError):
+        _CheckedUnitary(**invalid)
+
+
+def test_unsupported_validators():
+    class PreValidated(Unitary):
+        @validator("targets", pre=True)
+        def check_targets(cls, value):
+            return value
+
+    class RootValidated(Unitary):
+        @root_validator
+        def check(cls, values):
+            return values
+
+    assert instruction_decoder(PreValidated) is None
+    assert instruction_decoder(RootValidated) is None
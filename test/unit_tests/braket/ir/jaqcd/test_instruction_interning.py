@@ -0,0 +1,156 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import pickle
+
+import pytest
+
+from braket.ir.jaqcd import (
+    CNot,
+    Expectation,
+    FrozenCNot,
+    FrozenH,
+    FrozenInstruction,
+    FrozenUnitary,
+    H,
+    InstructionTable,
+    Program,
+    Rx,
+    Unitary,
+    disable_interning,
+    enable_interning,
+    freeze,
+    get_instruction_table,
+)
+from braket.ir.jaqcd.program_v1 import _valid_gates
+from braket.schema_common import synthetic
+
+
+@pytest.fixture
+def table():
+    yield enable_interning()
+    disable_interning()
+
+
+@pytest.fixture
+def all_gates_program():
+    gate_mix = {gate_type.value: 1 for gate_type in _valid_gates}
+    return synthetic.program(300, qubits=3, gate_mix=gate_mix).build()
+
+
+def test_all_gates_have_frozen_variants(all_gates_program):
+    for instruction in all_gates_program.instructions:
+        frozen = freeze(instruction)
+        assert isinstance(frozen, FrozenInstruction)
+        assert isinstance(frozen, type(instruction))
+        assert frozen == instruction
+        assert frozen.json() == instruction.json()
+        assert frozen.__fields_set__ == instruction.__fields_set__
+        assert hash(frozen) == hash(freeze(type(instruction).parse_raw(instruction.json())))
+
+
+def test_frozen_is_hashable():
+    unitary = FrozenUnitary(targets=[0], matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]])
+    gates = {FrozenH(target=0), FrozenH(target=0), FrozenCNot(control=0, target=1), unitary}
+    assert len(gates) == 3
+    assert freeze(Unitary(targets=[0], matrix=unitary.matrix)) in gates
+
+
+def test_frozen_equal_to_instruction():
+    assert FrozenH(target=0) == H(target=0)
+    assert FrozenH(target=0) != FrozenH(target=1)
+    assert hash(FrozenH(target=0)) != hash(FrozenCNot(control=0, target=1))
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_frozen_is_immutable():
+    FrozenH(target=0).target = 1
+
+
+def test_freeze_frozen():
+    frozen = FrozenH(target=0)
+    assert freeze(frozen) is frozen
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_freeze_non_instruction():
+    freeze(Expectation(targets=[0], observable=["x"]))
+
+
+def test_pickle():
+    frozen = FrozenCNot(control=0, target=1)
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_table_interns():
+    table = InstructionTable()
+    first = table.intern(H(target=0))
+    assert isinstance(first, FrozenH)
+    assert table.intern(H(target=0)) is first
+    assert table.intern(FrozenH(target=0)) is first
+    assert table.intern(H(target=1)) is not first
+    assert len(table) == 2
+    table.clear()
+    assert len(table) == 0
+
+
+def test_table_keeps_fields_set():
+    table = InstructionTable()
+    implicit = table.intern(H(target=0))
+    explicit = table.intern(H(target=0, type="h"))
+    assert implicit is not explicit
+    assert explicit.__fields_set__ == {"target", "type"}
+
+
+def test_table_keeps_float_sign():
+    table = InstructionTable()
+    positive = table.intern(Rx(target=0, angle=0.0))
+    negative = table.intern(Rx(target=0, angle=-0.0))
+    assert positive is not negative
+    assert negative.angle.hex() == "-0x0.0p+0"
+    assert table.intern(Rx(target=0, angle=-0.0)) is negative
+    matrix = [[[1.0, 0.0], [0.0, 0.0]], [[0.0, 0.0], [1.0, 0.0]]]
+    signed = [[[1.0, -0.0], [0.0, 0.0]], [[0.0, 0.0], [1.0, 0.0]]]
+    unitary = table.intern(Unitary(targets=[0], matrix=matrix))
+    assert table.intern(Unitary(targets=[0], matrix=signed)) is not unitary
+
+
+def test_table_max_size():
+    table = InstructionTable(max_size=2)
+    for angle in range(5):
+        assert table.intern(Rx(target=0, angle=angle)) == Rx(target=0, angle=angle)
+    assert len(table) == 2
+
+
+def test_program_interning(table, all_gates_program):
+    program = Program.parse_raw(all_gates_program.json())
+    assert program == all_gates_program
+    assert get_instruction_table() is table
+    assert all(isinstance(instruction, FrozenInstruction) for instruction in program.instructions)
+    assert len(table) < len(program.instructions)
+    again = Program.parse_raw(all_gates_program.json())
+    assert all(a is b for a, b in zip(program.instructions, again.instructions))
+
+
+def test_program_interning_disabled(all_gates_program):
+    assert get_instruction_table() is None
+    program = Program.parse_raw(all_gates_program.json())
+    assert not any(
+        isinstance(instruction, FrozenInstruction) for instruction in program.instructions
+    )
+
+
+def test_program_keeps_instruction_objects(table):
+    instruction = CNot(control=0, target=1)
+    assert Program(instructions=[instruction]).instructions[0] is instruction
+    assert len(table) == 0
@@ -0,0 +1,279 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.jaqcd import (
+    Expectation,
+    H,
+    Probability,
+    Program,
+    ProgramReader,
+    Sample,
+    Unitary,
+    Variance,
+    disable_matrix_arrays,
+    enable_matrix_arrays,
+    freeze,
+    matrix_arrays_enabled,
+)
+from braket.schema_common import SchemaArray, get_json_codec, json_codec, set_json_codec
+from braket.task_result import AdditionalMetadata, GateModelTaskResult, TaskMetadata
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.fixture(autouse=True)
+def restore():
+    codec = get_json_codec()
+    yield
+    json_codec._codec = codec
+    disable_matrix_arrays()
+
+
+@pytest.fixture
+def unitary_array():
+    rng = numpy.random.default_rng(0)
+    size = 1 << 3
+    q, _ = numpy.linalg.qr(rng.normal(size=(size, size)) + 1j * rng.normal(size=(size, size)))
+    return q
+
+
+@pytest.fixture
+def program(unitary_array):
+    return Program(
+        instructions=[H(target=0), Unitary(targets=[0, 1, 2], matrix=unitary_array)],
+        basis_rotation_instructions=[Unitary(targets=[1], matrix=numpy.eye(2))],
+    )
+
+
+@pytest.fixture
+def hermitian_array(unitary_array):
+    return unitary_array + unitary_array.conj().T
+
+
+def _pairs(array):
+    return numpy.stack([array.real, array.imag], axis=-1).tolist()
+
+
+def test_array_matrix(unitary_array):
+    unitary = Unitary(targets=[0, 1, 2], matrix=unitary_array)
+    assert isinstance(unitary.matrix, SchemaArray)
+    assert unitary.matrix.dtype == numpy.complex128
+    assert numpy.array_equal(numpy.asarray(unitary.matrix), unitary_array)
+    assert not numpy.shares_memory(unitary.matrix.array, unitary_array)
+    assert unitary == Unitary(targets=[0, 1, 2], matrix=_pairs(unitary_array))
+
+
+def test_pairs_array(unitary_array):
+    pairs = numpy.array(_pairs(unitary_array))
+    assert Unitary(targets=[0, 1, 2], matrix=pairs) == Unitary(
+        targets=[0, 1, 2], matrix=unitary_array
+    )
+
+
+def test_real_array():
+    unitary = Unitary(targets=[0], matrix=numpy.array([[0, 1], [1, 0]]))
+    assert unitary.matrix == [[[0, 0], [1, 0]], [[1, 0], [0, 0]]]
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "ujson"])
+def test_serialization(program, unitary_array, codec):
+    pytest.importorskip(codec)
+    set_json_codec(codec)
+    listed = Program.parse_raw(program.json())
+    assert isinstance(listed.instructions[1].matrix, list)
+    assert listed == program
+    assert listed.json() == program.json()
+    assert listed.json(indent=4) == program.json(indent=4)
+    assert program.instructions[1].json() == listed.instructions[1].json()
+    target = io.StringIO()
+    program.write_json(target)
+    assert target.getvalue() == program.json()
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "ujson"])
+def test_nested_serialization(program, codec):
+    pytest.importorskip(codec)
+    set_json_codec(codec)
+    listed = Program.parse_raw(program.json())
+    metadata = AdditionalMetadata(action=program)
+    assert metadata.json() == AdditionalMetadata(action=listed).json()
+    result = GateModelTaskResult(
+        measurements=[[0, 0, 0]],
+        measuredQubits=[0, 1, 2],
+        taskMetadata=TaskMetadata(id="task", deviceId="device", shots=1),
+        additionalMetadata=metadata,
+    )
+    assert GateModelTaskResult.parse_raw(result.json()).additionalMetadata.action == program
+
+
+def test_dict_json_form(program):
+    document = program.dict()
+    assert isinstance(document["instructions"][1]["matrix"], list)
+    assert json.dumps(document) == json.dumps(Program.parse_raw(program.json()).dict())
+    unitary = program.instructions[1]
+    assert Unitary.parse_obj(json.loads(json.dumps(unitary.dict()))) == unitary
+
+
+def test_fingerprint_and_freeze(program):
+    listed = Program.parse_raw(program.json())
+    assert program.fingerprint() == listed.fingerprint()
+    assert freeze(program.instructions[1]) == freeze(listed.instructions[1])
+    assert hash(freeze(program.instructions[1])) == hash(
+        freeze(Unitary(targets=[0, 1, 2], matrix=numpy.asarray(program.instructions[1].matrix)))
+    )
+
+
+def test_schema_unchanged():
+    matrix_schema = Unitary.schema()["properties"]["matrix"]
+    assert matrix_schema["type"] == "array"
+    assert matrix_schema["items"]["items"]["items"] == {"type": "number"}
+
+
+def test_enable_matrix_arrays(program):
+    program_json = program.json()
+    assert not matrix_arrays_enabled()
+    enable_matrix_arrays()
+    assert matrix_arrays_enabled()
+    parsed = Program.parse_raw(program_json)
+    assert isinstance(parsed.instructions[1].matrix, SchemaArray)
+    assert isinstance(parsed.basis_rotation_instructions[0].matrix, SchemaArray)
+    assert parsed == program
+    streamed = list(ProgramReader(program_json))
+    assert isinstance(streamed[1].matrix, SchemaArray)
+    disable_matrix_arrays()
+    assert isinstance(Program.parse_raw(program_json).instructions[1].matrix, list)
+
+
+def test_unitary_tolerance(unitary_array):
+    enable_matrix_arrays(unitary_tolerance=1e-8)
+    Unitary(targets=[0, 1, 2], matrix=_pairs(unitary_array))
+    with pytest.raises(ValidationError, match="not unitary"):
+        Unitary(targets=[0, 1, 2], matrix=_pairs(unitary_array * 1.001))
+    enable_matrix_arrays()
+    Unitary(targets=[0, 1, 2], matrix=_pairs(unitary_array * 1.001))
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        [[[1, 0], [0, 0]], [[0, 0], [1, 0, 0]]],
+        [[[1, 0], [0, 0]], [[0, 0], ["one", 0]]],
+        [[[1, 0], [0, 0]], [[0, 0], [float("nan"), 0]]],
+        [],
+    ],
+)
+def test_invalid_lists_same_errors(matrix):
+    with pytest.raises(ValidationError) as list_error:
+        Unitary(targets=[0], matrix=matrix)
+    enable_matrix_arrays()
+    with pytest.raises(ValidationError) as array_error:
+        Unitary(targets=[0], matrix=matrix)
+    assert array_error.value.errors() == list_error.value.errors()
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize("matrix", [[[[1, 0], [0, 0]], [[0, 0]]], [[[1, 0]], [[0, 1]]]])
+def test_non_square_list(matrix):
+    Unitary(targets=[0], matrix=matrix)
+    enable_matrix_arrays()
+    Unitary(targets=[0], matrix=matrix)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_wrong_target_count(unitary_array):
+    Unitary(targets=[0, 1], matrix=unitary_array)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        numpy.eye(3),
+        numpy.ones((2, 4)),
+        numpy.ones(4),
+        numpy.ones((2, 2, 2, 2)),
+        numpy.array([[numpy.inf, 0], [0, 1]]),
+        numpy.array([[1j * numpy.nan, 0], [0, 1]]),
+        numpy.array([["a", "b"], ["c", "d"]]),
+        numpy.zeros((0, 0)),
+    ],
+)
+def test_invalid_arrays(matrix):
+    Unitary(targets=[0], matrix=matrix)
+
+
+@pytest.mark.parametrize("result_class", [Expectation, Sample, Variance])
+def test_observable_array(hermitian_array, result_class):
+    result = result_class(targets=[0, 1, 2, 3], observable=["z", hermitian_array])
+    assert result.observable[0] == "z"
+    assert isinstance(result.observable[1], SchemaArray)
+    listed = result_class(targets=[0, 1, 2, 3], observable=["z", _pairs(hermitian_array)])
+    assert result == listed
+    assert result.json() == listed.json()
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+def test_observable_serialization(hermitian_array, codec):
+    pytest.importorskip(codec)
+    set_json_codec(codec)
+    program = Program(
+        instructions=[H(target=0)],
+        results=[Expectation(targets=[0, 1, 2], observable=[hermitian_array]), Probability()],
+    )
+    listed = Program.parse_raw(program.json())
+    assert isinstance(listed.results[0].observable[0], list)
+    assert listed == program
+    assert listed.json() == program.json()
+    assert listed.fingerprint() == program.fingerprint()
+
+
+def test_enable_matrix_arrays_observables(hermitian_array):
+    enable_matrix_arrays()
+    result = Expectation(targets=[0, 1, 2, 3], observable=["x", _pairs(hermitian_array)])
+    assert result.observable[0] == "x"
+    assert isinstance(result.observable[1], SchemaArray)
+    parsed = Program.parse_raw(Program(instructions=[], results=[result]).json())
+    assert isinstance(parsed.results[0].observable[1], SchemaArray)
+
+
+def test_hermitian_tolerance(hermitian_array, unitary_array):
+    enable_matrix_arrays(hermitian_tolerance=1e-8)
+    Variance(observable=[_pairs(hermitian_array)])
+    Variance(observable=[hermitian_array])
+    with pytest.raises(ValidationError, match="not Hermitian"):
+        Variance(observable=[unitary_array])
+    with pytest.raises(ValidationError, match="not Hermitian"):
+        Variance(observable=[_pairs(hermitian_array + 1e-6j)])
+    Unitary(targets=[0, 1, 2], matrix=unitary_array)
+    enable_matrix_arrays()
+    Variance(observable=[unitary_array])
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        numpy.ones((1, 1)),
+        numpy.eye(3),
+        numpy.array([[numpy.nan, 0], [0, 1]]),
+        numpy.ones((2, 2, 3)),
+    ],
+)
+def test_invalid_observable_arrays(matrix):
+    Expectation(observable=[matrix])
@@ -0,0 +1,154 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.jaqcd import CNot, Expectation, H, Program, ProgramReader, Rx
+from braket.schema_common import synthetic
+
+
+@pytest.fixture
+def program():
+    return synthetic.program(200, qubits=5).build()
+
+
+@pytest.fixture
+def program_with_rotations():
+    return Program(
+        instructions=[H(target=0), CNot(control=0, target=1), Rx(target=1, angle=0.15)],
+        results=[Expectation(targets=[0], observable=["x"])],
+        basis_rotation_instructions=[H(target=0)],
+    )
+
+
+def _sources(json_str, tmp_path):
+    path = tmp_path / "program.json"
+    path.write_text(json_str, encoding="utf-8")
+    return [
+        json_str,
+        json_str.encode(),
+        bytearray(json_str.encode()),
+        memoryview(json_str.encode()),
+        io.StringIO(json_str),
+        io.BytesIO(json_str.encode()),
+        path,
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_same_as_program(program, chunk_size, tmp_path):
+    for source in _sources(program.json(), tmp_path):
+        reader = ProgramReader(source, chunk_size=chunk_size)
+        assert not reader.complete
+        assert list(reader) == program.instructions
+        assert reader.complete
+        assert reader.results == program.results
+        assert reader.basis_rotation_instructions is None
+
+
+def test_fields_available_when_read(program_with_rotations):
+    document = program_with_rotations.dict()
+    instructions = document.pop("instructions")
+    document["instructions"] = instructions
+    reader = ProgramReader(json.dumps(document))
+    first = next(iter(reader))
+    assert first == program_with_rotations.instructions[0]
+    assert reader.results == program_with_rotations.results
+    assert reader.basis_rotation_instructions == program_with_rotations.basis_rotation_instructions
+    assert not reader.complete
+
+
+def test_fields_after_instructions(program_with_rotations):
+    reader = ProgramReader(program_with_rotations.json(), chunk_size=1)
+    instructions = iter(reader)
+    next(instructions)
+    assert reader.results is None
+    assert list(instructions) == program_with_rotations.instructions[1:]
+    assert reader.results == program_with_rotations.results
+    assert reader.basis_rotation_instructions == program_with_rotations.basis_rotation_instructions
+    assert list(reader) == []
+
+
+@pytest.mark.parametrize(
+    "json_str",
+    [
+        '{"instructions": []}',
+        ' { "instructions" : [ ] , "foo": "éè" } ',
+        '{"foo": {"instructions": [1]}, "instructions": []}',
+    ],
+)
+def test_empty(json_str):
+    reader = ProgramReader(json_str.encode(), chunk_size=1)
+    assert list(reader) == []
+    assert reader.complete
+
+
+def test_buffer_bounded():
+    json_str = synthetic.program(2000, qubits=5).json()
+    reader = ProgramReader(json_str, chunk_size=256)
+    longest = 0
+    for _ in reader:
+        longest = max(longest, len(reader._buffer))
+    assert longest < 4096 < len(json_str)
+
+
+def test_path_closed(program, tmp_path):
+    path = tmp_path / "program.json"
+    path.write_text(program.json())
+    with ProgramReader(path) as reader:
+        next(iter(reader))
+    assert reader._file.closed
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"instructions": [{"type": "h", "target": 0}, {"type": "h", "target": -1}]},
+        {"instructions": [{"type": "h", "target": 0}, {"type": "foo", "target": 0}]},
+        {"instructions": [{"type": "h", "target": 0}, 5]},
+        {"instructions": {"type": "h", "target": 0}},
+        {"instructions": None},
+        {"instructions": [], "results": [{"type": "foo"}]},
+        {"instructions": [], "braketSchemaHeader": {"name": "foo", "version": "1"}},
+        {"results": []},
+    ],
+)
+def test_validation_errors_same_as_program(document):
+    with pytest.raises(ValidationError) as program_error:
+        Program.parse_obj(document)
+    with pytest.raises(ValidationError) as reader_error:
+        list(ProgramReader(json.dumps(document), chunk_size=3))
+    assert str(reader_error.value) == str(program_error.value)
+
+
+@pytest.mark.parametrize(
+    "json_str",
+    [
+        "",
+        "[]",
+        '{"instructions": [{"type": "h", "target": 0}',
+        '{"instructions": [{"type": "h", "target": 0}}',
+        '{"instructions": []',
+        '{"instructions": [] "results": []}',
+        '{"instructions" []}',
+        "{instructions: []}",
+        '{"instructions": [{"type": "h", "target": 0}]} {}',
+    ],
+)
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_json(json_str):
+    list(ProgramReader(json_str, chunk_size=4))
@@ -0,0 +1,176 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import math
+import random
+
+import pytest
+
+from braket.ir.jaqcd import (
+    XX,
+    CNot,
+    CPhaseShift01,
+    Expectation,
+    H,
+    Program,
+    ProgramTemplate,
+    Rx,
+    Rz,
+)
+from braket.schema_common import set_json_codec, synthetic
+
+
+@pytest.fixture
+def program():
+    return Program(
+        instructions=[
+            H(target=0),
+            Rx(target=0, angle=0.1),
+            CNot(control=0, target=1),
+            XX(targets=[0, 1], angle=0.2),
+            CPhaseShift01(control=1, target=0, angle=0.3),
+        ],
+        results=[Expectation(targets=[0], observable=["z"])],
+        basis_rotation_instructions=[Rz(target=0, angle=0.5)],
+    )
+
+
+@pytest.fixture
+def template(program):
+    return ProgramTemplate(program)
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec(request):
+    set_json_codec(request.param)
+    yield request.param
+    set_json_codec("json")
+
+
+def test_slots(template, program):
+    assert template.program is program
+    assert template.slots == (1, 3, 4)
+    assert template.angles.tolist() == [0.1, 0.2, 0.3]
+
+
+def test_bind(template, program):
+    bound = template.bind([1, -2.5, 1e-300])
+    expected = Program.parse_obj(
+        {
+            **program.dict(),
+            "instructions": [
+                H(target=0),
+                Rx(target=0, angle=1.0),
+                CNot(control=0, target=1),
+                XX(targets=[0, 1], angle=-2.5),
+                CPhaseShift01(control=1, target=0, angle=1e-300),
+            ],
+        }
+    )
+    assert bound == expected
+    assert bound.json() == expected.json()
+    assert type(bound.instructions[1].angle) is float
+    assert bound.instructions[0] is program.instructions[0]
+    assert program.instructions[1].angle == 0.1
+
+
+def test_bind_initial_angles(template, program):
+    assert template.bind(template.angles) == program
+    assert template.bind_json(template.angles) == program.json()
+
+
+def test_bind_json(template, codec):
+    for angles in ([1, -2.5, 1e-300], [math.pi, 1e16, -0.0], [0, 0, 12345678901234567890]):
+        assert template.bind_json(angles) == template.bind(angles).json()
+
+
+def test_bind_json_after_codec_change(template):
+    angles = [0.1, 1e16, 2]
+    template.bind_json(angles)
+    set_json_codec("orjson")
+    try:
+        assert template.bind_json(angles) == template.bind(angles).json()
+    finally:
+        set_json_codec("json")
+    assert template.bind_json(angles) == template.bind(angles).json()
+
+
+def test_no_slots():
+    program = Program(instructions=[H(target=0)])
+    template = ProgramTemplate(program)
+    assert template.slots == ()
+    assert template.bind([]) == program
+    assert template.bind_json([]) == program.json()
+
+
+def test_synthetic_program():
+    program = synthetic.program(500, qubits=4).build()
+    template = ProgramTemplate(program)
+    rng = random.Random(0)
+    angles = [rng.uniform(-math.pi, math.pi) for _ in template.slots]
+    bound = template.bind(angles)
+    assert bound == Program.parse_raw(template.bind_json(angles))
+    assert [bound.instructions[index].angle for index in template.slots] == angles
+
+
+def test_bind_batch(template):
+    rows = [[0.1, 0.2, 0.3], [1, 2, 3]]
+    assert template.bind_batch(rows) == [template.bind(row) for row in rows]
+    assert template.bind_batch(rows, as_json=True) == [template.bind_json(row) for row in rows]
+
+
+def test_bind_batch_numpy(template):
+    numpy = pytest.importorskip("numpy")
+    sweep = numpy.linspace(0, math.pi, 30).reshape(10, 3)
+    programs = template.bind_batch(sweep)
+    assert [program.instructions[3].angle for program in programs] == sweep[:, 1].tolist()
+    assert template.bind_batch(sweep, as_json=True) == [program.json() for program in programs]
+    assert template.bind(sweep[0]) == programs[0]
+
+
+def test_bind_numpy_scalars(template):
+    numpy = pytest.importorskip("numpy")
+    angles = [numpy.float64(0.1), numpy.float32(0.5), numpy.int64(3)]
+    program = template.bind(angles)
+    assert [type(program.instructions[index].angle) for index in (1, 3, 4)] == [float] * 3
+    assert template.bind(angles) == template.bind([0.1, 0.5, 3.0])
+    assert template.bind_json(angles) == template.bind_json([0.1, 0.5, 3.0])
+    assert template.bind_batch([angles], as_json=True) == [template.bind_json(angles)]
+
+
+@pytest.mark.parametrize(
+    "angles",
+    [
+        [0.1, 0.2],
+        [0.1, 0.2, 0.3, 0.4],
+        [0.1, 0.2, math.nan],
+        [0.1, math.inf, 0.3],
+        [0.1, 0.2, 10**400],
+        [0.1, 0.2, "0.3"],
+        [0.1, 0.2, True],
+        [0.1, 0.2, None],
+    ],
+)
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_angles(template, angles):
+    template.bind(angles)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_angles_json(template):
+    template.bind_json([0.1, 0.2, math.nan])
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_batch_row(template):
+    template.bind_batch([[0.1, 0.2, 0.3], [0.1, 0.2]])
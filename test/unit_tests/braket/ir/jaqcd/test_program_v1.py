@@ -11,11 +11,22 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+from typing import List, Optional
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError, create_model
 
-from braket.ir.jaqcd import CNot, Expectation, H
-from braket.ir.jaqcd.program_v1 import Program
+from braket.ir.jaqcd import (
+    Amplitude,
+    CNot,
+    Expectation,
+    H,
+    Probability,
+    Sample,
+    StateVector,
+    Variance,
+)
+from braket.ir.jaqcd.program_v1 import Program, Results, _valid_results
 
 
 @pytest.mark.xfail(raises=ValidationError)
@@ -69,3 +80,54 @@ def test_no_rotation_basis_instruction():
 
 def test_rotation_basis_instruction():
     Program(instructions=[CNot(control=0, target=1)], basis_rotation_instructions=[H(target=1)])
+
+
+def test_results_dispatched_by_type():
+    results = [
+        Amplitude(states=["01"]),
+        Expectation(targets=[1], observable=["x"]),
+        Probability(targets=[0]),
+        Sample(observable=["z"]),
+        StateVector(),
+        Variance(targets=[0], observable=["y"]),
+    ]
+    assert {type(result) for result in results} == set(_valid_results.values())
+    program = Program(instructions=[H(target=0)], results=results)
+    parsed = Program.parse_raw(program.json())
+    assert parsed.results == results
+    assert [type(result) for result in parsed.results] == [type(result) for result in results]
+    assert Program.construct_trusted(program.dict()).results == results
+
+
+def test_result_errors_from_type():
+    with pytest.raises(ValidationError) as e:
+        Program(instructions=[], results=[{"type": "variance", "observable": ["q"]}])
+    # Only the class of the type validates the result, so there are no errors of the
+    # result types before it, such as the missing states of Amplitude
+    assert {error["loc"][:3] for error in e.value.errors()} == {("results", 0, "observable")}
+
+
+def test_results_schema():
+    # The schema of the results is that of the plain Union[] of the result types
+    reference = create_model(
+        "Reference", __base__=BaseModel, results=(Optional[List[Results]], None)
+    )
+    schema = Program.schema()
+    reference_schema = reference.schema()
+    assert schema["properties"]["results"] == reference_schema["properties"]["results"]
+    assert {
+        name: definition
+        for name, definition in schema["definitions"].items()
+        if name in reference_schema["definitions"]
+    } == reference_schema["definitions"]
+
+
+def test_result_without_type():
+    program = Program(instructions=[], results=[{"targets": [0], "observable": ["x"]}])
+    assert program.results == [Expectation(targets=[0], observable=["x"])]
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize("result", [{"type": "h", "target": 0}, {"type": "foo"}, None, "x"])
+def test_invalid_result(result):
+    Program(instructions=[], results=[result])
@@ -0,0 +1,191 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import json
+import math
+import random
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.annealing import Problem, ProblemType
+from braket.ir.jaqcd import Expectation, H, Program, Rx, Sample, Unitary
+from braket.schema_common import BraketSchemaBase, get_json_codec, json_codec, set_json_codec
+from braket.task_result import TaskMetadata
+from braket.task_result.gate_model_task_result_v1 import ResultTypeValue
+
+CODECS = ["json", "orjson", "ujson"]
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    codec = get_json_codec()
+    yield
+    json_codec._codec = codec
+
+
+@pytest.fixture(params=CODECS)
+def codec(request):
+    pytest.importorskip(request.param)
+    return set_json_codec(request.param)
+
+
+@pytest.fixture
+def angles():
+    rng = random.Random(0)
+    return [
+        0.1,
+        1 / 3,
+        -0.0,
+        math.pi,
+        5e-324,
+        2.2250738585072014e-308,
+        1.7976931348623157e308,
+        -123456789.98765432,
+        *[rng.uniform(-10, 10) for _ in range(100)],
+        *[rng.uniform(-1, 1) * 10 ** rng.randint(-300, 300) for _ in range(100)],
+    ]
+
+
+def test_set_json_codec(codec):
+    assert get_json_codec() is codec
+    assert BraketSchemaBase.__config__.json_loads is json_codec.loads
+    assert BraketSchemaBase.__config__.json_dumps is json_codec.dumps
+
+
+def test_angle_round_trip(codec, angles):
+    program = Program(instructions=[Rx(target=i, angle=angle) for i, angle in enumerate(angles)])
+    parsed = BraketSchemaBase.parse_raw_schema(program.json())
+    assert [instruction.angle.hex() for instruction in parsed.instructions] == [
+        angle.hex() for angle in angles
+    ]
+    assert [
+        instruction.angle.hex() for instruction in Program.parse_raw(program.json()).instructions
+    ] == [angle.hex() for angle in angles]
+
+
+def _float_hex(value):
+    return [float(item).hex() for item in value] if isinstance(value, list) else value.hex()
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf, [0.5, math.nan, -math.inf]])
+def test_non_finite_round_trip(codec, value):
+    result_type = ResultTypeValue(type=Expectation(observable=["z"]), value=value)
+    parsed = ResultTypeValue.parse_obj(json_codec.loads(result_type.json()))
+    assert _float_hex(parsed.value) == _float_hex(value)
+
+
+def test_non_finite_array_round_trip(codec):
+    numpy = pytest.importorskip("numpy")
+    samples = numpy.array([1.0, numpy.nan, numpy.inf])
+    result_type = ResultTypeValue(type=Sample(observable=["z"]), value=samples)
+    parsed = ResultTypeValue.parse_obj(json_codec.loads(result_type.json()))
+    assert _float_hex(list(parsed.value)) == _float_hex(samples.tolist())
+
+
+def test_null_not_walked(monkeypatch):
+    pytest.importorskip("orjson")
+    set_json_codec("orjson")
+
+    def walk(obj, default):
+        raise AssertionError("walked")
+
+    monkeypatch.setattr(json_codec, "_has_non_finite_float", walk)
+    program = Program(instructions=[Rx(target=0, angle=0.5), H(target=1)])
+    assert Program.parse_raw(program.json()) == program
+    assert json_codec.dumps({"value": None, "items": [0.5, None]}) == (
+        '{"value":null,"items":[0.5,null]}'
+    )
+
+
+def test_matrix_round_trip(codec, angles):
+    size = 8
+    matrix = [
+        [
+            [
+                angles[(2 * (row * size + col)) % len(angles)],
+                angles[(2 * (row * size + col) + 1) % len(angles)],
+            ]
+            for col in range(size)
+        ]
+        for row in range(size)
+    ]
+    program = Program(instructions=[Unitary(targets=[0, 1, 2], matrix=matrix)])
+    parsed = Program.parse_raw(program.json())
+    assert [
+        [[value.hex() for value in entry] for entry in row] for row in parsed.instructions[0].matrix
+    ] == [[[float(value).hex() for value in entry] for entry in row] for row in matrix]
+
+
+def test_problem_int_keys(codec):
+    problem = Problem(type=ProblemType.QUBO, linear={0: 0.3, 4: -0.3}, quadratic={"0,4": 0.667})
+    assert BraketSchemaBase.parse_raw_schema(problem.json()) == problem
+
+
+def test_json_kwargs(codec):
+    program = Program(instructions=[H(target=0)])
+    for kwargs in ({"indent": 2}, {"sort_keys": True}, {"indent": 4}, {"separators": (",", ":")}):
+        assert json.loads(program.json(**kwargs)) == json.loads(program.json())
+    assert program.json(indent=4) == json.dumps(json.loads(program.json()), indent=4)
+
+
+def test_large_int_fallback(codec):
+    assert json.loads(json_codec.dumps({"value": 2**70})) == {"value": 2**70}
+
+
+@pytest.mark.parametrize(
+    "to_source",
+    [
+        lambda json_str: json_str,
+        lambda json_str: json_str.encode(),
+        lambda json_str: bytearray(json_str.encode()),
+        lambda json_str: memoryview(json_str.encode()),
+    ],
+)
+def test_parse_sources(codec, to_source):
+    schema = TaskMetadata(id="test_id", deviceId="device_id", shots=1000)
+    assert BraketSchemaBase.parse_raw_schema(to_source(schema.json())) == schema
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_invalid_json(codec):
+    TaskMetadata.parse_raw("{")
+
+
+def test_fallback_when_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", None)
+    assert set_json_codec("orjson").name == "json"
+    assert set_json_codec("auto").name == "json"
+
+
+def test_auto():
+    pytest.importorskip("orjson")
+    assert set_json_codec("auto").name == "orjson"
+
+
+def test_environment_variable(monkeypatch):
+    monkeypatch.setenv(json_codec.JSON_CODEC_ENV_VAR, "JSON")
+    assert set_json_codec().name == "json"
+    monkeypatch.delenv(json_codec.JSON_CODEC_ENV_VAR)
+    assert set_json_codec().name == json_codec.DEFAULT_JSON_CODEC
+
+
+def test_set_on_schema_base():
+    assert BraketSchemaBase.set_json_codec("json") is get_json_codec()
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_unknown_codec():
+    set_json_codec("simplejson")
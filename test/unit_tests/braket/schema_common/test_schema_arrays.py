@@ -0,0 +1,170 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import copy
+import pickle
+
+import pytest
+
+from braket.schema_common import (
+    KeyedSchemaArray,
+    SchemaArray,
+    get_json_codec,
+    json_codec,
+    set_json_codec,
+)
+from braket.schema_common.schema_arrays import encode_array, is_ndarray
+from braket.schema_common.schema_fingerprint import _Encoder
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    codec = get_json_codec()
+    yield
+    json_codec._codec = codec
+
+
+@pytest.fixture
+def matrix():
+    return SchemaArray(numpy.array([[0, 1j], [-1j, -0.0]]))
+
+
+def _digest(value):
+    encoder = _Encoder()
+    encoder.encode(value)
+    encoder.flush()
+    return encoder.digest.hexdigest()
+
+
+def test_json_form(matrix):
+    assert matrix.tolist() == [[[0.0, 0.0], [0.0, 1.0]], [[-0.0, -1.0], [-0.0, 0.0]]]
+    assert matrix.json_array().dtype == numpy.float64
+    assert numpy.shares_memory(matrix.json_array(), matrix.array)
+    assert list(matrix) == matrix.tolist()
+    assert matrix[1] == [[-0.0, -1.0], [-0.0, 0.0]]
+    assert len(matrix) == 2
+    assert matrix.shape == (2, 2)
+    assert matrix.dtype == numpy.complex128
+    assert numpy.asarray(matrix) is matrix.array
+
+
+def test_real_array():
+    array = SchemaArray(numpy.array([0.25, 0.75]))
+    assert array.tolist() == [0.25, 0.75]
+    assert array == [0.25, 0.75]
+
+
+def test_equality(matrix):
+    assert matrix == [[[0, 0], [0, 1]], [[0, -1], [0, 0]]]
+    assert matrix == SchemaArray(numpy.array([[0, 1j], [-1j, 0]]))
+    assert matrix != SchemaArray(numpy.array([[0, 1j], [1j, 0]]))
+    assert matrix != SchemaArray(numpy.zeros((1, 2)))
+    assert matrix != "matrix"
+    assert hash(matrix) == hash(SchemaArray(numpy.array([[0, 1j], [-1j, -0.0]])))
+
+
+@pytest.mark.parametrize("dtype", [numpy.int64, numpy.uint8, numpy.float64, numpy.complex128])
+def test_equal_across_dtypes(dtype):
+    ints = SchemaArray(numpy.array([[1, 2], [0, 3]]))
+    other = SchemaArray(numpy.array([[1, 2], [0, 3]], dtype=dtype))
+    assert ints == other
+    assert hash(ints) == hash(other)
+    assert hash(SchemaArray(numpy.array([1.0, -0.0]))) == hash(SchemaArray(numpy.array([1, 0])))
+
+
+def test_read_only(matrix):
+    with pytest.raises(ValueError):
+        matrix.array[0, 0] = 1
+
+
+def test_copy_and_pickle(matrix):
+    assert copy.deepcopy(matrix) == matrix
+    assert pickle.loads(pickle.dumps(matrix)) == matrix
+
+
+def test_is_ndarray(matrix):
+    assert is_ndarray(matrix.array)
+    assert not is_ndarray(matrix)
+    assert not is_ndarray([1])
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "ujson"])
+def test_encode_array(matrix, codec):
+    pytest.importorskip(codec)
+    set_json_codec(codec)
+    encoded = encode_array(matrix)
+    if get_json_codec().accepts_arrays:
+        assert is_ndarray(encoded)
+    else:
+        assert encoded == matrix.tolist()
+    assert json_codec.loads(json_codec.dumps(matrix, default=encode_array)) == matrix.tolist()
+    assert json_codec.loads(json_codec.dumps(matrix, default=encode_array, indent=4)) == (
+        matrix.tolist()
+    )
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        numpy.array([[0, 1j], [-1j, -0.0]]),
+        numpy.arange(6).reshape(2, 3),
+        numpy.array([0.5, -1.5, numpy.pi], dtype=numpy.float32),
+        numpy.array([1, 2**63 + 1], dtype=numpy.uint64),
+        numpy.array([True, False]),
+        numpy.zeros((2, 0)),
+    ],
+)
+def test_fingerprint_encoding(array):
+    assert _digest(SchemaArray(array)) == _digest(SchemaArray(array).tolist())
+
+
+@pytest.fixture
+def amplitudes():
+    return KeyedSchemaArray(["00", "11"], numpy.array([0.5j, -0.5]))
+
+
+def test_keyed_json_form(amplitudes):
+    assert amplitudes.json_form() == {"00": [0.0, 0.5], "11": [-0.5, 0.0]}
+    assert list(amplitudes) == ["00", "11"]
+    assert amplitudes["11"] == [-0.5, 0.0]
+    assert dict(amplitudes.items()) == amplitudes.json_form()
+    assert amplitudes.json_form(arrays=True)["00"].dtype == numpy.float64
+
+
+def test_keyed_equality(amplitudes):
+    assert amplitudes == {"00": [0, 0.5], "11": [-0.5, 0]}
+    assert amplitudes == KeyedSchemaArray(["00", "11"], numpy.array([0.5j, -0.5]))
+    assert amplitudes != KeyedSchemaArray(["01", "11"], numpy.array([0.5j, -0.5]))
+    assert amplitudes != [[0.0, 0.5], [-0.5, 0.0]]
+    assert hash(amplitudes) == hash(KeyedSchemaArray(("00", "11"), numpy.array([0.5j, -0.5])))
+    assert copy.deepcopy(amplitudes) == amplitudes
+    assert pickle.loads(pickle.dumps(amplitudes)) == amplitudes
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+def test_encode_keyed_array(amplitudes, codec):
+    pytest.importorskip(codec)
+    set_json_codec(codec)
+    encoded = json_codec.dumps(amplitudes, default=encode_array)
+    assert json_codec.loads(encoded) == amplitudes.json_form()
+
+
+def test_keyed_fingerprint_encoding(amplitudes):
+    assert _digest(amplitudes) == _digest(amplitudes.json_form())
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_keyed_array_wrong_key_count():
+    KeyedSchemaArray(["00"], numpy.array([0.5j, -0.5]))
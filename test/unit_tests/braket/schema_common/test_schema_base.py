@@ -11,10 +11,22 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import io
+import json
+import mmap
+from unittest.mock import Mock, patch
+
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 
-from braket.schema_common import BraketSchemaBase, BraketSchemaHeader
+from braket.schema_common import (
+    BraketSchemaBase,
+    BraketSchemaHeader,
+    get_json_codec,
+    json_codec,
+    schema_base,
+    set_json_codec,
+)
 from braket.task_result.task_metadata_v1 import TaskMetadata
 
 
@@ -62,3 +74,196 @@ def test_parse_raw_schema():
     )
     assert schema == BraketSchemaBase.parse_raw_schema(schema.json())
     assert isinstance(schema, TaskMetadata)
+
+
+def test_parse_raw_schema_bytes():
+    schema = TaskMetadata(
+        id="test_id",
+        deviceId="device_id",
+        shots=1000,
+    )
+    assert schema == BraketSchemaBase.parse_raw_schema(schema.json().encode())
+
+
+def test_parse_raw_schema_decodes_once():
+    schema = TaskMetadata(
+        id="test_id",
+        deviceId="device_id",
+        shots=1000,
+    )
+    json_loads = BraketSchemaBase.__config__.json_loads
+    with patch.object(
+        BraketSchemaBase.__config__, "json_loads", side_effect=json_loads
+    ) as mock_loads:
+        assert schema == BraketSchemaBase.parse_raw_schema(schema.json())
+    mock_loads.assert_called_once()
+
+
+def test_parse_obj_schema():
+    schema = TaskMetadata(
+        id="test_id",
+        deviceId="device_id",
+        shots=1000,
+    )
+    parsed = BraketSchemaBase.parse_obj_schema(json.loads(schema.json()))
+    assert parsed == schema
+    assert isinstance(parsed, TaskMetadata)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_raw_schema_invalid_json():
+    BraketSchemaBase.parse_raw_schema("{")
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_raw_schema_missing_header():
+    BraketSchemaBase.parse_raw_schema('{"id": "test_id"}')
+
+
+def test_parse_raw_schema_registered_class_skips_import():
+    schema = TaskMetadata(
+        id="test_id",
+        deviceId="device_id",
+        shots=1000,
+    )
+    with patch.object(BraketSchemaBase, "import_schema_module") as mock_import:
+        assert schema == BraketSchemaBase.parse_raw_schema(schema.json())
+    mock_import.assert_not_called()
+
+
+@pytest.fixture
+def schema_registry():
+    # Unregisters the schemas the test defines when it ends
+    with patch.dict(schema_base._schema_registry):
+        yield schema_base._schema_registry
+
+
+def test_subclass_with_header_registered(schema_registry):
+    header = BraketSchemaHeader(name="braket.test.registered_schema", version="1")
+
+    class RegisteredSchema(BraketSchemaBase):
+        braketSchemaHeader: BraketSchemaHeader = Field(default=header, const=header)
+        value: int
+
+    parsed = BraketSchemaBase.parse_raw_schema(RegisteredSchema(value=1).json())
+    assert isinstance(parsed, RegisteredSchema)
+    assert parsed.value == 1
+    assert schema_registry[(header.name, header.version)] is RegisteredSchema
+
+
+def test_subclass_inheriting_header_not_registered(schema_registry):
+    class InheritedSchema(TaskMetadata):
+        pass
+
+    schema = TaskMetadata(id="test_id", deviceId="device_id", shots=1000)
+    assert type(BraketSchemaBase.parse_raw_schema(schema.json())) is TaskMetadata
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_register_schema_without_header():
+    BraketSchemaBase.register_schema(BraketSchemaBase)
+
+
+def test_parse_raw_schema_entry_point(monkeypatch, schema_registry):
+    header = BraketSchemaHeader(name="braket.test.entry_point_schema", version="1")
+    registered = {}
+
+    def load():
+        class EntryPointSchema(BraketSchemaBase):
+            braketSchemaHeader: BraketSchemaHeader = Field(default=header, const=header)
+
+        registered["schema"] = EntryPointSchema
+        return EntryPointSchema
+
+    entry_point = Mock(load=load)
+    entry_points = Mock(return_value=Mock(select=Mock(return_value=[entry_point])))
+    monkeypatch.setattr(schema_base, "_entry_points_loaded", False)
+    with patch("importlib.metadata.entry_points", entry_points):
+        parsed = BraketSchemaBase.parse_raw_schema(
+            BraketSchemaBase(braketSchemaHeader=header).json()
+        )
+    assert isinstance(parsed, registered["schema"])
+    entry_points.return_value.select.assert_called_once_with(
+        group=schema_base.SCHEMA_ENTRY_POINT_GROUP
+    )
+
+
+@pytest.fixture
+def task_metadata():
+    return TaskMetadata(id="test_id", deviceId="device_id", shots=1000)
+
+
+@pytest.mark.parametrize(
+    "to_source",
+    [
+        lambda json_str: json_str.encode(),
+        lambda json_str: bytearray(json_str.encode()),
+        lambda json_str: memoryview(json_str.encode()),
+        lambda json_str: memoryview(json_str.encode("utf-16")),
+        lambda json_str: io.BytesIO(json_str.encode()),
+        lambda json_str: io.StringIO(json_str),
+    ],
+)
+def test_parse_raw_schema_sources(task_metadata, to_source):
+    parsed = BraketSchemaBase.parse_raw_schema(to_source(task_metadata.json()))
+    assert parsed == task_metadata
+    assert isinstance(parsed, TaskMetadata)
+    assert TaskMetadata.parse_raw(to_source(task_metadata.json())) == task_metadata
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, schema_base.MMAP_THRESHOLD])
+def test_parse_raw_schema_path(task_metadata, tmp_path, monkeypatch, mmap_threshold):
+    monkeypatch.setattr(schema_base, "MMAP_THRESHOLD", mmap_threshold)
+    path = tmp_path / "task_metadata.json"
+    path.write_text(task_metadata.json())
+    assert BraketSchemaBase.parse_raw_schema(path) == task_metadata
+    with open(path, "rb") as f:
+        assert BraketSchemaBase.parse_raw_schema(f) == task_metadata
+    assert TaskMetadata.parse_file(path) == task_metadata
+    assert TaskMetadata.parse_file(str(path)) == task_metadata
+
+
+def test_parse_file_mmap_offset(task_metadata, tmp_path, monkeypatch):
+    monkeypatch.setattr(schema_base, "MMAP_THRESHOLD", 0)
+    path = tmp_path / "task_metadata.json"
+    path.write_text("    " + task_metadata.json())
+    with open(path, "rb") as f:
+        f.seek(2)
+        with patch.object(schema_base.mmap, "mmap", wraps=mmap.mmap) as mock_mmap:
+            assert TaskMetadata.parse_file(f) == task_metadata
+        mock_mmap.assert_called_once()
+
+
+def test_parse_file_kwargs(task_metadata, tmp_path):
+    path = tmp_path / "task_metadata.json"
+    path.write_text(task_metadata.json())
+    assert TaskMetadata.parse_file(path, content_type="application/json") == task_metadata
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_raw_schema_invalid_file(tmp_path):
+    path = tmp_path / "invalid.json"
+    path.write_text("{")
+    BraketSchemaBase.parse_raw_schema(path)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+@pytest.mark.parametrize("open_file", [False, True])
+def test_parse_raw_schema_invalid_mmap_file(tmp_path, monkeypatch, codec, open_file):
+    pytest.importorskip(codec)
+    monkeypatch.setattr(schema_base, "MMAP_THRESHOLD", 0)
+    monkeypatch.setattr(json_codec, "_codec", get_json_codec())
+    set_json_codec(codec)
+    path = tmp_path / "invalid.json"
+    path.write_text('{"braketSchemaHeader": ')
+    if open_file:
+        with open(path, "rb") as f:
+            BraketSchemaBase.parse_raw_schema(f)
+    else:
+        BraketSchemaBase.parse_raw_schema(path)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_parse_raw_invalid_buffer():
+    TaskMetadata.parse_raw(memoryview(b"\xff\xfe{"))
@@ -0,0 +1,121 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.jaqcd import H, Program
+from braket.schema_common import parse_raw_schema_many
+from braket.task_result import TaskMetadata
+
+
+class _FirstChunkExecutor(Executor):
+    # Parses only the first chunk submitted, leaving the others pending
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        if not self.futures:
+            future.set_result(fn(*args, **kwargs))
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture
+def schemas():
+    return [
+        (
+            TaskMetadata(id=f"task_{i}", deviceId="device_id", shots=i)
+            if i % 2
+            else Program(instructions=[H(target=i)])
+        )
+        for i in range(10)
+    ]
+
+
+@pytest.fixture
+def documents(schemas):
+    return [schema.json() if i % 3 else schema.json().encode() for i, schema in enumerate(schemas)]
+
+
+def test_serial(schemas, documents):
+    assert parse_raw_schema_many(documents) == schemas
+
+
+def test_serial_iterator(schemas, documents):
+    assert parse_raw_schema_many(iter(documents)) == schemas
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 64])
+def test_executor(schemas, documents, chunksize):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parsed = parse_raw_schema_many(documents, executor=executor, chunksize=chunksize)
+    assert parsed == schemas
+    assert [type(schema) for schema in parsed] == [type(schema) for schema in schemas]
+
+
+def test_workers(schemas, documents):
+    assert parse_raw_schema_many(documents, workers=2, chunksize=4) == schemas
+
+
+def test_workers_return_exceptions(schemas, documents):
+    documents[4] = "{"
+    parsed = parse_raw_schema_many(documents, workers=2, chunksize=3, return_exceptions=True)
+    assert isinstance(parsed[4], ValidationError)
+    assert parsed[:4] + parsed[5:] == schemas[:4] + schemas[5:]
+
+
+def test_return_exceptions(schemas, documents):
+    documents[2] = '{"braketSchemaHeader": {"name": "braket.ir.jaqcd.program", "version": "1"}}'
+    documents[7] = "not json"
+    parsed = parse_raw_schema_many(documents, return_exceptions=True)
+    assert isinstance(parsed[2], ValidationError)
+    assert isinstance(parsed[7], ValidationError)
+    assert [parsed[i] for i in (0, 1, 3, 4, 5, 6, 8, 9)] == [
+        schemas[i] for i in (0, 1, 3, 4, 5, 6, 8, 9)
+    ]
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_error_raised(documents):
+    documents[5] = "{"
+    parse_raw_schema_many(documents)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_error_raised_executor(documents):
+    documents[5] = "{"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parse_raw_schema_many(documents, executor=executor, chunksize=2)
+
+
+def test_error_cancels_pending_chunks(documents):
+    documents[1] = "{"
+    executor = _FirstChunkExecutor()
+    with pytest.raises(ValidationError):
+        parse_raw_schema_many(documents, executor=executor, chunksize=2)
+    assert len(executor.futures) == 5
+    assert all(future.cancelled() for future in executor.futures[1:])
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_chunksize(documents):
+    parse_raw_schema_many(documents, chunksize=0)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_workers(documents):
+    parse_raw_schema_many(documents, workers=0)
@@ -0,0 +1,189 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import json
+from datetime import datetime, time
+
+import pytest
+
+from braket.device_schema.simulators import GateModelSimulatorDeviceParameters
+from braket.ir.annealing import Problem, ProblemType
+from braket.ir.jaqcd import (
+    CCNot,
+    CNot,
+    Expectation,
+    H,
+    Probability,
+    Program,
+    Rx,
+    StateVector,
+    Unitary,
+)
+from braket.schema_common import BraketSchemaBase, synthetic
+from braket.task_result import (
+    AdditionalMetadata,
+    AnnealingTaskResult,
+    DwaveMetadata,
+    DwaveTiming,
+    GateModelTaskResult,
+    ResultTypeValue,
+    TaskMetadata,
+)
+
+
+@pytest.fixture
+def program():
+    return Program(
+        instructions=[
+            H(target=0),
+            CNot(control=0, target=1),
+            CCNot(controls=[0, 1], target=2),
+            Rx(target=1, angle=0.15),
+            Unitary(targets=[0], matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]]),
+        ],
+        results=[Expectation(targets=[0], observable=["x"]), StateVector()],
+        basis_rotation_instructions=[H(target=0)],
+    )
+
+
+@pytest.fixture
+def gate_model_task_result(program):
+    return GateModelTaskResult(
+        measurements=[[0, 1, 1], [1, 0, 1]],
+        measuredQubits=[0, 1, 2],
+        resultTypes=[
+            ResultTypeValue(type=Expectation(targets=[0], observable=["x"]), value=0.5),
+            ResultTypeValue(type=Probability(targets=[0]), value=[0.5, 0.5]),
+        ],
+        taskMetadata=TaskMetadata(
+            id="task_id",
+            deviceId="device_id",
+            shots=2,
+            deviceParameters=GateModelSimulatorDeviceParameters(
+                paradigmParameters={"qubitCount": 3}
+            ),
+        ),
+        additionalMetadata=AdditionalMetadata(action=program),
+    )
+
+
+@pytest.fixture
+def annealing_task_result():
+    return AnnealingTaskResult(
+        solutions=[[-1, 1], [1, 1]],
+        solutionCounts=[3, 2],
+        values=[-1.5, 0.5],
+        variableCount=2,
+        taskMetadata=TaskMetadata(id="task_id", deviceId="device_id", shots=5),
+        additionalMetadata=AdditionalMetadata(
+            action=Problem(
+                type=ProblemType.ISING, linear={0: 0.3, 4: -0.3}, quadratic={"0,4": 0.667}
+            ),
+            dwaveMetadata=DwaveMetadata(
+                activeVariables=[0, 4], timing=DwaveTiming(qpuSamplingTime=1575)
+            ),
+        ),
+    )
+
+
+@pytest.fixture
+def rigetti_device_capabilities():
+    return synthetic.rigetti_device_capabilities(1).build()
+
+
+@pytest.fixture
+def ionq_device_capabilities():
+    return synthetic.ionq_device_capabilities().build()
+
+
+SCHEMAS = [
+    "program",
+    "gate_model_task_result",
+    "annealing_task_result",
+    "rigetti_device_capabilities",
+    "ionq_device_capabilities",
+]
+
+
+def _assert_same_tree(constructed, schema):
+    validated = type(schema).parse_raw(schema.json())
+    assert type(constructed) is type(validated)
+    assert constructed == validated
+    assert constructed.__fields_set__ == validated.__fields_set__
+    assert constructed.json() == validated.json()
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_construct_trusted(schema, request):
+    schema = request.getfixturevalue(schema)
+    constructed = type(schema).construct_trusted(json.loads(schema.json()))
+    _assert_same_tree(constructed, schema)
+
+
+def test_construct_trusted_nested_types(gate_model_task_result):
+    constructed = GateModelTaskResult.construct_trusted(json.loads(gate_model_task_result.json()))
+    program = constructed.additionalMetadata.action
+    assert isinstance(program, Program)
+    assert [type(instruction) for instruction in program.instructions] == [
+        H,
+        CNot,
+        CCNot,
+        Rx,
+        Unitary,
+    ]
+    assert program.instructions[0].type is H.Type.h
+    assert [type(result) for result in program.results] == [Expectation, StateVector]
+    assert isinstance(constructed.taskMetadata, TaskMetadata)
+    assert isinstance(constructed.taskMetadata.deviceParameters, GateModelSimulatorDeviceParameters)
+    assert isinstance(constructed.resultTypes[1].type, Probability)
+
+
+def test_construct_trusted_problem_keys(annealing_task_result):
+    constructed = AnnealingTaskResult.construct_trusted(json.loads(annealing_task_result.json()))
+    problem = constructed.additionalMetadata.action
+    assert isinstance(problem, Problem)
+    assert problem.type is ProblemType.ISING
+    assert problem.linear == {0: 0.3, 4: -0.3}
+
+
+def test_construct_trusted_json_types(annealing_task_result, ionq_device_capabilities):
+    document = json.loads(annealing_task_result.json())
+    document["values"] = [-1, 1]
+    constructed = AnnealingTaskResult.construct_trusted(document)
+    assert [type(value) for value in constructed.values] == [float, float]
+    service = (
+        type(ionq_device_capabilities)
+        .construct_trusted(json.loads(ionq_device_capabilities.json()))
+        .service
+    )
+    assert isinstance(service.executionWindows[0].windowStartHour, time)
+    assert isinstance(service.updatedAt, datetime)
+    assert isinstance(service.shotsRange, tuple)
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_parse_raw_schema_no_validation(schema, request):
+    schema = request.getfixturevalue(schema)
+    _assert_same_tree(BraketSchemaBase.parse_raw_schema(schema.json(), validate=False), schema)
+
+
+def test_parse_raw_schema_no_validation_skips_validators():
+    program = json.dumps(
+        {
+            "braketSchemaHeader": {"name": "braket.ir.jaqcd.program", "version": "1"},
+            "instructions": [{"type": "h", "target": -1}],
+        }
+    )
+    constructed = BraketSchemaBase.parse_raw_schema(program, validate=False)
+    assert isinstance(constructed.instructions[0], H)
+    assert constructed.instructions[0].target == -1
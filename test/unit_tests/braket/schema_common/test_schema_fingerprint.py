@@ -0,0 +1,192 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import hashlib
+import json
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from pydantic import BaseModel
+
+from braket.ir.annealing import Problem, ProblemType
+from braket.ir.jaqcd import CNot, Expectation, H, Program, Rx, Unitary, freeze
+from braket.schema_common import BraketSchemaBase, synthetic
+from braket.schema_common.schema_fingerprint import schema_fingerprint
+
+
+@pytest.fixture
+def program():
+    return Program(
+        instructions=[
+            H(target=0),
+            CNot(control=0, target=1),
+            Rx(target=1, angle=0.15),
+            Unitary(targets=[0], matrix=[[[0, 0], [1, 0]], [[1, 0], [0, 0]]]),
+        ],
+        results=[Expectation(targets=[0], observable=["x"])],
+        basis_rotation_instructions=[H(target=0)],
+    )
+
+
+@pytest.fixture
+def problem():
+    return Problem(type=ProblemType.QUBO, linear={0: 0.3, 4: -0.3}, quadratic={"0,5": 0.667})
+
+
+def _str(value):
+    return b"S" + struct.pack("<Q", len(value.encode())) + value.encode()
+
+
+def test_golden_values(program, problem):
+    # These values must never change; see the stability guarantee of the encoding
+    assert program.fingerprint() == (
+        "c8d98e336a9842520c95c2f569810e8ff166e9a41513987d7b7525f399e8ecca"
+    )
+    assert problem.fingerprint() == (
+        "86468372ecd55543bf1f7e4cd9a3e7fe7af1f88fec10f9bd9b710ae1d64bb810"
+    )
+
+
+def test_canonical_encoding():
+    problem = Problem(type=ProblemType.ISING, linear={1: -0.0, 0: 0.5}, quadratic={})
+    header = b"M" + struct.pack("<Q", 2) + _str("name")
+    header += _str("braket.ir.annealing.problem") + _str("version") + _str("1")
+    linear = b"{" + struct.pack("<Q", 2)
+    linear += b"I" + struct.pack("<q", 0) + b"D" + struct.pack("<d", 0.5)
+    linear += b"I" + struct.pack("<q", 1) + b"D" + struct.pack("<d", 0.0)
+    encoding = b"braket-fingerprint\x00\x01" + b"M" + struct.pack("<Q", 4)
+    encoding += _str("braketSchemaHeader") + header
+    encoding += _str("linear") + linear
+    encoding += _str("quadratic") + b"{" + struct.pack("<Q", 0)
+    encoding += _str("type") + _str("ISING")
+    assert problem.fingerprint() == hashlib.sha256(encoding).hexdigest()
+
+
+def test_same_for_equal_programs(program):
+    document = program.dict()
+    reordered = {key: document[key] for key in reversed(list(document))}
+    assert Program.parse_obj(reordered).fingerprint() == program.fingerprint()
+    assert Program.parse_raw(program.json(indent=4)).fingerprint() == program.fingerprint()
+    assert Program.construct_trusted(json.loads(program.json())).fingerprint() == (
+        program.fingerprint()
+    )
+    frozen = program.copy(update={"instructions": [freeze(i) for i in program.instructions]})
+    assert frozen.fingerprint() == program.fingerprint()
+
+
+def test_same_for_equal_problems(problem):
+    reordered = Problem(
+        type="QUBO",
+        linear={4: -0.3, 0: 0.3},
+        quadratic={"0,5": 0.667},
+    )
+    assert reordered.fingerprint() == problem.fingerprint()
+    assert BraketSchemaBase.parse_raw_schema(problem.json()).fingerprint() == (
+        problem.fingerprint()
+    )
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"instructions": [H(target=1)]},
+        {"instructions": [Rx(target=1, angle=0.15000000000000002)]},
+        {"results": None},
+        {"basis_rotation_instructions": []},
+    ],
+)
+def test_different_programs(program, update):
+    assert program.copy(update=update).fingerprint() != program.fingerprint()
+
+
+def test_different_problems(problem):
+    assert problem.copy(update={"type": "ISING"}).fingerprint() != problem.fingerprint()
+    assert problem.copy(update={"linear": {0: 0.3}}).fingerprint() != problem.fingerprint()
+
+
+def test_memoized(program):
+    fingerprint = program.fingerprint()
+    assert program._fingerprint == fingerprint
+    assert program.fingerprint() is fingerprint
+    assert program.copy().fingerprint() is fingerprint
+
+
+def test_memo_reset_on_assignment(program):
+    fingerprint = program.fingerprint()
+    program.results = None
+    assert program.fingerprint() != fingerprint
+    assert program.fingerprint() == Program.parse_raw(program.json()).fingerprint()
+
+
+def test_large_values():
+    fingerprint = schema_fingerprint(H.construct(target=2**70))
+    assert fingerprint != schema_fingerprint(H.construct(target=2**71))
+
+
+def test_synthetic_program():
+    program = synthetic.program(5000, qubits=8).build()
+    assert program.fingerprint() == Program.parse_raw(program.json()).fingerprint()
+
+
+@pytest.mark.parametrize(
+    "capabilities", [synthetic.rigetti_device_capabilities(1), synthetic.ionq_device_capabilities()]
+)
+def test_device_capabilities(capabilities):
+    device = capabilities.build()
+    updated = device.copy(deep=True)
+    updated.service.executionWindows[0].windowEndHour = time(22, 0)
+    parsed = BraketSchemaBase.parse_raw_schema(device.json())
+    assert device.fingerprint() == parsed.fingerprint()
+    assert updated.fingerprint() != device.fingerprint()
+
+
+def test_dates_and_times():
+    class Dates(BaseModel):
+        value: object
+
+    def fingerprint(value):
+        return schema_fingerprint(Dates(value=value))
+
+    def iso_format(tag, value):
+        return tag + struct.pack("<Q", len(value)) + value.encode()
+
+    encoding = b"braket-fingerprint\x00\x01" + b"M" + struct.pack("<Q", 1) + _str("value")
+    assert (
+        fingerprint(date(2021, 1, 1))
+        == hashlib.sha256(encoding + iso_format(b"Y", "2021-01-01")).hexdigest()
+    )
+    assert (
+        fingerprint(time(0, 0))
+        == hashlib.sha256(encoding + iso_format(b"H", "00:00:00")).hexdigest()
+    )
+    assert (
+        fingerprint(datetime(2021, 1, 1))
+        == hashlib.sha256(encoding + iso_format(b"Z", "2021-01-01T00:00:00")).hexdigest()
+    )
+    # Equal datetimes and times in different time zones have the same fingerprint
+    east = timezone(timedelta(hours=2))
+    assert fingerprint(datetime(2021, 1, 1, 2, tzinfo=east)) == fingerprint(
+        datetime(2021, 1, 1, tzinfo=timezone.utc)
+    )
+    assert fingerprint(time(1, 30, tzinfo=east)) == fingerprint(time(23, 30, tzinfo=timezone.utc))
+    assert fingerprint(datetime(2021, 1, 1)) != fingerprint(date(2021, 1, 1))
+    assert fingerprint(datetime(2021, 1, 1)) != fingerprint("2021-01-01T00:00:00")
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_unsupported_value():
+    class Custom(BaseModel):
+        value: object
+
+    schema_fingerprint(Custom(value=object()))
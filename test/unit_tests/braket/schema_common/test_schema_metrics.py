@@ -0,0 +1,169 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import io
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.jaqcd import H, Program
+from braket.schema_common import (
+    BraketSchemaBase,
+    OperationMetrics,
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+    reset_metrics,
+)
+
+PROGRAM = "braket.ir.jaqcd.program_v1.Program"
+BASE = "braket.schema_common.schema_base.BraketSchemaBase"
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    reset_metrics()
+    yield
+    disable_metrics()
+    reset_metrics()
+
+
+@pytest.fixture
+def program():
+    return Program(instructions=[H(target=0)])
+
+
+def test_disabled_by_default(program):
+    BraketSchemaBase.parse_raw_schema(program.json())
+    assert get_metrics() == {}
+
+
+def test_parse_raw_schema(program):
+    json_str = program.json()
+    enable_metrics()
+    BraketSchemaBase.parse_raw_schema(json_str)
+    BraketSchemaBase.parse_raw_schema(json_str.encode())
+    metrics = get_metrics()
+    # The parse_obj calls made by parse_raw_schema are not recorded separately
+    assert list(metrics) == [PROGRAM]
+    assert list(metrics[PROGRAM]) == ["parse_raw_schema"]
+    parse_metrics = metrics[PROGRAM]["parse_raw_schema"]
+    assert parse_metrics.calls == 2
+    assert parse_metrics.errors == 0
+    assert parse_metrics.seconds > 0
+    assert parse_metrics.input_bytes == 2 * len(json_str)
+    assert parse_metrics.output_bytes == 0
+
+
+def test_parse_and_serialize(program, tmp_path):
+    json_str = program.json()
+    path = tmp_path / "program.json"
+    path.write_text(json_str)
+    obj = program.dict()
+    enable_metrics()
+    Program.parse_raw(json_str)
+    Program.parse_obj(obj)
+    Program.parse_file(str(path))
+    Program.parse_file(io.BytesIO(json_str.encode()))
+    BraketSchemaBase.parse_obj_schema(obj)
+    program.json()
+    program.dict()
+    metrics = get_metrics()[PROGRAM]
+    assert {
+        name: (value.calls, value.input_bytes, value.output_bytes)
+        for name, value in metrics.items()
+    } == {
+        "parse_raw": (1, len(json_str), 0),
+        "parse_obj": (1, 0, 0),
+        "parse_file": (2, 2 * len(json_str), 0),
+        "parse_obj_schema": (1, 0, 0),
+        "json": (1, 0, len(json_str)),
+        "dict": (1, 0, 0),
+    }
+
+
+def test_source_by_keyword(program, tmp_path):
+    json_str = program.json()
+    path = tmp_path / "program.json"
+    path.write_text(json_str)
+    enable_metrics()
+    parsed = [
+        BraketSchemaBase.parse_raw_schema(json_str=json_str),
+        Program.parse_raw(b=json_str),
+        Program.parse_file(path=str(path)),
+    ]
+    metrics = get_metrics()[PROGRAM]
+    disable_metrics()
+    assert parsed == [program] * 3
+    assert {name: (value.calls, value.input_bytes) for name, value in metrics.items()} == {
+        "parse_raw_schema": (1, len(json_str)),
+        "parse_raw": (1, len(json_str)),
+        "parse_file": (1, len(json_str)),
+    }
+
+
+def test_non_ascii_input_bytes():
+    json_str = '{"braketSchemaHeader": {"name": "braket.test", "version": "é"}}'
+    enable_metrics()
+    BraketSchemaBase.parse_raw(json_str)
+    assert get_metrics()[BASE]["parse_raw"].input_bytes == len(json_str.encode())
+
+
+def test_errors():
+    enable_metrics()
+    with pytest.raises(ValidationError):
+        BraketSchemaBase.parse_raw_schema("{")
+    with pytest.raises(ValidationError):
+        Program.parse_raw("{}")
+    metrics = get_metrics()
+    assert metrics[BASE]["parse_raw_schema"] == OperationMetrics(
+        calls=1, errors=1, seconds=metrics[BASE]["parse_raw_schema"].seconds, input_bytes=1
+    )
+    assert metrics[PROGRAM]["parse_raw"].errors == 1
+
+
+def test_exporter(program):
+    events = []
+    enable_metrics(lambda schema, method, metrics: events.append((schema, method, metrics)))
+    json_str = program.json()
+    assert len(events) == 1
+    schema, method, metrics = events[0]
+    assert (schema, method) == (PROGRAM, "json")
+    assert metrics.calls == 1
+    assert metrics.output_bytes == len(json_str)
+    assert get_metrics()[PROGRAM]["json"] == metrics
+
+
+def test_disable_keeps_metrics(program):
+    enable_metrics()
+    program.json()
+    disable_metrics()
+    program.json()
+    assert get_metrics()[PROGRAM]["json"].calls == 1
+    reset_metrics()
+    assert get_metrics() == {}
+
+
+def test_snapshot_is_a_copy(program):
+    enable_metrics()
+    program.json()
+    snapshot = get_metrics()
+    program.json()
+    assert snapshot[PROGRAM]["json"].calls == 1
+    assert get_metrics()[PROGRAM]["json"].calls == 2
+
+
+def test_operation_metrics_add():
+    assert OperationMetrics(1, 0, 0.5, 10, 0) + OperationMetrics(1, 1, 0.25, 0, 5) == (
+        OperationMetrics(2, 1, 0.75, 10, 5)
+    )
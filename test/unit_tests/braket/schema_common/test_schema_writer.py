@@ -0,0 +1,115 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import io
+
+import pytest
+
+from braket.ir.annealing import Problem
+from braket.schema_common import BraketSchemaBase, set_json_codec, synthetic
+from braket.schema_common.schema_writer import write_json
+from braket.task_result import AdditionalMetadata, AnnealingTaskResult, TaskMetadata
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec(request):
+    set_json_codec(request.param)
+    yield request.param
+    set_json_codec("json")
+
+
+def _annealing_task_result():
+    problem = synthetic.problem(50, 0.2, problem_type="ISING").build()
+    return AnnealingTaskResult(
+        solutions=[[1, -1, 1], [-1, -1, 1], [1, 1, -1]],
+        solutionCounts=[3, 2, 1],
+        values=[-1.5, 0.25, 2],
+        variableCount=3,
+        taskMetadata=TaskMetadata(id="task_arn", shots=6, deviceId="device_id"),
+        additionalMetadata=AdditionalMetadata(action=problem),
+    )
+
+
+@pytest.fixture(
+    params=[
+        lambda: synthetic.program(300, qubits=5).build(),
+        lambda: synthetic.gate_model_task_result(250, qubits=4).build(),
+        _annealing_task_result,
+    ],
+    ids=["program", "gate_model_task_result", "annealing_task_result"],
+)
+def schema(request):
+    return request.param()
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 1000])
+def test_same_as_json(schema, codec, batch_size):
+    f = io.StringIO()
+    written = schema.write_json(f, batch_size=batch_size)
+    assert f.getvalue() == schema.json()
+    assert written == len(f.getvalue())
+    assert BraketSchemaBase.parse_raw_schema(f.getvalue()) == schema
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"exclude_none": True},
+        {"exclude_unset": True},
+        {"exclude_defaults": True},
+        {"by_alias": True},
+    ],
+)
+def test_json_arguments(schema, kwargs):
+    f = io.StringIO()
+    schema.write_json(f, **kwargs)
+    assert f.getvalue() == schema.json(**kwargs)
+
+
+def test_binary_file(schema):
+    f = io.BytesIO()
+    written = schema.write_json(f)
+    assert f.getvalue().decode() == schema.json()
+    assert written == len(schema.json())
+
+
+def test_path(schema, tmp_path):
+    path = tmp_path / "schema.json"
+    schema.write_json(path)
+    assert path.read_text(encoding="utf-8") == schema.json()
+    write_json(schema, str(path), exclude_none=True)
+    assert path.read_text(encoding="utf-8") == schema.json(exclude_none=True)
+
+
+def test_empty_containers():
+    problem = Problem(type="QUBO", linear={}, quadratic={})
+    f = io.StringIO()
+    problem.write_json(f)
+    assert f.getvalue() == problem.json()
+
+
+def test_large_output_written_in_chunks():
+    program = synthetic.program(5000, qubits=5).build()
+
+    class Recorder(io.StringIO):
+        sizes = []
+
+        def write(self, s):
+            self.sizes.append(len(s))
+            return super().write(s)
+
+    f = Recorder()
+    program.write_json(f)
+    assert f.getvalue() == program.json()
+    assert len(f.sizes) > 1
+    assert max(f.sizes) < len(f.getvalue())
@@ -0,0 +1,134 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import io
+import json
+
+import pytest
+
+from braket.device_schema.dwave import DwaveDeviceCapabilities, DwaveProviderProperties
+from braket.device_schema.ionq import IonqDeviceCapabilities
+from braket.device_schema.rigetti import RigettiDeviceCapabilities
+from braket.device_schema.simulators import GateModelSimulatorDeviceCapabilities
+from braket.ir.annealing import Problem
+from braket.ir.jaqcd import Program
+from braket.schema_common import BraketSchemaBase, synthetic
+from braket.task_result import AnnealingTaskResult, GateModelTaskResult
+
+
+@pytest.mark.parametrize(
+    "document, schema_class",
+    [
+        (synthetic.program(500, qubits=8, seed=1), Program),
+        (synthetic.gate_model_task_result(50, qubits=5), GateModelTaskResult),
+        (synthetic.problem(100, 0.1), Problem),
+        (synthetic.problem(30, 1, problem_type="ISING"), Problem),
+        (synthetic.dwave_provider_properties(qubit_count=500), DwaveProviderProperties),
+        (synthetic.rigetti_device_capabilities(octagons=4), RigettiDeviceCapabilities),
+        (synthetic.ionq_device_capabilities(), IonqDeviceCapabilities),
+        (synthetic.annealing_task_result(20, 50), AnnealingTaskResult),
+        (synthetic.dwave_device_capabilities(qubit_count=500), DwaveDeviceCapabilities),
+        (synthetic.simulator_device_capabilities(), GateModelSimulatorDeviceCapabilities),
+    ],
+)
+def test_valid_and_streamed(document, schema_class, tmp_path):
+    schema = document.build()
+    assert isinstance(schema, schema_class)
+    json_str = json.dumps(document.document())
+    assert document.json() == json_str
+    assert BraketSchemaBase.parse_raw_schema(json_str) == schema
+    path = tmp_path / "document.json"
+    assert document.write(path) == len(json_str)
+    assert path.read_text() == json_str
+
+
+def test_deterministic():
+    assert synthetic.program(200, seed=5).json() == synthetic.program(200, seed=5).json()
+    assert synthetic.program(200, seed=5).json() != synthetic.program(200, seed=6).json()
+
+
+def test_write_file_object():
+    document = synthetic.gate_model_task_result(10000, qubits=3)
+    buffer = io.StringIO()
+    written = document.write(buffer)
+    assert written == len(buffer.getvalue())
+    assert json.loads(buffer.getvalue()) == document.document()
+
+
+def test_program_gate_mix():
+    program = synthetic.program(300, qubits=3, gate_mix={"cswap": 1, "unitary": 1, "xx": 0})
+    types = {instruction.type for instruction in program.build().instructions}
+    assert types == {"cswap", "unitary"}
+
+
+def test_program_all_gates():
+    gate_types = Program._TYPE_DISPATCH["instructions"]
+    gate_mix = {gate_type.value: 1 for gate_type in gate_types}
+    program = synthetic.program(2000, qubits=4, gate_mix=gate_mix).build()
+    assert {instruction.type for instruction in program.instructions} == set(gate_types)
+
+
+def test_program_unitary_matrices_are_unitary():
+    program = synthetic.program(50, qubits=4, gate_mix={"unitary": 1}).build()
+    for instruction in program.instructions:
+        matrix = [[complex(*entry) for entry in row] for row in instruction.matrix]
+        assert len(matrix) == 2 ** len(instruction.targets)
+        for i, row in enumerate(matrix):
+            for j, other in enumerate(matrix):
+                product = sum(a * b.conjugate() for a, b in zip(row, other))
+                assert abs(product - (i == j)) < 1e-9
+
+
+@pytest.mark.parametrize(
+    "gate_mix, qubits",
+    [({"foo": 1}, 4), ({"h": 0}, 4), ({"ccnot": 1}, 2), ({"swap": 1}, 1)],
+)
+def test_program_invalid_gate_mix(gate_mix, qubits):
+    with pytest.raises(ValueError):
+        synthetic.program(10, qubits=qubits, gate_mix=gate_mix)
+
+
+@pytest.mark.parametrize("density", [0, 0.01, 0.3, 1])
+def test_problem_density(density):
+    variables = 200
+    problem = synthetic.problem(variables, density).build()
+    pairs = variables * (variables - 1) // 2
+    assert len(problem.linear) == variables
+    assert abs(len(problem.quadratic) - pairs * density) <= max(5, 0.1 * pairs * density)
+    for key in problem.quadratic:
+        i, j = map(int, key.split(","))
+        assert 0 <= i < j < variables
+
+
+def test_dwave_provider_properties():
+    properties = synthetic.dwave_provider_properties().build()
+    assert properties.qubitCount == 5760
+    assert 5500 < len(properties.qubits) < 5760
+    assert len(properties.annealingOffsetRanges) == 5760
+    active = set(properties.qubits)
+    assert all(a in active and b in active for a, b in properties.couplers)
+    assert 13 < 2 * len(properties.couplers) / len(properties.qubits) < 15
+
+
+def test_rigetti_device_capabilities():
+    capabilities = synthetic.rigetti_device_capabilities().build()
+    specs = capabilities.provider.specs
+    assert capabilities.paradigm.qubitCount == len(specs["1Q"]) == 80
+    graph = capabilities.paradigm.connectivity.connectivityGraph
+    assert sum(len(neighbors) for neighbors in graph.values()) == 2 * len(specs["2Q"])
+
+
+def test_gate_model_task_result_ghz():
+    result = synthetic.gate_model_task_result(1000, qubits=4, error_rate=0).build()
+    assert len(result.measurements) == 1000
+    assert all(len(set(shot)) == 1 for shot in result.measurements)
@@ -167,3 +167,28 @@ def test_incorrect_variable_count(
         taskMetadata=task_metadata,
         additionalMetadata=additional_metadata_annealing,
     )
+
+
+def test_lazy_fields(
+    task_metadata,
+    additional_metadata_annealing,
+    values,
+    solutions,
+    solution_counts,
+    variable_count,
+):
+    result = AnnealingTaskResult(
+        values=values,
+        solutions=solutions,
+        solutionCounts=solution_counts,
+        variableCount=variable_count,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_annealing,
+    )
+    lazy_result = AnnealingTaskResult.parse_raw_lazy(result.json())
+    assert lazy_result.variableCount == variable_count
+    assert set(lazy_result._lazy_values) == set(AnnealingTaskResult._LAZY_FIELDS)
+    assert lazy_result.solutions == solutions
+    assert lazy_result.additionalMetadata == additional_metadata_annealing
+    assert set(lazy_result._lazy_values) == {"values", "solutionCounts"}
+    assert lazy_result == result
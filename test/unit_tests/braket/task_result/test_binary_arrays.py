@@ -0,0 +1,77 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import pytest
+
+from braket.schema_common import SchemaArray
+from braket.task_result.binary_arrays import (
+    BINARY_MIN_SIZE,
+    BinaryArray,
+    BinaryDataType,
+    BinarySchemaArray,
+    encode_binary_array,
+    is_binary_array,
+)
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize(
+    "array, dtype",
+    [
+        (numpy.array([[1, 0, 1], [0, 0, 1]], dtype=numpy.uint8), BinaryDataType.bit),
+        (numpy.array([True, False, True]), BinaryDataType.bit),
+        (numpy.array([-1, 1, 2**40]), BinaryDataType.int64),
+        (numpy.array([0.25, -0.0, numpy.pi], dtype=numpy.float32), BinaryDataType.float64),
+        (numpy.array([[0.5j, 1], [-1, 2 - 1j]]), BinaryDataType.complex128),
+        (numpy.zeros((2, 0)), BinaryDataType.float64),
+    ],
+)
+def test_round_trip(array, dtype):
+    binary = BinaryArray.from_array(array)
+    assert binary.dtype == dtype
+    assert binary.shape == list(array.shape)
+    decoded = BinaryArray.parse_obj(binary.dict()).to_array()
+    assert decoded.shape == array.shape
+    assert numpy.array_equal(decoded, array)
+    assert not decoded.flags.writeable
+
+
+def test_bits_packed():
+    binary = BinaryArray.from_array(numpy.ones(9, dtype=numpy.uint8))
+    assert binary.data == "/4A="
+
+
+def test_is_binary_array():
+    assert is_binary_array({"dtype": "<f8", "shape": [0], "data": ""})
+    assert not is_binary_array({"00": [1, 0]})
+    assert not is_binary_array([0.5, 0.5])
+
+
+def test_encode_binary_array():
+    small = BinarySchemaArray(numpy.arange(3))
+    assert encode_binary_array(small) == [0, 1, 2]
+    large = BinarySchemaArray(numpy.arange(BINARY_MIN_SIZE))
+    encoded = encode_binary_array(large)
+    assert encoded["dtype"] == "<i8"
+    assert encoded["shape"] == [BINARY_MIN_SIZE]
+    assert large == SchemaArray(BinaryArray.parse_obj(encoded).to_array())
+
+
+@pytest.mark.xfail(raises=ValueError)
+@pytest.mark.parametrize(
+    "dtype, shape, data",
+    [("<f8", [2], "AAAAAAAA8D8="), ("bit", [9], "/w=="), ("<i8", [1], "@@@@")],
+)
+def test_invalid_data(dtype, shape, data):
+    BinaryArray(dtype=dtype, shape=shape, data=data).to_array()
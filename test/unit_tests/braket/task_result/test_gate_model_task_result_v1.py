@@ -11,10 +11,16 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import copy
+import json
+import pickle
+from typing import Union
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError, create_model
 
-from braket.ir.jaqcd.results import Probability
+from braket.ir.jaqcd.program_v1 import Results
+from braket.ir.jaqcd.results import Probability, StateVector, Variance
 from braket.task_result.gate_model_task_result_v1 import GateModelTaskResult, ResultTypeValue
 
 
@@ -174,6 +180,36 @@ def test_incorrect_result_types(
     )
 
 
+def test_result_type_dispatched_by_type():
+    value = ResultTypeValue(type={"type": "variance", "observable": ["z"]}, value=0.5)
+    assert value.type == Variance(observable=["z"])
+    value = ResultTypeValue.parse_obj({"type": {"type": "statevector"}, "value": {"0": [1, 0]}})
+    assert value.type == StateVector()
+    assert ResultTypeValue.construct(type=Probability(), value=[1]) == ResultTypeValue(
+        type=Probability(), value=[1]
+    )
+
+
+def test_result_type_schema():
+    # The schema of the result type is that of the plain Union[] of the result types
+    reference = create_model("Reference", __base__=BaseModel, type=(Union[Results], ...))
+    reference_schema = reference.schema()
+    for schema in ResultTypeValue.schema(), GateModelTaskResult.schema():
+        definitions = schema["definitions"]
+        properties = definitions.get("ResultTypeValue", schema)["properties"]
+        assert properties["type"] == reference_schema["properties"]["type"]
+        assert {
+            name: definition
+            for name, definition in definitions.items()
+            if name in reference_schema["definitions"]
+        } == reference_schema["definitions"]
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_missing_result_type():
+    ResultTypeValue(value=[0.5, 0.5])
+
+
 @pytest.mark.xfail(raises=ValidationError)
 def test_incorrect_result_type_attribute_type():
     ResultTypeValue(type={"type": "unknown"}, value=[0.5, 0.5])
@@ -182,3 +218,158 @@ def test_incorrect_result_type_attribute_type():
 @pytest.mark.xfail(raises=ValidationError)
 def test_incorrect_result_type_attribute_value():
     ResultTypeValue(type={"type": "unknown"}, value=1)
+
+
+@pytest.fixture
+def gate_model_task_result(
+    task_metadata,
+    additional_metadata_gate_model,
+    measured_qubits,
+    measurements,
+    result_types,
+):
+    return GateModelTaskResult(
+        measurements=measurements,
+        measuredQubits=measured_qubits,
+        resultTypes=result_types,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+
+
+def test_lazy_fields_validated_on_access(gate_model_task_result):
+    result = GateModelTaskResult.parse_raw_lazy(gate_model_task_result.json())
+    assert result.taskMetadata == gate_model_task_result.taskMetadata
+    assert set(result._lazy_values) == set(GateModelTaskResult._LAZY_FIELDS)
+    assert result.measurements == gate_model_task_result.measurements
+    assert "measurements" not in result._lazy_values
+    assert result.measurements is result.measurements
+    assert result.resultTypes == gate_model_task_result.resultTypes
+    assert isinstance(result.resultTypes[0], ResultTypeValue)
+    assert result == gate_model_task_result
+    assert not result._lazy_values
+
+
+@pytest.mark.parametrize(
+    "serialize",
+    [
+        lambda result: result.json(),
+        lambda result: result.dict(),
+        lambda result: result.copy().measurements,
+    ],
+)
+def test_lazy_fields_serialization(gate_model_task_result, serialize):
+    result = GateModelTaskResult.parse_raw_schema(gate_model_task_result.json(), lazy=True)
+    assert serialize(result) == serialize(gate_model_task_result)
+
+
+def test_lazy_fields_repr(gate_model_task_result):
+    result = GateModelTaskResult.parse_raw_lazy(gate_model_task_result.json())
+    assert repr(result.measurements) in repr(result)
+    assert "'resultTypes': None" not in repr(result)
+    assert set(result._lazy_values) == set(GateModelTaskResult._LAZY_FIELDS) - {"measurements"}
+    result._validate_lazy_fields()
+    assert repr(result) == repr(gate_model_task_result)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        repr,
+        copy.copy,
+        copy.deepcopy,
+        lambda result: pickle.loads(pickle.dumps(result)),
+        lambda result: result.copy(),
+        lambda result: result.copy(deep=True),
+    ],
+)
+def test_lazy_invalid_field_not_validated(gate_model_task_result, operation):
+    data = json.loads(gate_model_task_result.json())
+    data["measurements"][1][0] = 2
+    result = GateModelTaskResult.parse_obj_lazy(data)
+    copied = operation(result)
+    if not isinstance(copied, str):
+        assert copied._lazy_values == result._lazy_values
+        with pytest.raises(ValidationError):
+            copied.measurements
+    with pytest.raises(ValidationError):
+        result == gate_model_task_result
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_lazy_invalid_field_copy_update(gate_model_task_result):
+    data = json.loads(gate_model_task_result.json())
+    data["measurements"][1][0] = 2
+    GateModelTaskResult.parse_obj_lazy(data).copy(update={"measuredQubits": [0, 1]})
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [copy.copy, copy.deepcopy, lambda result: result.copy(), lambda result: result.copy(deep=True)],
+)
+def test_lazy_fields_copied(gate_model_task_result, operation):
+    result = GateModelTaskResult.parse_raw_lazy(gate_model_task_result.json())
+    assert operation(result).measurements == gate_model_task_result.measurements
+    assert "measurements" in result._lazy_values
+    assert result.measurements == gate_model_task_result.measurements
+
+
+def test_lazy_field_assignment(gate_model_task_result):
+    result = GateModelTaskResult.parse_raw_lazy(gate_model_task_result.json())
+    result.measurements = [[0, 0]]
+    assert result.measurements == [[0, 0]]
+    assert result.dict()["measurements"] == [[0, 0]]
+
+
+def test_lazy_field_error_location(gate_model_task_result):
+    data = json.loads(gate_model_task_result.json())
+    data["measurements"][1][0] = 2
+    result = GateModelTaskResult.parse_obj_lazy(data)
+    assert result.measuredQubits == gate_model_task_result.measuredQubits
+    for _ in range(2):
+        with pytest.raises(ValidationError) as e:
+            result.measurements
+        assert e.value.errors()[0]["loc"] == ("measurements", 1, 0)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_lazy_eager_field_invalid(gate_model_task_result):
+    data = json.loads(gate_model_task_result.json())
+    data["measuredQubits"] = [-1]
+    GateModelTaskResult.parse_obj_lazy(data)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+def test_lazy_required_field_missing(gate_model_task_result):
+    data = json.loads(gate_model_task_result.json())
+    del data["additionalMetadata"]
+    GateModelTaskResult.parse_obj_lazy(data)
+
+
+@pytest.mark.xfail(raises=AttributeError)
+def test_lazy_unknown_attribute(gate_model_task_result):
+    GateModelTaskResult.parse_raw_lazy(gate_model_task_result.json()).unknown
+
+
+def test_get_value_by_result_type(task_metadata, additional_metadata_gate_model, result_types):
+    result = GateModelTaskResult(
+        resultTypes=result_types,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    assert result.get_value_by_result_type(Probability(targets=[1])) == [0.5, 0.5]
+    assert result.result_type_index() is result.result_type_index()
+    result.resultTypes = [ResultTypeValue(type=Probability(targets=[1]), value=[1, 0])]
+    assert result.get_value_by_result_type({"type": "probability", "targets": [1]}) == [1, 0]
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_get_value_by_result_type_missing(
+    task_metadata, additional_metadata_gate_model, result_types
+):
+    result = GateModelTaskResult(
+        resultTypes=result_types,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    result.get_value_by_result_type(StateVector())
@@ -0,0 +1,191 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.jaqcd.results import Amplitude, Probability, Sample, StateVector
+from braket.schema_common import (
+    BraketSchemaBase,
+    KeyedSchemaArray,
+    get_json_codec,
+    json_codec,
+    set_json_codec,
+)
+from braket.task_result import gate_model_task_result_v1
+from braket.task_result.binary_arrays import BINARY_MIN_SIZE, BinarySchemaArray
+from braket.task_result.gate_model_task_result_v2 import GateModelTaskResult, ResultTypeValue
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    codec = get_json_codec()
+    yield
+    json_codec._codec = codec
+
+
+@pytest.fixture
+def rng():
+    return numpy.random.default_rng(0)
+
+
+@pytest.fixture
+def measurements(rng):
+    return rng.integers(0, 2, size=(BINARY_MIN_SIZE, 3))
+
+
+@pytest.fixture
+def state_vector(rng):
+    state = rng.normal(size=BINARY_MIN_SIZE) + 1j * rng.normal(size=BINARY_MIN_SIZE)
+    return state / numpy.linalg.norm(state)
+
+
+@pytest.fixture
+def result_types(state_vector):
+    return [
+        ResultTypeValue(type=StateVector(), value=state_vector),
+        ResultTypeValue(type=Probability(), value=numpy.abs(state_vector) ** 2),
+        ResultTypeValue(type=Probability(targets=[0]), value=[0.5, 0.5]),
+        ResultTypeValue(type=Amplitude(states=["000"]), value={"000": [0.5, 0.5]}),
+        ResultTypeValue(type=Sample(observable=["z"]), value=numpy.ones((3, 2), dtype=int)),
+    ]
+
+
+@pytest.fixture
+def result(task_metadata, additional_metadata_gate_model, measurements, result_types):
+    return GateModelTaskResult(
+        measurements=measurements,
+        measuredQubits=[0, 1, 2],
+        resultTypes=result_types,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+
+
+def test_arrays(result, measurements, state_vector):
+    assert isinstance(result.measurements, BinarySchemaArray)
+    assert result.measurements.dtype == numpy.uint8
+    assert result.measurements == measurements.tolist()
+    assert [type(value.value) for value in result.resultTypes] == [
+        BinarySchemaArray,
+        BinarySchemaArray,
+        BinarySchemaArray,
+        KeyedSchemaArray,
+        BinarySchemaArray,
+    ]
+    assert numpy.array_equal(numpy.asarray(result.resultTypes[0].value), state_vector)
+    assert isinstance(result, gate_model_task_result_v1.GateModelTaskResult)
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+def test_binary_encoding(result, codec):
+    pytest.importorskip(codec)
+    set_json_codec(codec)
+    document = json.loads(result.json())
+    assert document["braketSchemaHeader"]["version"] == "2"
+    assert document["measurements"]["dtype"] == "bit"
+    assert document["measurements"]["shape"] == [BINARY_MIN_SIZE, 3]
+    values = [value["value"] for value in document["resultTypes"]]
+    assert values[0]["dtype"] == "<c16"
+    assert values[1]["dtype"] == "<f8"
+    assert values[2] == [0.5, 0.5]
+    assert values[3] == {"000": [0.5, 0.5]}
+    assert values[4] == [[1, 1], [1, 1], [1, 1]]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_parse_raw_schema(result, validate):
+    parsed = BraketSchemaBase.parse_raw_schema(result.json(), validate=validate)
+    assert isinstance(parsed, GateModelTaskResult)
+    assert isinstance(parsed.measurements, BinarySchemaArray)
+    assert isinstance(parsed.resultTypes[0].value, BinarySchemaArray)
+    assert parsed == result
+    assert parsed.fingerprint() == result.fingerprint()
+
+
+def test_parse_raw_schema_lazy(result):
+    parsed = BraketSchemaBase.parse_raw_schema(result.json(), lazy=True)
+    assert parsed.resultTypes == result.resultTypes
+    assert parsed == result
+
+
+def test_from_version_1(result):
+    result_v1 = gate_model_task_result_v1.GateModelTaskResult(
+        measurements=result.measurements.tolist(),
+        measuredQubits=result.measuredQubits,
+        resultTypes=[
+            {"type": value.type, "value": value.value.json_form()} for value in result.resultTypes
+        ],
+        taskMetadata=result.taskMetadata,
+        additionalMetadata=result.additionalMetadata,
+    )
+    assert isinstance(BraketSchemaBase.parse_raw_schema(result_v1.json()).measurements, list)
+    assert GateModelTaskResult(**result_v1.dict(exclude={"braketSchemaHeader"})) == result
+
+
+def test_small_result(task_metadata, additional_metadata_gate_model):
+    result = GateModelTaskResult(
+        measurements=[[1, 0], [0, 1]],
+        measuredQubits=[0, 1],
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+    assert json.loads(result.json())["measurements"] == [[1, 0], [0, 1]]
+    assert BraketSchemaBase.parse_raw_schema(result.json()) == result
+
+
+def test_schema():
+    schema = GateModelTaskResult.schema()
+    measurements = schema["properties"]["measurements"]["anyOf"]
+    assert measurements[0]["properties"]["dtype"] == {"enum": ["bit", "<i8", "<f8", "<c16"]}
+    assert measurements[1]["type"] == "array"
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize(
+    "measurements",
+    [
+        [[0, 2]],
+        numpy.array([[0, 2]]),
+        numpy.array([0, 1]),
+        numpy.zeros((0, 2)),
+        numpy.array([[0.5, 1]]),
+        {"dtype": "bit", "shape": [2, 8], "data": "AA=="},
+        {"dtype": "bit", "shape": [2, 2], "data": "AAAA"},
+        {"dtype": "bit", "shape": [2, 2], "data": "not base64"},
+        {"dtype": "<f4", "shape": [1, 1], "data": "AAAAAA=="},
+        {"dtype": "<f8", "shape": [1, 1], "data": "AAAAAAAA8D8="},
+    ],
+)
+def test_invalid_measurements(measurements, task_metadata, additional_metadata_gate_model):
+    GateModelTaskResult(
+        measurements=measurements,
+        taskMetadata=task_metadata,
+        additionalMetadata=additional_metadata_gate_model,
+    )
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"dtype": "<f8", "shape": [2, 2], "data": "AAAAAAAA8D8="},
+        {"dtype": "<c16", "shape": [1], "data": "AAAAAAAA8D8AAAAAAAAAAA=="},
+    ],
+)
+def test_invalid_binary_value(value):
+    ResultTypeValue(type=Probability(), value=value)
@@ -0,0 +1,195 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import pytest
+from pydantic import ValidationError
+
+from braket.ir.jaqcd import Amplitude, Expectation, Probability, Sample, StateVector, Variance
+from braket.schema_common import (
+    KeyedSchemaArray,
+    SchemaArray,
+    get_json_codec,
+    json_codec,
+    set_json_codec,
+)
+from braket.task_result import (
+    GateModelTaskResult,
+    ResultTypeValue,
+    disable_result_type_arrays,
+    enable_result_type_arrays,
+    result_type_arrays_enabled,
+)
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.fixture(autouse=True)
+def restore():
+    codec = get_json_codec()
+    yield
+    json_codec._codec = codec
+    disable_result_type_arrays()
+
+
+@pytest.fixture
+def state_vector():
+    rng = numpy.random.default_rng(0)
+    vector = rng.normal(size=8) + 1j * rng.normal(size=8)
+    return vector / numpy.linalg.norm(vector)
+
+
+@pytest.fixture
+def result_type_values(state_vector):
+    return [
+        {"type": {"type": "statevector"}, "value": [[z.real, z.imag] for z in state_vector]},
+        {"type": {"type": "amplitude", "states": ["000", "111"]}, "value": {"000": [0.5, -0.5]}},
+        {"type": {"type": "probability", "targets": [0]}, "value": [0.25, 0.75]},
+        {"type": {"type": "sample", "observable": ["z"], "targets": [0]}, "value": [1, -1, 1]},
+        {"type": {"type": "sample", "observable": ["x"]}, "value": [[1, -1], [-1, -1]]},
+        {"type": {"type": "expectation", "observable": ["z"], "targets": [0]}, "value": 0.5},
+        {"type": {"type": "variance", "observable": ["z"]}, "value": [0.75, 0.5]},
+    ]
+
+
+@pytest.fixture
+def task_result(result_type_values):
+    return {
+        "braketSchemaHeader": {
+            "name": "braket.task_result.gate_model_task_result",
+            "version": "1",
+        },
+        "resultTypes": result_type_values,
+        "taskMetadata": {
+            "braketSchemaHeader": {"name": "braket.task_result.task_metadata", "version": "1"},
+            "id": "task_arn",
+            "shots": 0,
+            "deviceId": "default",
+        },
+        "additionalMetadata": {
+            "action": {
+                "braketSchemaHeader": {"name": "braket.ir.jaqcd.program", "version": "1"},
+                "instructions": [{"type": "h", "target": 0}],
+            }
+        },
+    }
+
+
+def test_state_vector_array(state_vector):
+    value = ResultTypeValue(type=StateVector(), value=state_vector)
+    assert isinstance(value.value, SchemaArray)
+    assert value.value.dtype == numpy.complex128
+    assert numpy.array_equal(numpy.asarray(value.value), state_vector)
+    listed = ResultTypeValue(type=StateVector(), value=[[z.real, z.imag] for z in state_vector])
+    assert isinstance(listed.value, list)
+    assert value == listed
+    assert value.json() == listed.json()
+    pairs = numpy.stack([state_vector.real, state_vector.imag], axis=-1)
+    assert ResultTypeValue(type=StateVector(), value=pairs) == value
+
+
+def test_amplitude_array():
+    value = ResultTypeValue(type=Amplitude(states=["00", "11"]), value=numpy.array([0.5j, 1]))
+    assert isinstance(value.value, KeyedSchemaArray)
+    assert value.value == {"00": [0, 0.5], "11": [1, 0]}
+    assert ResultTypeValue.parse_raw(value.json()) == value
+
+
+@pytest.mark.parametrize(
+    "result_type, array, dtype",
+    [
+        (Probability(), numpy.array([0.5, 0, 0, 0.5], dtype=numpy.float32), numpy.float64),
+        (Sample(observable=["z"], targets=[0]), numpy.array([1, -1, -1]), numpy.int64),
+        (Sample(observable=["z"]), numpy.array([[1, -1], [-1, 1]]), numpy.int64),
+        (Sample(observable=["h"], targets=[0]), numpy.array([0.5, -0.5]), numpy.float64),
+        (Expectation(observable=["z"]), numpy.array([0.5, -0.5]), numpy.float64),
+        (Variance(observable=["z"]), numpy.array([0, 1]), numpy.float64),
+    ],
+)
+def test_real_arrays(result_type, array, dtype):
+    value = ResultTypeValue(type=result_type, value=array)
+    assert value.value.dtype == dtype
+    assert value == ResultTypeValue(type=result_type, value=array.tolist())
+
+
+def test_scalar_array():
+    value = ResultTypeValue(type=Expectation(observable=["z"], targets=[0]), value=numpy.array(1))
+    assert value.value == 1.0
+    assert type(value.value) is float
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+def test_enable_result_type_arrays(task_result, codec):
+    pytest.importorskip(codec)
+    set_json_codec(codec)
+    listed = GateModelTaskResult.parse_obj(task_result)
+    assert not result_type_arrays_enabled()
+    enable_result_type_arrays()
+    assert result_type_arrays_enabled()
+    parsed = GateModelTaskResult.parse_raw(listed.json())
+    assert [type(value.value) for value in parsed.resultTypes] == [
+        SchemaArray,
+        KeyedSchemaArray,
+        SchemaArray,
+        SchemaArray,
+        SchemaArray,
+        float,
+        SchemaArray,
+    ]
+    assert parsed == listed
+    assert parsed.json() == listed.json()
+    assert parsed.fingerprint() == listed.fingerprint()
+    disable_result_type_arrays()
+    assert isinstance(GateModelTaskResult.parse_raw(listed.json()).resultTypes[0].value, list)
+
+
+@pytest.mark.parametrize(
+    "result_type, value",
+    [
+        ({"type": "probability"}, [[0.5], [0.25, 0.25]]),
+        ({"type": "probability"}, ["a", "b"]),
+        ({"type": "statevector"}, [[1, 0, 0]]),
+        ({"type": "amplitude", "states": ["0"]}, {"0": "one"}),
+    ],
+)
+def test_lists_not_decoded(result_type, value):
+    enable_result_type_arrays()
+    assert ResultTypeValue(type=result_type, value=value).value == value
+
+
+def test_schema_unchanged():
+    assert ResultTypeValue.schema()["properties"]["value"] == {
+        "title": "Value",
+        "anyOf": [{"type": "array", "items": {}}, {"type": "number"}, {"type": "object"}],
+    }
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize(
+    "result_type, array",
+    [
+        (StateVector(), numpy.ones((2, 3))),
+        (Probability(), numpy.array(["a", "b"])),
+        (Probability(), numpy.ones((2, 2))),
+        (Sample(observable=["z"]), numpy.ones((2, 2, 2))),
+        (Amplitude(states=["00", "11"]), numpy.ones(3)),
+        ({"type": "foo"}, numpy.ones(2)),
+    ],
+)
+def test_invalid_arrays(result_type, array):
+    ResultTypeValue(type=result_type, value=array)
+
+
+@pytest.mark.xfail(raises=ValidationError)
+@pytest.mark.parametrize("value", ["x", None])
+def test_invalid_value(value):
+    ResultTypeValue(type=Probability(), value=value)
@@ -0,0 +1,110 @@
+# Copyright 2019-2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import pytest
+
+from braket.ir.jaqcd import Amplitude, Expectation, H, Probability, Sample, StateVector, Variance
+from braket.task_result import ResultTypeIndex, ResultTypeValue
+from braket.task_result.result_type_index import result_type_key
+
+MATRIX = [[[0, 0], [1, 0]], [[1, 0], [0, 0]]]
+
+
+@pytest.fixture
+def result_types():
+    return [
+        ResultTypeValue(type=Expectation(targets=[0], observable=["z"]), value=0.5),
+        ResultTypeValue(type=Expectation(targets=[1, 0], observable=["x", "z"]), value=0.25),
+        ResultTypeValue(type=Variance(targets=[1], observable=[MATRIX]), value=0.75),
+        ResultTypeValue(type=Probability(targets=[1, 0]), value=[0.5, 0, 0, 0.5]),
+        ResultTypeValue(type=Probability(), value=[0.5, 0, 0.5, 0]),
+        ResultTypeValue(type=Amplitude(states=["00", "11"]), value={"00": [1, 0], "11": [0, 0]}),
+        ResultTypeValue(type=StateVector(), value=[[1, 0], [0, 0], [0, 0], [0, 0]]),
+        ResultTypeValue(type=Sample(observable=["x"]), value=[[1, -1], [-1, -1]]),
+        ResultTypeValue(type=Expectation(observable=["y"]), value=[0.1, 0.2]),
+        ResultTypeValue(type=Expectation(targets=[0], observable=["z"]), value=-1.0),
+    ]
+
+
+@pytest.fixture
+def index(result_types):
+    return ResultTypeIndex(result_types)
+
+
+@pytest.mark.parametrize(
+    "result_type, value",
+    [
+        (Expectation(targets=[0], observable=["z"]), 0.5),
+        (Expectation(targets=[1, 0], observable=["x", "z"]), 0.25),
+        ({"type": "expectation", "targets": [1, 0], "observable": ["x", "z"]}, 0.25),
+        (Variance(targets=[1], observable=[[[[0, 0], [1.0, -0.0]], [[1, 0], [0, 0]]]]), 0.75),
+        (Probability(targets=[1, 0]), [0.5, 0, 0, 0.5]),
+        (Probability(), [0.5, 0, 0.5, 0]),
+        (Amplitude(states=["11", "00"]), {"00": [1, 0], "11": [0, 0]}),
+        (StateVector(), [[1, 0], [0, 0], [0, 0], [0, 0]]),
+        (Sample(observable=["x"]), [[1, -1], [-1, -1]]),
+        (Sample(targets=[1], observable=["x"]), [-1, -1]),
+        (Expectation(targets=[0], observable=["y"]), 0.1),
+    ],
+)
+def test_lookup(index, result_type, value):
+    assert result_type in index
+    assert index[result_type] == value
+    assert index.get(result_type) == value
+
+
+@pytest.mark.parametrize(
+    "result_type",
+    [
+        Expectation(targets=[0, 1], observable=["x", "z"]),
+        Expectation(targets=[1], observable=["z"]),
+        Variance(targets=[1], observable=[[[[0, 0], [1, 0]], [[1, 0], [0, 1]]]]),
+        Probability(targets=[0, 1]),
+        Probability(targets=[0]),
+        Amplitude(states=["00"]),
+        Sample(targets=[2], observable=["x"]),
+        Expectation(targets=[0], observable=["x"]),
+    ],
+)
+def test_missing(index, result_type):
+    assert result_type not in index
+    assert index.get(result_type, "missing") == "missing"
+    with pytest.raises(KeyError):
+        index[result_type]
+
+
+def test_first_value_kept(index):
+    assert len(index) == 9
+    assert index[Expectation(targets=[0], observable=["z"])] == 0.5
+
+
+def test_broadcast_measured_qubits(result_types):
+    index = ResultTypeIndex(result_types, measured_qubits=[3, 5])
+    assert index[Expectation(targets=[5], observable=["y"])] == 0.2
+    assert Expectation(targets=[0], observable=["y"]) not in index
+
+
+def test_matrix_key():
+    numpy = pytest.importorskip("numpy")
+    listed = Variance(targets=[1], observable=[MATRIX])
+    array = Variance(targets=[1], observable=[numpy.array([[0, 1], [1, 0]])])
+    assert result_type_key(listed) == result_type_key(array)
+    assert result_type_key(listed) != result_type_key(
+        Variance(targets=[1], observable=[numpy.eye(2)])
+    )
+
+
+@pytest.mark.xfail(raises=ValueError)
+@pytest.mark.parametrize("result_type", [{"type": "foo"}, {"type": "h", "target": 0}, H(target=0)])
+def test_invalid_result_type(index, result_type):
+    index.get(result_type)